@@ -0,0 +1,47 @@
+# Chan's algorithm in 2D compared with the other 2D methods as the hull size h varies
+
+import time                                     # for computation timing
+
+import numpy as np                              # for random number generation
+
+from convex_hull_algorithms import convex_hull
+from convex_hull_algorithms.interactive import print_banner
+
+
+# Generate n points whose hull is a regular polygon with h vertices (the rest is strictly inside it)
+def polygon_points(num_of_points, hull_size, seed=0):
+    rng = np.random.default_rng(seed)
+    angles = 2 * np.pi * np.arange(hull_size) / hull_size
+    polygon = np.c_[np.cos(angles), np.sin(angles)]
+    # the inner disk of radius cos(pi / h) is inside the polygon
+    radius = np.cos(np.pi / hull_size) * np.sqrt(rng.random(num_of_points - hull_size)) * 0.999
+    theta = 2 * np.pi * rng.random(num_of_points - hull_size)
+    inner = np.c_[radius * np.cos(theta), radius * np.sin(theta)]
+    return rng.permutation(np.vstack((polygon, inner)))
+
+
+# Methods to compare, with their options
+METHODS = [
+    ("chan", {}),
+    ("incremental", {"engine": "numpy"}),
+    ("quickhull", {"engine": "numpy"}),
+    ("wrapping", {}),
+]
+
+
+if __name__ == "__main__":
+    print_banner("Chan's algorithm compared with the other 2D methods as h varies")
+
+    num_of_points = 20000
+    print("method".ljust(14), "n".rjust(8), "h".rjust(6), "seconds".rjust(10))
+    for hull_size in (4, 16, 64, 256, 1024):
+        points = polygon_points(num_of_points, hull_size)
+        for method, options in METHODS:
+            if method == "wrapping" and hull_size > 64:
+                continue                        # O(nh) Python loop, too slow for the larger hulls
+            start_time = time.perf_counter()
+            hull = convex_hull(points, method=method, **options)
+            finish_time = time.perf_counter()
+            assert len(hull) == hull_size
+            print(method.ljust(14), str(num_of_points).rjust(8), str(hull_size).rjust(6),
+                  "{:.4f}".format(finish_time - start_time).rjust(10))
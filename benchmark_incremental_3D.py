@@ -0,0 +1,38 @@
+# Streaming 3D hull: throughput of IncrementalHull3D.add_points as a function of the batch size, compared with
+# rebuilding the hull from scratch (scipy's Qhull, as the 3D script does) after every batch
+
+import time                                     # for computation timing
+
+from convex_hull_algorithms.datasets import generate
+from convex_hull_algorithms.interactive import print_banner
+from convex_hull_algorithms.online import IncrementalHull3D
+from convex_hull_algorithms.quickhull_3d import quickhull_3d
+
+
+if __name__ == "__main__":
+    print_banner("Streaming 3D hull compared with a rebuild after every batch")
+
+    num_of_points = 100000
+    quickhull_3d(generate("gaussian", 100, seed=0, dimensions=3))   # warmup, scipy's import is not timed
+    print("distribution".ljust(14), "batch".rjust(7), "h".rjust(6), "stream pts/s".rjust(13),
+          "rebuild pts/s".rjust(14), "speedup".rjust(8))
+    for distribution in ("gaussian", "uniform_disk"):
+        points = generate(distribution, num_of_points, seed=0, dimensions=3)
+        for batch_size in (100, 1000, 10000, 100000):
+            hull = IncrementalHull3D()
+            start_time = time.perf_counter()
+            for start in range(0, num_of_points, batch_size):
+                hull.add_points(points[start:start + batch_size])
+                hull.snapshot()
+            stream_time = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            for start in range(0, num_of_points, batch_size):
+                rebuilt = quickhull_3d(points[:start + batch_size])
+            rebuild_time = time.perf_counter() - start_time
+
+            assert len(hull) == len(rebuilt.vertices)
+            print(distribution.ljust(14), str(batch_size).rjust(7), str(len(hull)).rjust(6),
+                  "{:.0f}".format(num_of_points / stream_time).rjust(13),
+                  "{:.0f}".format(num_of_points / rebuild_time).rjust(14),
+                  "{:.1f}".format(rebuild_time / stream_time).rjust(8))
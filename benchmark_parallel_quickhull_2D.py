@@ -0,0 +1,46 @@
+# Work-stealing parallel Quick Hull in 2D compared with the single-process NumPy Quick Hull, as the number of
+# worker processes grows, on the same seeded inputs
+
+import os                                       # for the number of cores
+import sys                                      # for the optional largest size
+import time                                     # for computation timing
+
+import numpy as np                              # for math calculations on arrays
+
+from convex_hull_algorithms.datasets import make_points
+from convex_hull_algorithms.interactive import print_banner
+from convex_hull_algorithms.quickhull import parallel_quickhull_indices, quickhull_indices
+
+
+# Inputs to compare: (distribution, sizes); 10**8 points take 1.6 GB, pass it on the command line to include it
+INPUTS = [
+    ("uniform_disk", [10**6, 10**7]),
+    ("gaussian", [10**6, 10**7]),
+    ("circle", [10**4, 10**5]),
+]
+
+
+if __name__ == "__main__":
+    print_banner("Work-stealing parallel Quick Hull compared with the NumPy Quick Hull")
+
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1)))
+    largest = int(float(sys.argv[1])) if len(sys.argv) > 1 else None
+
+    print("distribution".ljust(14), "n".rjust(10), "h".rjust(7), "numpy s".rjust(10),
+          *("{} workers s".format(workers).rjust(14) for workers in worker_counts))
+    for distribution, sizes in INPUTS:
+        if largest is not None and largest > sizes[-1]:
+            sizes = sizes + [largest]
+        for num_of_points in sizes:
+            points = make_points(distribution, num_of_points, seed=0)
+            start_time = time.perf_counter()
+            hull = quickhull_indices(points)
+            timings = [time.perf_counter() - start_time]
+            for workers in worker_counts:
+                start_time = time.perf_counter()
+                parallel_hull = parallel_quickhull_indices(points, workers=workers, min_parallel_size=0)
+                timings.append(time.perf_counter() - start_time)
+                assert np.array_equal(hull, parallel_hull)
+            print(distribution.ljust(14), str(num_of_points).rjust(10), str(len(hull)).rjust(7),
+                  "{:.4f}".format(timings[0]).rjust(10), *("{:.4f}".format(timing).rjust(14) for timing in timings[1:]))
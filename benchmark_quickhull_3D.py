@@ -0,0 +1,41 @@
+# Native Quick Hull in 3D (NumPy, half-edge mesh) compared with scipy's Qhull on the same seeded inputs
+
+import time                                     # for computation timing
+
+import numpy as np                              # for math calculations on arrays
+
+from convex_hull_algorithms.datasets import generate
+from convex_hull_algorithms.interactive import print_banner
+from convex_hull_algorithms.quickhull_3d import quickhull_3d
+
+
+# Inputs to compare: (distribution, sizes); on the sphere every point is a hull vertex
+INPUTS = [
+    ("uniform_disk", (10**3, 10**4, 10**5, 10**6)),
+    ("gaussian", (10**3, 10**4, 10**5, 10**6)),
+    ("circle", (10**3, 10**4)),
+]
+
+
+if __name__ == "__main__":
+    print_banner("Native 3D Quick Hull compared with scipy's Qhull")
+
+    # warmup, scipy's import is not part of the timings
+    for engine in ("numpy", "scipy"):
+        quickhull_3d(generate("gaussian", 100, seed=0, dimensions=3), engine=engine)
+
+    print("distribution".ljust(14), "n".rjust(9), "h".rjust(7), "numpy s".rjust(10), "qhull s".rjust(10),
+          "ratio".rjust(7))
+    for distribution, sizes in INPUTS:
+        for num_of_points in sizes:
+            points = generate(distribution, num_of_points, seed=0, dimensions=3)
+            timings = {}
+            hulls = {}
+            for engine in ("numpy", "scipy"):
+                start_time = time.perf_counter()
+                hulls[engine] = quickhull_3d(points, engine=engine)
+                timings[engine] = time.perf_counter() - start_time
+            assert np.isclose(hulls["numpy"].volume, hulls["scipy"].volume)
+            print(distribution.ljust(14), str(num_of_points).rjust(9), str(len(hulls["numpy"].vertices)).rjust(7),
+                  "{:.4f}".format(timings["numpy"]).rjust(10), "{:.4f}".format(timings["scipy"]).rjust(10),
+                  "{:.1f}".format(timings["numpy"] / timings["scipy"]).rjust(7))
@@ -0,0 +1,37 @@
+# Sliding window hull: per-update latency of DynamicHull2D compared with a full rebuild of the window
+
+import time                                     # for computation timing
+
+import numpy as np                              # for random number generation
+
+from convex_hull_algorithms import SlidingWindowHull, convex_hull
+from convex_hull_algorithms.interactive import print_banner
+
+
+if __name__ == "__main__":
+    print_banner("Sliding window hull: dynamic updates vs full rebuild")
+
+    rng = np.random.default_rng(0)
+    num_of_updates = 20000
+    print("window".rjust(8), "update (us)".rjust(12), "rebuild (us)".rjust(13), "speedup".rjust(9))
+    for window_size in (1000, 10000, 100000):
+        stream = rng.normal(size=(window_size + num_of_updates, 2)).tolist()
+        window = SlidingWindowHull(size=window_size)
+        for point in stream[:window_size]:
+            window.push(point, 0.0)
+
+        # every update: one point in, the oldest point out, and the current hull vertices
+        start_time = time.perf_counter()
+        for point in stream[window_size:]:
+            window.push(point, 0.0)
+            window.vertices
+        update_time = (time.perf_counter() - start_time) / num_of_updates
+
+        # one full rebuild of the same window with the fastest exact method
+        points = np.array(stream[-window_size:])
+        start_time = time.perf_counter()
+        hull = convex_hull(points, method="quickhull", engine="numpy")
+        rebuild_time = time.perf_counter() - start_time
+
+        print(str(window_size).rjust(8), "{:.1f}".format(update_time * 1e6).rjust(12),
+              "{:.1f}".format(rebuild_time * 1e6).rjust(13), "{:.1f}x".format(rebuild_time / update_time).rjust(9))
@@ -0,0 +1,25 @@
+# Convex hull algorithms (Incremental, Wrapping, Divide and Conquer, Quickhull, Chan in 2D and Quickhull in 3D).
+#
+# Importing the package only loads the compute functions and numpy. Plotting ('plotting') and the terminal
+# prompts of the scripts ('interactive') live in submodules that must be imported explicitly, and scipy is
+# loaded by 'quickhull_3d' on its first call.
+
+from .api import ALIASES, METHODS, convex_hull
+from .approximate import KernelHull, approximate_hull
+from .batch import batch_hulls
+from .cache import CacheStats, HullCache
+from .chan import chan
+from .divide_and_conquer import devide_and_conquer, merge_divide_and_conquer
+from .dynamic import DynamicHull2D, SlidingWindowHull
+from .geometry import lexicographic_sort, order_hull, orientation
+from .incremental import graham_scan, graham_scan_trace
+from .instrument import Instrumentation, instrument
+from .measures import batch_measures, hull_measures
+from .online import IncrementalHull2D, IncrementalHull3D
+from .prefilter import akl_toussaint
+from .quickhull import QuickHull, parallel_quickhull_indices, quickhull, quickhull_indices
+from .query import HullIndex2D, HullIndex3D
+from .quickhull_3d import QuickHull3D, quickhull_3d
+from .streaming import chunked_hull, read_chunks
+from .trace import Trace, TraceRecorder
+from .wrapping import jarvis_march
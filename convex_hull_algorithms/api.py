@@ -0,0 +1,131 @@
+# Common entry point for all the convex hull algorithms of the package
+
+import numpy as np                              # for math calculations on arrays
+
+from .approximate import KernelHull
+from .chan import chan
+from .divide_and_conquer import devide_and_conquer, merge_divide_and_conquer
+from .geometry import lexicographic_sort, order_hull
+from .incremental import graham_scan
+from .instrument import phase
+from .prefilter import akl_toussaint
+from .quickhull import parallel_quickhull_indices, quickhull, quickhull_indices
+from .quickhull_3d import quickhull_3d
+from .wrapping import jarvis_march
+
+
+# Wrappers that adapt each algorithm to a (n, 2) array input and a (h, 2) array output
+def _wrapping(points, **options):
+    with phase("sort"):
+        points = lexicographic_sort(points)
+    with phase("hull"):
+        return jarvis_march(points, **options)
+
+
+def _incremental(points, **options):
+    with phase("sort"):
+        sorted_points = lexicographic_sort(points)
+    with phase("hull"):
+        hull = np.asarray(graham_scan(sorted_points, **options))
+    if len(hull) == 0:
+        # less than 3 distinct points, each of them is a vertex
+        with phase("post-processing"):
+            return order_hull(points)
+    return hull
+
+
+def _divide_and_conquer(points, engine="python", **options):
+    if engine == "merge":
+        with phase("hull"):
+            return merge_divide_and_conquer(points, **options)
+    elif engine != "python":
+        raise ValueError("Unknown divide_and_conquer engine: " + str(engine))
+    # the algorithm keeps the hull in a set, so it needs hashable points
+    with phase("hull"):
+        hull = devide_and_conquer([tuple(point) for point in points.tolist()], **options)
+    with phase("post-processing"):
+        return order_hull(hull)
+
+
+def _quickhull(points, engine="python", **options):
+    if engine == "numpy":
+        with phase("hull"):
+            return points[quickhull_indices(points)]
+    if engine == "parallel":
+        with phase("hull"):
+            return points[parallel_quickhull_indices(points, **options)]
+    # 'quickhull' returns a closed ring, the first point is repeated at the end
+    with phase("hull"):
+        hull = quickhull([tuple(point) for point in points.tolist()], engine=engine)
+    with phase("post-processing"):
+        return np.array(hull[:-1], dtype=points.dtype)
+
+
+def _approximate(points, **options):
+    with phase("hull"):
+        return KernelHull(**options).update(points).vertices
+
+
+def _chan(points, **options):
+    with phase("hull"):
+        return chan(points, **options)
+
+
+# Available methods of 'convex_hull', together with the names of the original scripts' algorithms
+METHODS = {
+    "wrapping": _wrapping,
+    "incremental": _incremental,
+    "divide_and_conquer": _divide_and_conquer,
+    "quickhull": _quickhull,
+    "chan": _chan,
+    "approximate": _approximate,
+    "quickhull_3d": lambda points, **options: quickhull_3d(points, **options),
+}
+ALIASES = {
+    "jarvis": "wrapping",
+    "graham": "incremental",
+}
+
+
+# Function to compute the convex hull of a set of points with any of the package's algorithms
+def convex_hull(points, method="incremental", prefilter=False, stats=None, cache=None, **options):
+    """
+    Args:
+        points: (n, 2) array-like of points, (n, 3) for "quickhull_3d"
+        method: one of METHODS ("jarvis" and "graham" are accepted as aliases)
+        prefilter: run the Akl-Toussaint elimination first (True for 8 directions, or the number of directions)
+        stats: optional dict, filled with the number of points the prefilter removed ("prefilter_removed")
+               (counters and per-phase timers are collected by instrument.instrument())
+        cache: optional cache.HullCache: the hull is looked up there first and stored there when computed
+               (the cached arrays are read-only and shared, copy them before modifying them)
+        options: keyword arguments passed to the algorithm (e.g. engine="numpy" for graham_scan,
+                 directions=256 or refine=True for the "approximate" epsilon-kernel hull)
+    Returns:
+        (h, 2) array of the hull vertices, starting at the leftmost point, in the order graham_scan
+        returns them. "quickhull_3d" returns the scipy ConvexHull object
+    """
+    method = ALIASES.get(method, method)
+    if method not in METHODS:
+        raise ValueError("Unknown convex hull method: " + str(method))
+
+    if cache is not None:
+        return cache.hull(points, method=method, prefilter=prefilter, stats=stats, **options)
+
+    points = np.asarray(points)
+    if method == "quickhull_3d":
+        if prefilter:
+            raise ValueError("The Akl-Toussaint prefilter is only available for the 2D methods")
+        return METHODS[method](points, **options)
+
+    if prefilter:
+        directions = 8 if prefilter is True else int(prefilter)
+        with phase("prefilter"):
+            kept, removed = akl_toussaint(points, directions)
+            points = points[kept]
+        if stats is not None:
+            stats["prefilter_removed"] = removed
+
+    if len(points) < 3:
+        # nothing to compute, every point is a hull vertex
+        return order_hull(points.reshape(-1, 2))
+    return METHODS[method](points, **options)
@@ -0,0 +1,161 @@
+# Approximate convex hull of huge point sets and streams: an epsilon-kernel made of the extreme points along k
+# fixed directions, updated chunk by chunk with vectorized dot products in O(k) memory
+#
+# Error guarantee: the approximate hull is inside the exact one (its vertices are input points), and every point of
+# the exact hull is within (D / 2) * tan(pi / k) of it, D being the diameter of the points. Between the extreme
+# points e and f of two consecutive directions (pi * 2 / k apart), the exact hull can only stick out of the segment
+# e f inside the triangle closed by the two supporting lines, whose apex angle is pi - 2 pi / k: its height is at
+# most (|e f| / 2) * tan(pi / k) <= (D / 2) * tan(pi / k), about D * pi / (2 k). 64 directions give 2.5% of D,
+# 1024 directions 0.15%; 'directions_for(epsilon)' gives the k of a relative error epsilon
+
+import os                                       # for the paths of the point files
+
+import numpy as np                              # for math calculations on arrays
+
+from .measures import diameter
+from .online import IncrementalHull2D
+from .prefilter import unit_directions
+from .query import INSIDE, HullIndex2D
+from .streaming import read_chunks
+
+# Largest number of point-direction dot products computed in one array
+MAX_BLOCK = 1 << 22
+
+
+# Function to get the number of directions whose approximate hull is within epsilon * D of the exact hull
+def directions_for(epsilon):
+    if not 0 < epsilon < 0.5:
+        raise ValueError("The relative error must be between 0 and 0.5, got " + str(epsilon))
+    return max(3, int(np.ceil(np.pi / np.arctan(2 * epsilon))))
+
+
+class KernelHull:
+    """
+    Approximate convex hull of a 2D point stream: the extreme point along each of k equally spaced directions
+    (an epsilon-kernel, see the error guarantee at the top of the module). Each batch costs one (m, k) block of dot
+    products, and the state is k points, whatever the number of points seen.
+
+    With refine=True, the points of every batch that are not strictly inside the current kernel polygon are kept
+    as candidates (pruned again whenever the polygon grows) and 'vertices' is the exact hull, computed on the
+    kernel points and the candidates only. The memory is then the band between the kernel and the exact hull.
+
+    Example:
+        hull = KernelHull(directions=256)
+        for chunk in read_chunks("points.npy"):
+            hull.update(chunk)
+        hull.vertices, hull.error_bound()
+    """
+
+    def __init__(self, directions=64, refine=False):
+        if directions < 3:
+            raise ValueError("The kernel needs at least 3 directions, got " + str(directions))
+        self.directions = unit_directions(directions)
+        self.refine = refine
+        self.support = np.full(directions, -np.inf)     # largest dot product along each direction
+        self.extremes = np.zeros((directions, 2))       # point of that dot product
+        self.candidates = np.empty((0, 2))
+        self.num_of_points = 0
+        self._vertices = None
+
+    # Function to add a batch of points ((m, 2) array-like, extra columns are ignored)
+    def update(self, points):
+        points = np.asarray(points, dtype=np.float64)
+        if len(points) == 0:
+            return self
+        points = points[:, :2]
+        block = max(1, MAX_BLOCK // len(self.directions))
+        changed = False
+        for start in range(0, len(points), block):
+            part = points[start:start + block]
+            products = self.directions @ part.T     # (k, m): each direction's products are contiguous
+            best = np.argmax(products, axis=1)
+            value = products[np.arange(len(self.directions)), best]
+            better = value > self.support
+            if better.any():
+                self.support[better] = value[better]
+                self.extremes[better] = part[best[better]]
+                changed = True
+
+        if self.refine:
+            # the kernel only grows, so a point strictly inside it now is never a vertex of the exact hull
+            outside = ~self._inside(points)
+            if changed:
+                self.candidates = self.candidates[~self._inside(self.candidates)]
+            self.candidates = np.concatenate((self.candidates, points[outside]))
+        self.num_of_points += len(points)
+        if changed or self.refine:
+            self._vertices = None
+        return self
+
+    # Function to find the kernel points in counterclockwise order, without consecutive repetitions
+    def _polygon(self):
+        if self.num_of_points == 0:
+            return np.empty((0, 2))
+        polygon = self.extremes
+        different = np.any(polygon != np.roll(polygon, 1, axis=0), axis=1)
+        if not different.any():
+            return polygon[:1]
+        return polygon[different]
+
+    # Function to check which points are strictly inside the kernel polygon (O(log k) orientations per point)
+    def _inside(self, points):
+        polygon = self._polygon()
+        if len(polygon) < 3 or len(points) == 0:
+            return np.zeros(len(points), dtype=bool)
+        return HullIndex2D(polygon).classify_many(points) == INSIDE
+
+    # Vertices of the hull as a (h, 2) array, starting at the leftmost point, in the order graham_scan returns them:
+    # the hull of the kernel points, or with refine=True the exact hull of all the points
+    @property
+    def vertices(self):
+        if self._vertices is None:
+            hull = IncrementalHull2D()
+            hull.insert_many(self._polygon())
+            if self.refine:
+                hull.insert_many(self.candidates)
+            self._vertices = hull.vertices
+        return self._vertices
+
+    # Function to bound the distance from any point of the exact hull to 'vertices' (0 with refine=True). The
+    # diameter D of the points is at most the diameter d of the kernel plus twice the error, so the error
+    # (D / 2) * tan(pi / k) is at most (d / 2) * t / (1 - t) with t = tan(pi / k)
+    def error_bound(self):
+        if self.refine or self.num_of_points == 0:
+            return 0.0
+        kernel_diameter = diameter(self._polygon())
+        t = np.tan(np.pi / len(self.directions))
+        if t >= 1:
+            return np.inf       # less than 5 directions, the diameter cannot be bounded from the kernel
+        return kernel_diameter / 2 * t / (1 - t)
+
+    def __len__(self):
+        return len(self.vertices)
+
+
+# Function to compute the approximate hull of a point file, or of any iterable of point chunks, one chunk at a time
+def approximate_hull(source, directions=64, refine=False, chunk_size=1 << 20, stats=None, **options):
+    """
+    Args:
+        source: path of a point file (see read_chunks) or iterable of (m, 2) arrays
+        directions: number of directions of the kernel (see directions_for)
+        refine: compute the exact hull of the points left outside of the kernel (see KernelHull)
+        stats: optional dict, filled with the number of "points" and "chunks" read and the "error_bound"
+        options: keyword arguments of read_chunks (format, dtype, columns, delimiter, skip_header)
+    Returns:
+        (h, 2) array of the hull vertices, starting at the leftmost point, in the order graham_scan returns them
+    """
+    if isinstance(source, (str, bytes, os.PathLike)):
+        chunks = read_chunks(source, chunk_size, **options)
+    else:
+        chunks = source
+
+    hull = KernelHull(directions, refine)
+    num_of_chunks = 0
+    for chunk in chunks:
+        hull.update(chunk)
+        num_of_chunks += 1
+    if stats is not None:
+        stats["points"] = hull.num_of_points
+        stats["chunks"] = num_of_chunks
+        stats["error_bound"] = hull.error_bound()
+    return hull.vertices
@@ -0,0 +1,196 @@
+# Batched convex hulls: the hulls of many small point sets (groups) computed in one vectorized call
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor  # for the optional split across groups
+
+import numpy as np                              # for math calculations on arrays
+
+from .incremental import convex_chain_numpy
+from .predicates import orient2d_array
+
+
+# Function to find the first index of every run of equal values in an array
+def segment_starts(values):
+    starts = np.ones(len(values), dtype=bool)
+    starts[1:] = values[1:] != values[:-1]
+    return np.flatnonzero(starts)
+
+
+# Function to build the chains of all the groups at once. 'chain' is an index array where the groups are
+# contiguous and every group is in its scan order. Each pass pops, in every group at once, the middle points
+# of the consecutive triples that do not turn the right way (like 'convex_chain_numpy'), never across groups.
+# A group where a pass pops nothing is convex: it is moved out of the working arrays, so the next passes only
+# scan the groups that are still changing. When the passes stop paying off, those are finished one by one
+def segmented_chains(x, y, group, chain):
+
+    # the coordinates and groups are gathered once and compacted along with the chain; 'position' (the place
+    # of every point in the input chain) puts the groups back in their order at the end
+    cx, cy, cg, position = x[chain], y[chain], group[chain], np.arange(len(chain))
+    popped = np.zeros(int(cg.max()) + 1 if len(cg) else 0, dtype=bool)
+    done_chains, done_positions = [], []
+    while len(chain) > 2:
+        pop = (cg[:-2] == cg[1:-1]) & (cg[1:-1] == cg[2:])
+        pop &= orient2d_array(cx[:-2], cy[:-2], cx[1:-1], cy[1:-1], cx[2:], cy[2:]) > 0
+        removed = np.count_nonzero(pop)
+        if removed == 0:
+            break
+        keep = np.ones(len(chain), dtype=bool)
+        keep[1:-1] = ~pop
+        popped_groups = cg[1:-1][pop]
+        popped[popped_groups] = True
+        active = popped[cg]
+        popped[popped_groups] = False
+
+        done = keep & ~active
+        done_chains.append(chain[done])
+        done_positions.append(position[done])
+        keep &= active
+        chain, position, cx, cy, cg = chain[keep], position[keep], cx[keep], cy[keep], cg[keep]
+        if removed * 64 < len(chain):
+            break
+
+    # groups that still have a triple to pop are rebuilt one by one, the others are kept as they are
+    if len(chain) > 2:
+        pop = (cg[:-2] == cg[1:-1]) & (cg[1:-1] == cg[2:])
+        pop &= orient2d_array(cx[:-2], cy[:-2], cx[1:-1], cy[1:-1], cx[2:], cy[2:]) > 0
+        if pop.any():
+            starts = segment_starts(cg)
+            ends = np.append(starts[1:], len(chain))
+            active = np.isin(cg[starts], cg[1:-1][pop])
+            for k in np.flatnonzero(active):
+                piece = convex_chain_numpy(x, y, chain[starts[k]:ends[k]])
+                done_chains.append(piece)
+                done_positions.append(position[starts[k]:starts[k] + len(piece)])   # still the group's range
+            finished = ~np.repeat(active, ends - starts)
+            chain, position = chain[finished], position[finished]
+
+    # put the groups back in order, every group keeps the order of its points
+    chain = np.concatenate(done_chains + [chain])
+    return chain[np.argsort(np.concatenate(done_positions + [position]))]
+
+
+# Function to sort the points by group, then lexicographically. np.lexsort would run three stable sorts over
+# all the points: the x-coordinates get one quicksort, the y-coordinates only take part when some x-coordinates
+# are repeated, and the integer groups come last with a stable (radix) sort that keeps the order within groups
+def segmented_order(x, y, group):
+    order = np.argsort(x)
+    xs = x[order]
+    if (xs[1:] == xs[:-1]).any():
+        order = np.lexsort((y, x))
+    return order[np.argsort(group[order], kind="stable")]
+
+
+# Function to compute the hulls of all groups of the points (x, y). 'group' holds the group number of every
+# point, numbered 0..num_of_groups-1. Returns the hull point indices of all groups, one group after the
+# other, and the number of hull points of each group
+def batch_hull_arrays(x, y, group, num_of_groups):
+
+    # Segmented sort: by group, then lexicographically, and drop the repeated points of each group
+    order = segmented_order(x, y, group)
+    xs, ys, gs = x[order], y[order], group[order]
+    repeated = np.zeros(len(order), dtype=bool)
+    repeated[1:] = (gs[1:] == gs[:-1]) & (xs[1:] == xs[:-1]) & (ys[1:] == ys[:-1])
+    order, xs, gs = order[~repeated], xs[~repeated], gs[~repeated]
+
+    # Chain candidates, as in 'chain_candidates': the top (bottom) point of every column for the upper (lower)
+    # chain, and the whole first (last) column of every group
+    starts = segment_starts(gs)
+    counts = np.diff(np.append(starts, len(gs)))
+    first_x = np.repeat(xs[starts], counts)
+    last_x = np.repeat(xs[np.append(starts[1:], len(gs)) - 1], counts)
+    top = np.ones(len(xs), dtype=bool)
+    top[:-1] = (xs[:-1] != xs[1:]) | (gs[:-1] != gs[1:])
+    bottom = np.ones(len(xs), dtype=bool)
+    bottom[1:] = (xs[1:] != xs[:-1]) | (gs[1:] != gs[:-1])
+
+    upper = segmented_chains(x, y, group, order[top | (xs == first_x)])
+    lower = segmented_chains(x, y, group, order[bottom | (xs == last_x)][::-1])
+
+    # Every hull is its upper chain without its last point followed by its lower chain (scanned backwards)
+    # without its last point, like graham_scan. A group with a single point keeps it
+    upper_group, lower_group = group[upper], group[lower]
+    upper_last = np.ones(len(upper), dtype=bool)
+    upper_last[:-1] = upper_group[:-1] != upper_group[1:]
+    upper_first = np.ones(len(upper), dtype=bool)
+    upper_first[1:] = upper_group[1:] != upper_group[:-1]
+    lower_last = np.ones(len(lower), dtype=bool)
+    lower_last[:-1] = lower_group[:-1] != lower_group[1:]
+    keep_upper = ~upper_last | upper_first
+    keep_lower = ~lower_last
+
+    # a group whose two chains both hold all its points is collinear: its hull is the two extremes, the first
+    # and the last point of its upper chain
+    num_of_points = np.bincount(gs, minlength=num_of_groups)
+    collinear = (num_of_points > 2) & (np.bincount(upper_group, minlength=num_of_groups) == num_of_points)
+    collinear &= np.bincount(lower_group, minlength=num_of_groups) == num_of_points
+    if collinear.any():
+        keep_upper = np.where(collinear[upper_group], upper_first | upper_last, keep_upper)
+        keep_lower &= ~collinear[lower_group]
+
+    hull = np.concatenate((upper[keep_upper], lower[keep_lower]))
+    hull_group = np.concatenate((upper_group[keep_upper], lower_group[keep_lower]))
+    part = np.repeat([0, 1], [np.count_nonzero(keep_upper), np.count_nonzero(keep_lower)])
+    position = np.arange(len(hull))
+    hull = hull[np.lexsort((position, part, hull_group))]
+    return hull, np.bincount(hull_group, minlength=num_of_groups)
+
+
+# Function that a pool worker runs for a contiguous range of groups
+def _batch_hull_range(x, y, group, first_group, num_of_groups):
+    hull, counts = batch_hull_arrays(x, y, group - first_group, num_of_groups)
+    return hull, counts
+
+
+# Function to compute the convex hulls of many point sets in one vectorized call
+def batch_hulls(points, offsets=None, group_ids=None, workers=None, executor="thread"):
+    """
+    Args:
+        points: (N, 2) array of the points of all groups
+        offsets: group g is points[offsets[g]:offsets[g + 1]] (len(offsets) = number of groups + 1)
+        group_ids: instead of offsets, the group id of every point (the groups are numbered in the
+                   order of np.unique(group_ids))
+        workers: split the groups into contiguous ranges computed by this many "thread" or "process" workers
+    Returns:
+        (hull_indices, hull_offsets): the hull of group g is points[hull_indices[hull_offsets[g]:hull_offsets[g + 1]]],
+        in the order graham_scan returns the vertices
+    """
+    points = np.asarray(points)
+    x = np.ascontiguousarray(points[:, 0], dtype=np.float64)
+    y = np.ascontiguousarray(points[:, 1], dtype=np.float64)
+    if (offsets is None) == (group_ids is None):
+        raise ValueError("batch_hulls needs either 'offsets' or 'group_ids'")
+    if offsets is not None:
+        offsets = np.asarray(offsets)
+        num_of_groups = len(offsets) - 1
+        group = np.repeat(np.arange(num_of_groups), np.diff(offsets))
+        permutation = None
+    else:
+        _, group = np.unique(group_ids, return_inverse=True)
+        group = group.reshape(-1)
+        num_of_groups = group.max() + 1 if len(group) else 0
+        # make the groups contiguous, so that they can be split into ranges
+        permutation = np.argsort(group, kind="stable")
+        x, y, group = x[permutation], y[permutation], group[permutation]
+        offsets = np.searchsorted(group, np.arange(num_of_groups + 1))
+
+    if not workers or workers == 1 or num_of_groups < 2:
+        hull, counts = batch_hull_arrays(x, y, group, num_of_groups)
+    else:
+        # contiguous ranges of groups with about the same number of points
+        tasks = min(4 * workers, num_of_groups)
+        bounds = np.unique(np.searchsorted(offsets, np.linspace(0, offsets[-1], tasks + 1)))
+        bounds[0], bounds[-1] = 0, num_of_groups
+        Pool = ThreadPoolExecutor if executor == "thread" else ProcessPoolExecutor
+        with Pool(max_workers=workers) as pool:
+            futures = [pool.submit(_batch_hull_range, x[offsets[g0]:offsets[g1]], y[offsets[g0]:offsets[g1]],
+                                   group[offsets[g0]:offsets[g1]], g0, g1 - g0)
+                       for g0, g1 in zip(bounds[:-1], bounds[1:]) if g1 > g0]
+            results = [future.result() for future in futures]
+        starts = [offsets[g0] for g0, g1 in zip(bounds[:-1], bounds[1:]) if g1 > g0]
+        hull = np.concatenate([part + start for (part, _), start in zip(results, starts)])
+        counts = np.concatenate([part_counts for _, part_counts in results])
+
+    if permutation is not None:
+        hull = permutation[hull]
+    hull_offsets = np.zeros(num_of_groups + 1, dtype=np.intp)
+    np.cumsum(counts, out=hull_offsets[1:])
+    return hull, hull_offsets
@@ -0,0 +1,249 @@
+# Reproducible benchmark suite of the convex hull methods: seeded datasets, warmup and repeated timings with
+# time.perf_counter, peak memory with tracemalloc, results written as JSON or CSV and compared between two runs.
+#
+#   python -m convex_hull_algorithms.benchmark run --output new.json
+#   python -m convex_hull_algorithms.benchmark compare old.json new.json
+
+import argparse                                 # for the command line interface
+import csv                                      # for the CSV output
+import json                                     # for the JSON output
+import platform                                 # for the machine description of a run
+import statistics                               # for the median of the timings
+import sys                                      # for the exit status of the comparison
+import time                                     # for computation timing
+import tracemalloc                              # for the peak memory of a run
+
+import numpy as np                              # for the version of the run
+
+from .api import convex_hull
+from .datasets import DISTRIBUTIONS, make_points
+
+
+# Benchmarked cases: (name, convex_hull method, options, largest size, dimensions). The pure Python methods stop
+# at the sizes where one run still takes a few seconds
+CASES = [
+    ("wrapping", "wrapping", {}, 10**4, 2),
+    ("wrapping_numpy", "wrapping", {"engine": "numpy"}, 10**6, 2),
+    ("incremental", "incremental", {}, 10**5, 2),
+    ("incremental_numpy", "incremental", {"engine": "numpy"}, 10**7, 2),
+    ("divide_and_conquer", "divide_and_conquer", {}, 10**4, 2),
+    ("divide_and_conquer_merge", "divide_and_conquer", {"engine": "merge"}, 10**7, 2),
+    ("quickhull", "quickhull", {}, 10**5, 2),
+    ("quickhull_numpy", "quickhull", {"engine": "numpy"}, 10**7, 2),
+    ("quickhull_parallel", "quickhull", {"engine": "parallel"}, 10**7, 2),
+    ("chan", "chan", {}, 10**6, 2),
+    ("approximate_64", "approximate", {"directions": 64}, 10**7, 2),
+    ("quickhull_3d", "quickhull_3d", {}, 10**7, 3),
+    ("quickhull_3d_numpy", "quickhull_3d", {"engine": "numpy"}, 10**6, 3),
+]
+# Lower limits on "circle", where every point is a hull vertex and the output-sensitive methods reach their worst case
+CIRCLE_MAX_SIZES = {
+    "wrapping": 10**3,
+    "wrapping_numpy": 10**4,
+    "quickhull": 10**4,
+    "quickhull_numpy": 10**5,
+    "quickhull_parallel": 10**5,
+    "chan": 10**4,
+    "quickhull_3d": 10**6,
+    "quickhull_3d_numpy": 10**4,
+}
+SIZES = [10**2, 10**3, 10**4, 10**5, 10**6, 10**7]
+
+
+# Function to count the hull vertices of a convex_hull result
+def hull_size(hull):
+    if hasattr(hull, "vertices"):
+        return len(hull.vertices)
+    return len(hull)
+
+
+# Function to time one case on one dataset
+def measure(points, method, options, repeats=5, warmup=1, memory=True):
+    """
+    Args:
+        points: (n, d) array of points
+        method, options: arguments of convex_hull
+        repeats: number of timed runs
+        warmup: number of untimed runs before them
+        memory: run once more under tracemalloc for the peak memory (kept out of the timed runs)
+    Returns:
+        dict with the timings in seconds ("times", "best", "median", "mean"), "peak_bytes" and "hull_size"
+    """
+    for _ in range(warmup):
+        convex_hull(points, method=method, **options)
+    times = []
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        hull = convex_hull(points, method=method, **options)
+        times.append(time.perf_counter() - start_time)
+
+    peak = None
+    if memory:
+        tracemalloc.start()
+        try:
+            convex_hull(points, method=method, **options)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return {
+        "times": times,
+        "best": min(times),
+        "median": statistics.median(times),
+        "mean": sum(times) / len(times),
+        "peak_bytes": peak,
+        "hull_size": hull_size(hull),
+    }
+
+
+# Function to run the suite
+def run(cases=None, distributions=None, sizes=None, seed=0, repeats=5, warmup=1, memory=True, log=None, cache=None):
+    """
+    Args:
+        cases: names of CASES to run (all of them by default)
+        distributions: names of datasets.DISTRIBUTIONS (all of them by default)
+        sizes: numbers of points (SIZES by default); each case skips the sizes above its own limit
+        seed: seed of the datasets, the same seed gives the same points
+        repeats, warmup, memory: see 'measure'
+        log: optional callable that receives each result as it is measured
+        cache: directory of the datasets' .npy cache (see datasets.make_points), None to always generate them
+    Returns:
+        dict with the run's "environment" and the list of "results"
+    """
+    selected = [case for case in CASES if cases is None or case[0] in cases]
+    if cases is not None:
+        unknown = set(cases) - {case[0] for case in CASES}
+        if unknown:
+            raise ValueError("Unknown benchmark case: " + ", ".join(sorted(unknown)))
+    distributions = list(DISTRIBUTIONS) if distributions is None else distributions
+    sizes = SIZES if sizes is None else sizes
+
+    results = []
+    for distribution in distributions:
+        for num_of_points in sizes:
+            datasets = {}                       # the 2D and 3D points of this distribution and size
+            for name, method, options, max_size, dimensions in selected:
+                if distribution == "circle":
+                    max_size = min(max_size, CIRCLE_MAX_SIZES.get(name, max_size))
+                if num_of_points > max_size:
+                    continue
+                if dimensions not in datasets:
+                    datasets[dimensions] = make_points(distribution, num_of_points, seed, dimensions, cache=cache)
+                result = {"case": name, "distribution": distribution, "n": num_of_points, "seed": seed}
+                result.update(measure(datasets[dimensions], method, options, repeats, warmup, memory))
+                results.append(result)
+                if log is not None:
+                    log(result)
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "repeats": repeats,
+            "warmup": warmup,
+        },
+        "results": results,
+    }
+
+
+# Function to write a run as JSON, or as CSV (one row per result, without the single timings) for a .csv path
+def save(report, path):
+    if str(path).endswith(".csv"):
+        fields = ["case", "distribution", "n", "seed", "best", "median", "mean", "peak_bytes", "hull_size"]
+        with open(path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=fields, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(report["results"])
+    else:
+        with open(path, "w") as file:
+            json.dump(report, file, indent=2)
+
+
+# Function to read a run written by 'save' as JSON
+def load(path):
+    with open(path) as file:
+        return json.load(file)
+
+
+# Function to compare the median timings of two runs
+def compare(old, new, threshold=0.1):
+    """
+    Args:
+        old, new: runs returned by 'run' or 'load'
+        threshold: relative change of the median above which a result counts as a regression or an improvement
+    Returns:
+        list of (case, distribution, n, old median, new median, ratio new/old, status) for the results of both runs
+    """
+    old_results = {(r["case"], r["distribution"], r["n"]): r for r in old["results"]}
+    rows = []
+    for result in new["results"]:
+        key = (result["case"], result["distribution"], result["n"])
+        if key not in old_results:
+            continue
+        old_median = old_results[key]["median"]
+        ratio = result["median"] / old_median if old_median > 0 else float("inf")
+        if ratio > 1 + threshold:
+            status = "slower"
+        elif ratio < 1 / (1 + threshold):
+            status = "faster"
+        else:
+            status = "same"
+        rows.append(key + (old_median, result["median"], ratio, status))
+    return rows
+
+
+# Function to print one result of a run
+def print_result(result):
+    peak = "-" if result["peak_bytes"] is None else "{:.1f}".format(result["peak_bytes"] / 2**20)
+    print(result["case"].ljust(26), result["distribution"].ljust(15), str(result["n"]).rjust(9),
+          "{:.5f}".format(result["median"]).rjust(10), peak.rjust(9), str(result["hull_size"]).rjust(8))
+
+
+# Command line interface
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m convex_hull_algorithms.benchmark",
+                                     description="Benchmark the convex hull methods and compare runs.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--cases", nargs="+", choices=[case[0] for case in CASES])
+    run_parser.add_argument("--distributions", nargs="+", choices=list(DISTRIBUTIONS))
+    run_parser.add_argument("--sizes", nargs="+", type=int)
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--repeats", type=int, default=5)
+    run_parser.add_argument("--warmup", type=int, default=1)
+    run_parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    run_parser.add_argument("--cache", help="directory of the .npy cache of the datasets")
+    run_parser.add_argument("--output", nargs="+", default=[], help="JSON and/or .csv files to write")
+
+    compare_parser = commands.add_parser("compare", help="compare two JSON runs")
+    compare_parser.add_argument("old")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+    compare_parser.add_argument("--fail-on-regression", action="store_true",
+                                help="exit with status 1 if any result is slower")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        print("case".ljust(26), "distribution".ljust(15), "n".rjust(9), "median s".rjust(10), "peak MiB".rjust(9),
+              "h".rjust(8))
+        report = run(args.cases, args.distributions, args.sizes, args.seed, args.repeats, args.warmup,
+                     not args.no_memory, log=print_result, cache=args.cache)
+        for path in args.output:
+            save(report, path)
+        return 0
+
+    rows = compare(load(args.old), load(args.new), args.threshold)
+    print("case".ljust(26), "distribution".ljust(15), "n".rjust(9), "old s".rjust(10), "new s".rjust(10),
+          "new/old".rjust(8), "")
+    for case, distribution, num_of_points, old_median, new_median, ratio, status in rows:
+        print(case.ljust(26), distribution.ljust(15), str(num_of_points).rjust(9), "{:.5f}".format(old_median).rjust(10),
+              "{:.5f}".format(new_median).rjust(10), "{:.2f}".format(ratio).rjust(8), status)
+    if args.fail_on_regression and any(row[-1] == "slower" for row in rows):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
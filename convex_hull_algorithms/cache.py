@@ -0,0 +1,206 @@
+# Memoization of hull results: a content-addressed cache keyed by a hash of the input buffer (dtype, shape and
+# bytes) and the method with its options, with an in-memory LRU tier under a byte budget and an optional .npy disk
+# tier with size-based eviction. Hits return the cached arrays themselves, read-only, without copying them
+
+import hashlib                                  # for the content keys
+import json                                     # for the keys of the methods' options
+import os                                       # for the cache files
+import threading                                # for the lock of the shared cache
+from collections import OrderedDict             # for the LRU order of the memory tier
+from dataclasses import dataclass, fields       # for the statistics
+
+import numpy as np                              # for math calculations on arrays
+
+from .api import ALIASES, convex_hull
+
+# Attributes whose arrays count in the size of a non-array result (scipy's ConvexHull, QuickHull3D)
+RESULT_ARRAYS = ("points", "vertices", "simplices", "equations", "neighbors")
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters of a HullCache.
+
+    hits: results found in memory
+    disk_hits: results found on disk (and moved to memory)
+    misses: results computed
+    evictions: results dropped from memory to stay under max_bytes
+    disk_evictions: files deleted to stay under max_disk_bytes
+    """
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    disk_evictions: int = 0
+
+    # Fraction of the lookups answered from the cache (memory or disk)
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.disk_hits + self.misses
+        return (self.hits + self.disk_hits) / lookups if lookups else 0.0
+
+    # Function to get the counters as a plain dict (e.g. for JSON)
+    def as_dict(self):
+        counters = {field.name: getattr(self, field.name) for field in fields(self)}
+        counters["hit_rate"] = self.hit_rate
+        return counters
+
+
+# Function to compute the content key of a hull request: a hash of the points' dtype, shape and bytes, the method
+# and its options (which must be JSON-serializable, or have a stable repr)
+def hull_key(points, method, options):
+    points = np.ascontiguousarray(points)
+    digest = hashlib.sha256()
+    header = [points.dtype.str, list(points.shape), method, options]
+    digest.update(json.dumps(header, sort_keys=True, default=repr).encode())
+    digest.update(memoryview(points.reshape(-1)).cast("B"))    # the buffer itself, not a copy of it
+    return digest.hexdigest()[:32]
+
+
+# Function to estimate the memory of a result: its bytes for an array, the bytes of its arrays for a hull object
+def result_bytes(result):
+    if isinstance(result, np.ndarray):
+        return result.nbytes
+    return sum(getattr(result, name).nbytes for name in RESULT_ARRAYS
+               if isinstance(getattr(result, name, None), np.ndarray))
+
+
+class HullCache:
+    """
+    Content-addressed cache of hull results ('convex_hull' of the same points with the same method and options).
+
+    The memory tier keeps the most recently used results under 'max_bytes' (least recently used evicted first).
+    With a 'directory', array results are also written there as <key>.npy files, the least recently used ones
+    being deleted above 'max_disk_bytes'; a disk hit is memory-mapped read-only and moved to the memory tier.
+    Array results are returned read-only and shared by all the hits, so they must not be modified in place
+    (copy them first); hull objects (quickhull_3d) are cached in memory only.
+
+    Example:
+        cache = HullCache(max_bytes=64 << 20, directory="hull-cache")
+        hull = cache.hull(points, method="quickhull", engine="numpy")
+        hull = convex_hull(points, method="quickhull", engine="numpy", cache=cache)     # same entry
+        cache.stats.as_dict()
+    """
+
+    def __init__(self, max_bytes=256 << 20, directory=None, max_disk_bytes=1 << 30):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.stats = CacheStats()
+        self.bytes = 0
+        self._entries = OrderedDict()       # key -> (result, bytes), least recently used first
+        self._lock = threading.Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries or (self.directory is not None and os.path.exists(self._path(key)))
+
+    # Function to get the hull of points, from the cache or computed by convex_hull and stored. The options
+    # (prefilter included) are part of the key; 'stats' is not, and is only filled when the hull is computed
+    def hull(self, points, method="incremental", prefilter=False, stats=None, **options):
+        method = ALIASES.get(method, method)
+        points = np.asarray(points)
+        key = hull_key(points, method, dict(options, prefilter=prefilter))
+        result = self.get(key)
+        if result is None:
+            result = self.put(key, convex_hull(points, method=method, prefilter=prefilter, stats=stats, **options))
+        return result
+
+    # Function to look up a key. Returns the cached result (read-only) or None, and counts the hit or the miss
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return entry[0]
+        if self.directory is not None:
+            path = self._path(key)
+            try:
+                result = np.load(path, mmap_mode="r")
+                os.utime(path)                      # the modification time is the LRU order of the disk tier
+            except FileNotFoundError:
+                result = None
+            if result is not None:
+                with self._lock:
+                    self.stats.disk_hits += 1
+                    self._store(key, result)
+                return result
+        with self._lock:
+            self.stats.misses += 1
+        return None
+
+    # Function to store the result of a key. Returns the stored (read-only) result
+    def put(self, key, result):
+        if isinstance(result, np.ndarray):
+            result.flags.writeable = False
+            if self.directory is not None:
+                self._write(key, result)
+        with self._lock:
+            self._store(key, result)
+        return result
+
+    # Function to empty the memory tier (and the disk tier too with disk=True)
+    def clear(self, disk=False):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+        if disk and self.directory is not None:
+            for name, _, _ in self._files():
+                os.remove(os.path.join(self.directory, name))
+
+    # Function to add a result to the memory tier and evict the least recently used ones above max_bytes
+    # (called with the lock held). A result larger than the whole budget is not kept in memory
+    def _store(self, key, result):
+        size = result_bytes(result)
+        if key in self._entries:
+            self.bytes -= self._entries.pop(key)[1]
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (result, size)
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.bytes -= evicted
+            self.stats.evictions += 1
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".npy")
+
+    # Function to list the cache files as (name, size, modification time)
+    def _files(self):
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".npy") and not entry.name.endswith(".tmp.npy"):
+                try:
+                    status = entry.stat()
+                except FileNotFoundError:
+                    continue                        # deleted by another process in the meantime
+                files.append((entry.name, status.st_size, status.st_mtime))
+        return files
+
+    # Function to write a result to the disk tier and delete the least recently used files above max_disk_bytes
+    def _write(self, key, result):
+        path = self._path(key)
+        # written under a temporary name first, so a concurrent reader never sees a partial file
+        temporary = path + "." + str(os.getpid()) + "-" + str(threading.get_ident()) + ".tmp.npy"
+        np.save(temporary, result)
+        os.replace(temporary, path)
+
+        files = sorted(self._files(), key=lambda file: file[2])
+        total = sum(size for _, size, _ in files)
+        for name, size, _ in files:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            total -= size
+            with self._lock:
+                self.stats.disk_evictions += 1
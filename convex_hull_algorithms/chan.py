@@ -0,0 +1,148 @@
+# Chan's algorithm in 2D: output-sensitive O(n log h) hull built from Graham's Scan group hulls and a Jarvis-style
+# wrap. The group hulls are built together in one batched pass, and every wrap step binary searches the tangents
+# of all the groups at once, one vectorized orientation pass per level of the search
+
+import numpy as np                              # for math calculations on arrays
+
+from .batch import batch_hull_arrays
+from .geometry import unique_sorted
+from .predicates import coordinate_columns, orient2d_array, orient2d_array_int64
+from .wrapping import wrap_step
+
+# Exponent t of the first group size m = 2 ** (2 ** t), 256 points per group: smaller groups only add wrap rounds
+# and groups to search, the vectorized steps do not get cheaper below it
+FIRST_ROUND = 3
+
+
+# Function to compute the strict hulls of the consecutive groups of m sorted, distinct points at once.
+# Returns the hull positions (indices into x and y, every group in the order graham_scan returns its vertices,
+# without collinear vertices) and, for every group, the position of its first vertex, of its lexicographically
+# largest vertex (the end of its upper chain) and the end of its vertices
+def group_hulls(x, y, m):
+
+    orient = orient2d_array_int64 if x.dtype == np.int64 else orient2d_array
+    group = np.arange(len(x)) // m
+    num_of_groups = int(group[-1]) + 1
+    hull, counts = batch_hull_arrays(x, y, group, num_of_groups)
+    hull_group = np.repeat(np.arange(num_of_groups), counts)
+    starts = np.repeat(np.cumsum(counts) - counts, counts)
+    ends = starts + np.repeat(counts, counts)
+
+    # drop the vertices collinear with their two neighbours (cyclically within the group), all at once: a strict
+    # vertex always turns. A group without any turn is collinear, its hull is its two extremes, and the sorted
+    # points are numbered lexicographically, so those are its smallest and largest index
+    position = np.arange(len(hull))
+    a = hull[np.where(position == starts, ends - 1, position - 1)]
+    c = hull[np.where(position == ends - 1, starts, position + 1)]
+    turning = orient(x[a], y[a], x[hull], y[hull], x[c], y[c]) != 0
+    collinear = np.bincount(hull_group, weights=turning, minlength=num_of_groups) == 0
+    largest = np.zeros(num_of_groups, dtype=hull.dtype)
+    np.maximum.at(largest, hull_group, hull)
+    extreme = (position == starts) | (hull == largest[hull_group])
+    keep = turning | (collinear[hull_group] & extreme)
+    hull, hull_group = hull[keep], hull_group[keep]
+
+    counts = np.bincount(hull_group, minlength=num_of_groups)
+    starts = np.cumsum(counts) - counts
+    tops = np.zeros(num_of_groups, dtype=np.intp)
+    top = np.flatnonzero(hull == largest[hull_group])
+    tops[hull_group[top]] = top
+    return hull, starts, tops, starts + counts
+
+
+# Function to find, in every group at once, the tangent point of the chain of length 'lengths' starting at position
+# 'bases' of x and y (wrapping around from 'ends' to 'starts'), seen from a point p on the left of all of them: the
+# vertex that leaves the whole chain on the right of p -> vertex, the farthest one if several are collinear with p.
+# Along such a chain the vertices first turn counterclockwise from p and then clockwise, so the first vertex whose
+# successor is strictly clockwise is found by a binary search
+def chain_tangents(x, y, px, py, bases, lengths, starts, ends, orient):
+
+    def vertex(k):
+        positions = bases + k
+        return np.where(positions >= ends, starts, positions)
+
+    low = np.zeros(len(bases), dtype=np.intp)
+    high = lengths - 1
+    while True:
+        active = low < high
+        if not active.any():
+            return vertex(low)
+        middle = (low + high) // 2
+        a, b = vertex(middle), vertex(np.minimum(middle + 1, lengths - 1))
+        counterclockwise = orient(px, py, x[a], y[a], x[b], y[b]) >= 0
+        low = np.where(active & counterclockwise, middle + 1, low)
+        high = np.where(active & ~counterclockwise, middle, high)
+
+
+# Function to compute the hull of the points with at most m wrap steps, using group hulls of m points.
+# Returns the indices of the hull vertices, or None if the hull has more than m vertices
+def chan_wrap(x, y, m):
+
+    orient = orient2d_array_int64 if x.dtype == np.int64 else orient2d_array
+    hull, starts, tops, ends = group_hulls(x, y, m)
+    if len(starts) == 1:
+        return hull                             # a single group: its hull is the hull
+    hx, hy = x[hull], y[hull]
+    group_of = np.repeat(np.arange(len(starts)), ends - starts)
+    first_x, last_x = hx[starts], hx[tops]
+    upper_lengths, lower_lengths = tops - starts + 1, ends - tops + 1
+
+    # start from the leftmost point (the first vertex of the first group) and go clockwise, first up
+    start = current = 0
+    direction_x, direction_y = 0.0, 1.0
+    convex_hull = [start]
+    for step in range(m):
+        px, py = hx[current], hy[current]
+        own = group_of[current]
+
+        # groups on the right of p touch the wrap with their upper chain, groups on its left with their lower
+        # chain (from the largest vertex back to the first one); the chains are searched all at once
+        right = np.flatnonzero(first_x > px)
+        left = np.flatnonzero(last_x < px)
+        candidates = [
+            chain_tangents(hx, hy, px, py, starts[right], upper_lengths[right], starts[right], ends[right], orient),
+            chain_tangents(hx, hy, px, py, tops[left], lower_lengths[left], starts[left], ends[left], orient),
+        ]
+        # p is a vertex of its own group hull, whose next vertex leaves the group on the right
+        following = current + 1 if current + 1 < ends[own] else starts[own]
+        candidates.append(np.array([following]))
+        # groups sharing an x-coordinate with p (integer columns split across groups) offer all their vertices
+        for g in np.flatnonzero((first_x <= px) & (last_x >= px)):
+            if g != own:
+                candidates.append(np.arange(starts[g], ends[g]))
+
+        best = wrap_step(hx, hy, np.concatenate(candidates), current, direction_x, direction_y)
+        # We have returned to the start point
+        if best is None or best == start:
+            return hull[convex_hull]
+        convex_hull.append(best)
+        direction_x, direction_y = hx[best] - px, hy[best] - py
+        current = best
+    return None
+
+
+# Function to compute the convex hull with Chan's algorithm, guessing h by squaring the group size
+def chan(points):
+    """
+    Returns:
+        Array of the points of the convex hull (without collinear points), in the order graham_scan returns them
+    """
+    # sorted with np.lexsort directly: 'lexicographic_sort' also looks for the smallest point with a Python loop
+    points = np.asarray(points).reshape(-1, 2)
+    points = unique_sorted(points[np.lexsort((points[:, 1], points[:, 0]))])
+    if len(points) < 3:
+        return points
+
+    # all the points on one line: the hull is the two extremes
+    x, y = coordinate_columns(points)
+    if not orient2d_array(x[0], y[0], x[-1], y[-1], x, y).any():
+        return points[[0, -1]]
+
+    # the last round has a single group of all the points, whose hull is the hull, so the loop always ends
+    t = FIRST_ROUND
+    while True:
+        m = min(2 ** (2 ** t), len(points))
+        convex_hull = chan_wrap(x, y, m)
+        if convex_hull is not None:
+            return points[convex_hull]
+        t = t + 1
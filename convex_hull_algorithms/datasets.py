@@ -0,0 +1,176 @@
+# Seeded point generators for the benchmarks and the scripts. Every generator takes the number of points, a seed
+# and the number of dimensions (2 or 3) and returns a (n, dimensions) array; the same arguments give the same
+# points. 'make_points' adds integer or float coordinates in given bounds, unique x-coordinates or unique points,
+# and a .npy disk cache keyed by all of its parameters
+
+import hashlib                                  # for the cache keys
+import json                                     # for the cache keys
+import os                                       # for the cache files
+
+import numpy as np                              # for random number generation
+
+# Version of the generated data, part of the cache keys: bump it when a generator changes its output
+DATASET_VERSION = 2
+# Range of each distribution's coordinates that 'make_points' maps onto the bounds (Gaussian points are clipped)
+NATURAL_BOUNDS = {
+    "uniform_square": (0.0, 1.0),
+    "uniform_disk": (-1.0, 1.0),
+    "gaussian": (-4.0, 4.0),
+    "circle": (-1.0, 1.0),
+}
+# Rounds of redrawing the repeated values before giving up on uniqueness
+MAX_REDRAWS = 64
+
+
+# Uniform points in the unit square (unit cube in 3D)
+def uniform_square(num_of_points, seed=0, dimensions=2):
+    rng = np.random.default_rng(seed)
+    return rng.random((num_of_points, dimensions))
+
+
+# Uniform points in the unit disk (unit ball in 3D)
+def uniform_disk(num_of_points, seed=0, dimensions=2):
+    rng = np.random.default_rng(seed)
+    directions = rng.normal(size=(num_of_points, dimensions))
+    directions /= np.linalg.norm(directions, axis=1)[:, None]
+    radius = rng.random(num_of_points) ** (1 / dimensions)
+    return directions * radius[:, None]
+
+
+# Standard normal points
+def gaussian(num_of_points, seed=0, dimensions=2):
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=(num_of_points, dimensions))
+
+
+# Points on the unit circle (unit sphere in 3D): every point is a hull vertex (h = n)
+def circle(num_of_points, seed=0, dimensions=2):
+    points = uniform_disk(num_of_points, seed, dimensions)
+    return points / np.linalg.norm(points, axis=1)[:, None]
+
+
+# Integer points on a grid of about num_of_points cells, with repeated and collinear points
+def integer_grid(num_of_points, seed=0, dimensions=2):
+    rng = np.random.default_rng(seed)
+    side = max(2, int(round(num_of_points ** (1 / dimensions))))
+    return rng.integers(0, side, size=(num_of_points, dimensions))
+
+
+# Generators by name
+DISTRIBUTIONS = {
+    "uniform_square": uniform_square,
+    "uniform_disk": uniform_disk,
+    "gaussian": gaussian,
+    "circle": circle,
+    "integer_grid": integer_grid,
+}
+
+
+# Function to generate a named dataset
+def generate(distribution, num_of_points, seed=0, dimensions=2):
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError("Unknown distribution: " + str(distribution))
+    return DISTRIBUTIONS[distribution](num_of_points, seed, dimensions)
+
+
+# Function to map the points of a distribution onto [low, high] (rounded for integer coordinates)
+def _to_bounds(points, distribution, num_of_points, bounds, coordinates):
+    if distribution == "integer_grid":
+        if bounds is not None:
+            side = max(2, int(round(num_of_points ** (1 / points.shape[1]))))
+            points = bounds[0] + points * ((bounds[1] - bounds[0]) / (side - 1))
+    elif bounds is not None:
+        natural_low, natural_high = NATURAL_BOUNDS[distribution]
+        points = np.clip(points, natural_low, natural_high)
+        points = bounds[0] + (points - natural_low) * ((bounds[1] - bounds[0]) / (natural_high - natural_low))
+    if coordinates == "int":
+        return np.rint(points).astype(np.int64)
+    return points.astype(np.float64)
+
+
+# Function to find the rows that repeat an earlier row (on the x-coordinate only, or on the whole point)
+def _repeated(points, unique):
+    keys = points[:, :1] if unique == "x" else points
+    # a stable sort keeps equal rows in their original order, so the first of them stays and the rest repeat it
+    order = np.lexsort(keys.T[::-1])
+    sorted_keys = keys[order]
+    repeated = np.zeros(len(points), dtype=bool)
+    repeated[order[1:]] = np.all(sorted_keys[1:] == sorted_keys[:-1], axis=1)
+    return repeated
+
+
+# Function to generate a dataset with the options of the benchmarks and the scripts
+def make_points(distribution, num_of_points, seed=0, dimensions=2, coordinates="float", bounds=None, unique=None,
+                cache=None):
+    """
+    Args:
+        distribution: name of DISTRIBUTIONS
+        num_of_points: number of points
+        seed: seed of the generator, the same parameters always give the same points
+        dimensions: 2 or 3
+        coordinates: "float" or "int" (rounded to integers)
+        bounds: (low, high) range the coordinates are mapped onto (the distribution's own range if None;
+                [-100, 100] for integer coordinates, widened to [-n // 2, n // 2] when unique="x" asks for more
+                than 201 unique x-coordinates)
+        unique: None, "x" (no two points share an x-coordinate) or "points" (no repeated point); the repeated
+                values are redrawn from the same distribution
+        cache: directory of the .npy cache, the dataset is read from it if it was generated before
+    Returns:
+        (n, dimensions) array, float64 or int64
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError("Unknown distribution: " + str(distribution))
+    if coordinates not in ("float", "int"):
+        raise ValueError("Unknown coordinates: " + str(coordinates))
+    if unique not in (None, "x", "points"):
+        raise ValueError("Unknown uniqueness: " + str(unique))
+    if coordinates == "int" and bounds is None and distribution != "integer_grid":
+        # 2 * radius + 1 integer x-coordinates, enough for num_of_points unique ones
+        radius = max(100, num_of_points // 2) if unique == "x" else 100
+        bounds = (-radius, radius)
+    if coordinates == "int" and unique == "x" and bounds is not None and bounds[1] - bounds[0] + 1 < num_of_points:
+        raise ValueError("Only " + str(bounds[1] - bounds[0] + 1) + " integer x-coordinates in " + str(bounds)
+                         + ", " + str(num_of_points) + " unique ones were asked")
+
+    path = None
+    if cache is not None:
+        parameters = [DATASET_VERSION, distribution, num_of_points, seed, dimensions, coordinates,
+                      None if bounds is None else list(bounds), unique]
+        key = hashlib.sha256(json.dumps(parameters).encode()).hexdigest()[:16]
+        path = os.path.join(cache, distribution + "-" + str(num_of_points) + "-" + key + ".npy")
+        if os.path.exists(path):
+            return np.load(path)
+
+    generator = DISTRIBUTIONS[distribution]
+    if distribution == "uniform_square" and coordinates == "int" and unique == "x":
+        # distinct x-coordinates drawn directly, without redraws even when they fill the whole range
+        rng = np.random.default_rng([seed, 0])
+        low, high = int(bounds[0]), int(bounds[1])
+        points = rng.integers(low, high + 1, size=(num_of_points, dimensions))
+        points[:, 0] = low + rng.choice(high - low + 1, num_of_points, replace=False)
+    else:
+        points = _to_bounds(generator(num_of_points, seed, dimensions), distribution, num_of_points, bounds,
+                            coordinates)
+        if unique is not None:
+            repeated = _repeated(points, unique)
+            for redraw in range(1, MAX_REDRAWS + 1):
+                if not repeated.any():
+                    break
+                if distribution == "integer_grid":
+                    # the grid size depends on the number of points, so the redraws come from a full-size grid
+                    fresh = generator(num_of_points, [seed, redraw], dimensions)[:np.count_nonzero(repeated)]
+                else:
+                    fresh = generator(np.count_nonzero(repeated), [seed, redraw], dimensions)
+                points[repeated] = _to_bounds(fresh, distribution, num_of_points, bounds, coordinates)
+                repeated = _repeated(points, unique)
+            if repeated.any():
+                raise ValueError("Could not draw " + str(num_of_points) + " points with unique " + unique
+                                 + " from " + distribution + ", widen the bounds")
+
+    if path is not None:
+        os.makedirs(cache, exist_ok=True)
+        # written under a temporary name first, so a concurrent reader never sees a partial file
+        temporary = path + "." + str(os.getpid()) + ".tmp.npy"
+        np.save(temporary, points)
+        os.replace(temporary, path)
+    return points
@@ -0,0 +1,217 @@
+# Divide and Conquer algorithm in 2D
+
+import os                                       # for the number of cores
+from concurrent.futures import ProcessPoolExecutor  # for the slab hulls on multiple cores
+from multiprocessing import shared_memory       # for sharing the sorted points with the workers
+
+import numpy as np                              # for math calculations
+
+from .incremental import chain_candidates, convex_chain_numpy
+from .predicates import farthest_from_line, int64_safe, orient2d, orient2d_det
+
+
+# Function to find whether the point is above or below the reference line
+def determinant(a, b, c):
+
+    # a: point, the point on the left end of line segment ab
+    # b: point, the point on the right end of line segment ab
+    # c: point, the point for which the direction and location is computed
+
+    # the sign comes from the robust predicate, so points on the line give exactly 0
+    det = orient2d_det(a, b, c)
+    return det
+
+# Function to implement the Divide and Conquer algorithm recursively
+def devide_and_conquer(points):
+
+    # Sort the points in increasing order of x-coordinates
+    points = sorted(points)
+    n = len(points)
+
+    # Choose the leftmost and rightmost points as the endpoints of the convex hull
+    left_most_point = points[0]
+    right_most_point = points[n - 1]
+
+    # Initialize the convex hull with the leftmost and rightmost points
+    convex_set = {left_most_point, right_most_point}
+    # Split the remaining points into two sets, one for the upper hull and one for the lower hull
+    upper_hull = []
+    lower_hull = []
+
+    for i in range(1, n - 1):
+        # Find the determinant of the three points to determine whether they are on the upper or lower hull
+        det = determinant(left_most_point, right_most_point, points[i])
+
+        if det > 0:
+            upper_hull.append(points[i])
+        elif det < 0:
+            lower_hull.append(points[i])
+
+    # Recursively construct the upper and lower hulls
+    construct_hull(upper_hull, left_most_point, right_most_point, convex_set)
+    construct_hull(lower_hull, right_most_point, left_most_point, convex_set)
+
+    return sorted(convex_set)
+
+# function to update the state of the current convex hull
+def construct_hull(points, left, right, convex_set):
+
+    # points: the hull of points from which to choose the next convex-hull point
+    # left: the point to the left  of line segment joining left and right
+    # right: τhe point to the right of the line segment joining left and right
+
+    # If there are any initial points left
+    if points:
+        extreme_point = None
+        candidate_points = []
+
+        # p is on the left of the line joining left and right
+        for p in points:
+            if determinant(left, right, p) > 0:
+                candidate_points.append(p)
+
+        # Find the point with the largest determinant (decided exactly, like the signs of the candidates)
+        if candidate_points:
+            extreme_point = farthest_from_line(left, right, candidate_points)
+
+        # If an extreme point is found
+        if extreme_point:
+
+            # Recursively construct the hull on the left and right of the extreme point
+            construct_hull(candidate_points, left, extreme_point, convex_set)
+            # Add the extreme point to the convex hull
+            convex_set.add(extreme_point)
+            construct_hull(candidate_points, extreme_point, right, convex_set)
+
+
+# Function to compute the angle between two points and the x-axis
+def angle(p1, p2):
+    return np.arctan2(p2[1]-p1[1], p2[0]-p1[0])
+
+
+# Function to merge two chains of x-separated hulls (every point of 'left' is lexicographically before every
+# point of 'right') with the tangent between them, in O(h1 + h2). Chains are index arrays in increasing x.
+# sign=1 merges upper chains (upper tangent), sign=-1 lower chains (lower tangent, the y axis mirrored)
+def merge_chains(x, y, left, right, sign=1):
+
+    i = len(left) - 1
+    j = 0
+    moved = True
+    while moved:
+        moved = False
+        # move the left end of the tangent back while left[i] is strictly under the segment left[i - 1] -> right[j]
+        while i > 0:
+            a, b, c = left[i - 1], left[i], right[j]
+            if sign * orient2d((x[a], y[a]), (x[b], y[b]), (x[c], y[c])) > 0:
+                i = i - 1
+                moved = True
+            else:
+                break
+        # move the right end forward while right[j] is strictly under the segment left[i] -> right[j + 1]
+        while j < len(right) - 1:
+            a, b, c = left[i], right[j], right[j + 1]
+            if sign * orient2d((x[a], y[a]), (x[b], y[b]), (x[c], y[c])) > 0:
+                j = j + 1
+                moved = True
+            else:
+                break
+
+    return np.concatenate((left[:i + 1], right[j:]))
+
+
+# Function to compute the upper and lower chains (index arrays in increasing x) of the slab start:end
+# of the sorted points, with the vectorized Graham's Scan engine
+def slab_chains(x, y, start, end):
+    upper, lower = chain_candidates(x, start, end)
+    upper = convex_chain_numpy(x, y, upper)
+    lower = convex_chain_numpy(x, y, lower)[::-1]
+    return upper, lower
+
+
+# Sorted points of the pool workers, attached from shared memory once per worker process
+_worker_points = {}
+
+
+# Function to attach a worker process to the shared memory block with the sorted x and y columns
+def _attach_shared_points(name, num_of_points, dtype=np.float64):
+    block = shared_memory.SharedMemory(name=name)
+    columns = np.ndarray((2, num_of_points), dtype=dtype, buffer=block.buf)
+    _worker_points["block"] = block
+    _worker_points["x"] = columns[0]
+    _worker_points["y"] = columns[1]
+
+
+# Function that a pool worker runs for each slab: only the slab bounds go in, only the chains come out
+def _shared_slab_chains(start, end):
+    return slab_chains(_worker_points["x"], _worker_points["y"], start, end)
+
+
+# Function to implement a merge-based Divide and Conquer: sort by x once, split the points into contiguous
+# slabs, compute the slab hulls (in parallel on 'workers' processes) and merge them with upper/lower tangents
+def merge_divide_and_conquer(points, slabs=None, workers=None, min_parallel_size=200000):
+    """
+    Args:
+        points: (n, 2) array-like of points
+        slabs: number of slabs (default: 4 per worker)
+        workers: number of worker processes (default: number of cores). The slab hulls are computed in
+                 this process when workers=1 or when there are less than min_parallel_size points
+    Returns:
+        Array of the points of the convex hull, in the order graham_scan returns them
+
+    Integer points within the int64-safe range (see predicates.int64_safe) are processed as int64 columns:
+    every orientation is exact integer arithmetic and the coordinates are never converted to float.
+    """
+    points = np.asarray(points)
+    dtype = np.int64 if int64_safe(points) else np.float64
+
+    # Sort the points lexicographically once, and drop the repeated points
+    order = np.lexsort((points[:, 1], points[:, 0]))
+    repeated = np.zeros(len(order), dtype=bool)
+    repeated[1:] = np.all(points[order[1:]] == points[order[:-1]], axis=1)
+    order = order[~repeated]
+    num_of_points = len(order)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if slabs is None:
+        slabs = 4 * workers
+    slabs = max(1, min(slabs, num_of_points // 3))
+    bounds = np.linspace(0, num_of_points, slabs + 1).astype(int)
+
+    if workers == 1 or num_of_points < min_parallel_size:
+        x = np.ascontiguousarray(points[order, 0], dtype=dtype)
+        y = np.ascontiguousarray(points[order, 1], dtype=dtype)
+        chains = [slab_chains(x, y, start, end) for start, end in zip(bounds[:-1], bounds[1:])]
+    else:
+        # the sorted columns go to the workers through shared memory, they are never pickled
+        block = shared_memory.SharedMemory(create=True, size=2 * num_of_points * 8)
+        try:
+            columns = np.ndarray((2, num_of_points), dtype=dtype, buffer=block.buf)
+            columns[0] = points[order, 0]
+            columns[1] = points[order, 1]
+            with ProcessPoolExecutor(max_workers=workers, initializer=_attach_shared_points,
+                                     initargs=(block.name, num_of_points, dtype)) as pool:
+                chains = list(pool.map(_shared_slab_chains, bounds[:-1], bounds[1:]))
+            del columns
+        finally:
+            block.close()
+            block.unlink()
+
+    # Merge the slab hulls from left to right, on the coordinates of the slab hull vertices only
+    used = np.unique(np.concatenate([np.concatenate(chain) for chain in chains]))
+    x = np.ascontiguousarray(points[order[used], 0], dtype=dtype)
+    y = np.ascontiguousarray(points[order[used], 1], dtype=dtype)
+    chains = [(np.searchsorted(used, upper), np.searchsorted(used, lower)) for upper, lower in chains]
+
+    upper, lower = chains[0]
+    for slab_upper, slab_lower in chains[1:]:
+        upper = merge_chains(x, y, upper, slab_upper, sign=1)
+        lower = merge_chains(x, y, lower, slab_lower, sign=-1)
+
+    if len(upper) == len(lower) == len(used):
+        # every point on both chains: they are all collinear, the hull is the segment of the extremes
+        return points[order[used[[0, -1]]]]
+
+    # upper chain from left to right, then lower chain from right to left, like graham_scan
+    convex_hull = np.concatenate((upper[:-1], lower[::-1][:-1]))
+    return points[order[used[convex_hull]]]
@@ -0,0 +1,241 @@
+# Fully dynamic convex hull in 2D (insertions and deletions), and a sliding window hull on top of it
+
+import time                                     # for the default timestamps of the sliding window
+from bisect import bisect_left, insort          # for the sorted buckets of points
+from collections import deque                   # for the points of the sliding window
+
+import numpy as np                              # for math calculations on arrays
+
+from .online import insert_into_chain
+from .predicates import orient2d
+
+
+# Function to build a chain of a lexicographically sorted list of points with a stack scan.
+# side=1 builds the upper chain, side=-1 the lower chain (repeated and collinear points are dropped)
+def build_chain(points, side):
+    chain = []
+    for point in points:
+        if chain and chain[-1] == point:
+            continue
+        while len(chain) >= 2 and side * orient2d(chain[-2], chain[-1], point) >= 0:
+            chain.pop()
+        chain.append(point)
+    return chain
+
+
+# Function to merge two chains of lexicographically separated point sets (every point of 'left' is before every
+# point of 'right') with their common tangent. Only the points the tangent cuts off are tested
+def merge_chains(left, right, side):
+    if not left:
+        return right
+    if not right:
+        return left
+
+    i = len(left) - 1
+    j = 0
+    moved = True
+    while moved:
+        moved = False
+        while i > 0 and side * orient2d(left[i - 1], left[i], right[j]) >= 0:
+            i = i - 1
+            moved = True
+        while j < len(right) - 1 and side * orient2d(left[i], right[j], right[j + 1]) >= 0:
+            j = j + 1
+            moved = True
+    return left[:i + 1] + right[j:]
+
+
+class DynamicHull2D:
+    """
+    Convex hull of a 2D point set that supports both insertions and deletions.
+
+    The points are kept in lexicographic order in buckets of about 'bucket_size' points. Each bucket caches
+    its upper and lower chains, and a balanced binary tree over the buckets caches, in every node, the
+    chains of its whole subtree merged with their common tangents (in the spirit of Overmars-van Leeuwen).
+    An update only touches its bucket: if the bucket chains do not change (most updates: interior points),
+    nothing else is done, otherwise the chains are merged again on the path up to the root.
+
+    Example:
+        hull = DynamicHull2D(points)
+        hull.insert((0.5, 2.0))
+        hull.delete((0.5, 2.0))
+        hull.vertices       # (h, 2) array, in the order graham_scan returns the vertices
+    """
+
+    def __init__(self, points=None, bucket_size=512):
+        self.bucket_size = bucket_size
+        self.num_of_points = 0
+        self.buckets = [[]]         # sorted lists of (x, y) tuples, repeated points allowed
+        self.maxes = [None]         # last point of every bucket, to find the bucket of a point
+        self.bucket_chains = [([], [])]
+        if points is not None:
+            points = [(point[0], point[1]) for point in np.asarray(points).tolist()]
+            points.sort()
+            self.num_of_points = len(points)
+            if points:
+                self.buckets = [points[i:i + bucket_size] for i in range(0, len(points), bucket_size)]
+                self.maxes = [bucket[-1] for bucket in self.buckets]
+                self.bucket_chains = [(build_chain(bucket, 1), build_chain(bucket, -1)) for bucket in self.buckets]
+        self._rebuild_tree()
+
+    # Function to rebuild the whole tree of chains (after a bucket is split or removed)
+    def _rebuild_tree(self):
+        size = 1
+        while size < len(self.buckets):
+            size = 2 * size
+        self.size = size
+        self.tree = [([], [])] * (2 * size)
+        self.tree[size:size + len(self.buckets)] = self.bucket_chains
+        for node in range(size - 1, 0, -1):
+            self._merge_node(node)
+        self._vertices = None
+
+    # Function to merge the chains of the two children of a tree node
+    def _merge_node(self, node):
+        (left_upper, left_lower), (right_upper, right_lower) = self.tree[2 * node], self.tree[2 * node + 1]
+        self.tree[node] = (merge_chains(left_upper, right_upper, 1), merge_chains(left_lower, right_lower, -1))
+
+    # Function to store new chains of bucket b and merge them up to the root
+    def _update_path(self, b, chains):
+        self.bucket_chains[b] = chains
+        node = self.size + b
+        self.tree[node] = chains
+        node = node // 2
+        while node >= 1:
+            self._merge_node(node)
+            node = node // 2
+        self._vertices = None
+
+    # Function to find the bucket where a point is (or would be inserted)
+    def _bucket_of(self, point):
+        if self.maxes[0] is None:
+            return 0
+        return min(bisect_left(self.maxes, point), len(self.buckets) - 1)
+
+    # Function to insert one point
+    def insert(self, point):
+        point = (point[0], point[1])
+        if isinstance(point[0], np.generic):
+            point = (point[0].item(), point[1].item())
+        b = self._bucket_of(point)
+        bucket = self.buckets[b]
+        insort(bucket, point)
+        self.maxes[b] = bucket[-1]
+        self.num_of_points += 1
+
+        if len(bucket) > 2 * self.bucket_size:
+            # split the bucket in two halves
+            half = len(bucket) // 2
+            self.buckets[b:b + 1] = [bucket[:half], bucket[half:]]
+            self.maxes[b:b + 1] = [bucket[half - 1], bucket[-1]]
+            self.bucket_chains[b:b + 1] = [(build_chain(part, 1), build_chain(part, -1)) for part in self.buckets[b:b + 2]]
+            self._rebuild_tree()
+            return
+
+        # the bucket chains only change if the point is outside of them
+        upper, lower = self.bucket_chains[b]
+        upper, lower = list(upper), list(lower)
+        changed_upper = insert_into_chain(upper, point, 1)
+        changed_lower = insert_into_chain(lower, point, -1)
+        if changed_upper or changed_lower:
+            self._update_path(b, (upper, lower))
+
+    # Function to delete one point (one copy of it, if it was inserted more than once)
+    def delete(self, point):
+        point = (point[0], point[1])
+        if isinstance(point[0], np.generic):
+            point = (point[0].item(), point[1].item())
+        b = self._bucket_of(point)
+        bucket = self.buckets[b]
+        i = bisect_left(bucket, point)
+        if i == len(bucket) or bucket[i] != point:
+            raise ValueError("Point " + str(point) + " is not in the hull's point set")
+        del bucket[i]
+        self.num_of_points -= 1
+
+        if not bucket and len(self.buckets) > 1:
+            del self.buckets[b], self.maxes[b], self.bucket_chains[b]
+            self._rebuild_tree()
+            return
+        self.maxes[b] = bucket[-1] if bucket else None
+
+        # the bucket chains only change if the point was one of their vertices (and it was its last copy)
+        upper, lower = self.bucket_chains[b]
+        k = bisect_left(upper, point)
+        on_upper = k < len(upper) and upper[k] == point
+        k = bisect_left(lower, point)
+        on_lower = k < len(lower) and lower[k] == point
+        if (on_upper or on_lower) and point not in bucket[max(i - 1, 0):i + 1]:
+            self._update_path(b, (build_chain(bucket, 1), build_chain(bucket, -1)))
+
+    # Vertices of the hull as a (h, 2) array, starting at the leftmost point, in the order graham_scan
+    # returns them. The array is cached until the hull changes
+    @property
+    def vertices(self):
+        if self._vertices is None:
+            upper, lower = self.tree[1]
+            self._vertices = np.array(upper + lower[-2:0:-1], dtype=np.float64).reshape(-1, 2)
+        return self._vertices
+
+    def __len__(self):
+        return self.num_of_points
+
+
+class SlidingWindowHull:
+    """
+    Convex hull of the most recent points of a stream, on top of DynamicHull2D.
+    The window keeps the last 'size' points (count-based eviction), the points of the last 'duration'
+    time units (time-based eviction), or both.
+
+    Example:
+        window = SlidingWindowHull(duration=60.0)
+        window.push((x, y), timestamp)
+        window.vertices
+    """
+
+    def __init__(self, size=None, duration=None, bucket_size=512):
+        if size is None and duration is None:
+            raise ValueError("SlidingWindowHull needs a window 'size', a 'duration' or both")
+        self.size = size
+        self.duration = duration
+        self.hull = DynamicHull2D(bucket_size=bucket_size)
+        self.window = deque()           # (timestamp, point) pairs, oldest first
+
+    # Function to add a point to the window and evict the points that fall out of it.
+    # Without a timestamp, the current time.time() is used
+    def push(self, point, timestamp=None):
+        if timestamp is None:
+            timestamp = time.time()
+        point = (point[0], point[1])
+        if isinstance(point[0], np.generic):
+            point = (point[0].item(), point[1].item())
+        self.window.append((timestamp, point))
+        self.hull.insert(point)
+        self.evict(timestamp)
+
+    # Function to add a batch of points (with one timestamp each, or one timestamp for the whole batch)
+    def push_many(self, points, timestamps=None):
+        points = np.asarray(points).tolist()
+        if timestamps is None or np.ndim(timestamps) == 0:
+            timestamps = [time.time() if timestamps is None else timestamps] * len(points)
+        for point, timestamp in zip(points, np.asarray(timestamps).tolist()):
+            self.push(point, timestamp)
+
+    # Function to evict the points that are out of the window at time 'now'
+    def evict(self, now=None):
+        window = self.window
+        while self.size is not None and len(window) > self.size:
+            self.hull.delete(window.popleft()[1])
+        if self.duration is not None:
+            if now is None:
+                now = time.time()
+            while window and window[0][0] <= now - self.duration:
+                self.hull.delete(window.popleft()[1])
+
+    # Vertices of the hull of the points in the window
+    @property
+    def vertices(self):
+        return self.hull.vertices
+
+    def __len__(self):
+        return len(self.window)
@@ -0,0 +1,68 @@
+# Geometric helpers shared by the 2D algorithms (sorting and orientation of points)
+
+import numpy as np                              # for math calculations on arrays
+
+from .predicates import orient2d, orient2d_array
+
+
+#   Function to sort a list of points lexicographically based on their x and y coordinates
+def lexicographic_sort(points):
+
+    # Convert input to numpy array for ease of sorting
+    points = np.array(points)
+
+    # Sort points lexicographically based on x and y coordinates
+    sorted_indices = np.lexsort((points[:, 1], points[:, 0]))
+    sorted_points = points[sorted_indices]
+
+    # Find the leftmost point (minimum x and minimum y)
+    leftmost_point = min(sorted_points, key=lambda point: (point[0], point[1]))
+
+    # Find the index of the leftmost point
+    leftmost_index = np.where((sorted_points[:, 0] == leftmost_point[0]) & (sorted_points[:, 1] == leftmost_point[1]))[0][0]
+
+    # Rearrange the points to start with the leftmost point
+    sorted_points = np.roll(sorted_points, -leftmost_index, axis=0)
+
+    return sorted_points
+
+
+# Function to drop the repeated points of a lexicographically sorted array (they are consecutive). Repeated
+# points make collinear triples with any third point, so the chains would never pop them
+def unique_sorted(points):
+    points = np.asarray(points)
+    if len(points) < 2:
+        return points
+    keep = np.ones(len(points), dtype=bool)
+    keep[1:] = np.any(points[1:] != points[:-1], axis=1)
+    return points[keep]
+
+
+# Function to determine the orientation of three points, i.e. the sign of
+# (q[1] - p[1]) * (r[0] - q[0]) - (q[0] - p[0]) * (r[1] - q[1]). The sign is computed by the robust predicate,
+# so collinear points are reported as such (0) instead of being perturbed
+def orientation(p, q, r):
+    return -orient2d(p, q, r)     # 1 for a clockwise turn, -1 for a counterclockwise turn, 0 if collinear
+
+
+# Function to put the vertices of a convex hull in the order 'graham_scan' returns them: starting at the
+# leftmost point, going over the upper chain (increasing x) and coming back over the lower chain
+def order_hull(hull_points):
+
+    # np.unique also sorts the points lexicographically
+    hull_points = np.unique(np.asarray(hull_points), axis=0)
+    if len(hull_points) < 3:
+        return hull_points
+
+    left_point = hull_points[0]
+    right_point = hull_points[-1]
+    middle = hull_points[1:-1]
+
+    # above the line joining left_point and right_point -> upper chain, below -> lower chain. The points on the
+    # line go with the upper chain, unless the line is the lower edge of the hull (nothing below it)
+    side = orient2d_array(left_point[0], left_point[1], right_point[0], right_point[1], middle[:, 0], middle[:, 1])
+    if (side > 0).any() and not (side < 0).any():
+        side[side == 0] = -1
+    upper = middle[side >= 0]
+    lower = middle[side < 0][::-1]
+    return np.vstack((left_point, upper, right_point, lower))
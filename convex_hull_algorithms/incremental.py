@@ -0,0 +1,147 @@
+# Incremental (Graham's Scan) algorithm in 2D
+
+import numpy as np                              # for math calculations on arrays
+
+from .geometry import orientation, unique_sorted
+from .predicates import coordinate_columns, orient2d_array, orient2d_array_int64
+from .trace import TraceRecorder
+
+
+# Function to build one chain (upper or lower) of the hull with vectorized passes over an index array.
+# Every pass computes the orientation of all consecutive triples of the current chain at once and
+# drops, in bulk, every middle point that makes the same turn 'orientation' reports as -1. Such a point lies
+# on the wrong side of the segment joining its two neighbours, so it can never be part of the chain.
+# Once a pass removes only a small fraction of the chain, the few survivors are finished with a plain
+# stack scan on Python numbers, so degenerate inputs cannot force O(n) passes.
+# int64 columns (see 'coordinate_columns') are scanned with exact integer orientations.
+def convex_chain_numpy(x, y, chain):
+
+    orient = orient2d_array_int64 if x.dtype == np.int64 else orient2d_array
+    while len(chain) > 2:
+        a, b, c = chain[:-2], chain[1:-1], chain[2:]
+        pop = orient(x[a], y[a], x[b], y[b], x[c], y[c]) > 0
+        removed = np.count_nonzero(pop)
+        if removed == 0:
+            return chain
+        keep = np.ones(len(chain), dtype=bool)
+        keep[1:-1] = ~pop
+        chain = chain[keep]
+        # stop the bulk passes when they no longer pay off (less than 1/8 of the chain removed)
+        if removed * 8 < len(chain):
+            break
+
+    # Finish with the classic stack scan on the (much smaller) surviving chain
+    survivors = list(zip(x[chain].tolist(), y[chain].tolist()))
+    stack = []
+    for k in range(len(chain)):
+        while len(stack) >= 2:
+            if orientation(survivors[stack[-2]], survivors[stack[-1]], survivors[k]) == -1:
+                stack.pop()     # Pop points that do not make a CCW turn
+            else:
+                break
+        stack.append(k)
+    return chain[stack]
+
+
+# Function to pick the chain candidates of the sorted, distinct points start:end. Points sharing an x-coordinate
+# are collinear (vertical), so the passes would only pop one of them at a time. Inside a column only the top
+# point can be on the upper chain and only the bottom point on the lower chain, except the first column for
+# the upper chain and the last column for the lower chain, which the scans keep whole (vertical hull edges)
+def chain_candidates(x, start, end):
+    order = np.arange(start, end)
+    column_x = x[start:end]
+    top = np.ones(len(order), dtype=bool)
+    top[:-1] = column_x[:-1] != column_x[1:]
+    bottom = np.ones(len(order), dtype=bool)
+    bottom[1:] = column_x[1:] != column_x[:-1]
+    upper = order[top | (column_x == column_x[0])]
+    lower = order[bottom | (column_x == column_x[-1])][::-1]
+    return upper, lower
+
+
+#   Function to compute the convex hull with the vectorized NumPy engine (same upper/lower chain algorithm)
+def graham_scan_numpy(points):
+    points = unique_sorted(points)
+    if len(points) < 3:
+        return []
+
+    # contiguous columns (int64 for int64-safe integer points, float64 otherwise), so that every pass works
+    # on flat arrays instead of row views
+    x, y = coordinate_columns(points)
+    upper, lower = chain_candidates(x, 0, len(points))
+
+    upper_hull = convex_chain_numpy(x, y, upper)
+    lower_hull = convex_chain_numpy(x, y, lower)
+    if len(upper_hull) == len(lower_hull) == len(points):
+        # every point on both chains: they are all collinear, the hull is the segment of the extremes
+        return points[[0, -1]]
+
+    # Merge the upper and lower hulls exactly like 'graham_scan' does
+    convex_hull = np.concatenate((upper_hull[:-1], lower_hull[:-1]))
+    return points[convex_hull]
+
+
+#   Function to compute the convex hull of a set of points using Graham's Scan (Incremental) algorithm
+def graham_scan(points, engine="python"):
+    """
+    Args:
+        points: lexicographically sorted points
+        engine: "python" for the reference per-point scan, "numpy" for the vectorized engine
+    Returns:
+        List of points in the convex hull in CCW order
+    """
+    if engine == "numpy":
+        return graham_scan_numpy(points)
+    elif engine != "python":
+        raise ValueError("Unknown graham_scan engine: " + str(engine))
+
+    points = unique_sorted(points)
+    if len(points) < 3:
+        return []
+
+    # Compute the upper hull
+    upper_hull = []
+    for p in points:
+        while len(upper_hull) >= 2 and orientation(upper_hull[-2], upper_hull[-1], p) == -1:
+            upper_hull.pop()  # Pop points that do not make a CCW turn
+        upper_hull.append(p)  # Push the current point onto the upper hull
+
+
+    # Compute the lower hull
+    lower_hull = []
+    for p in reversed(points):
+        while len(lower_hull) >= 2 and orientation(lower_hull[-2], lower_hull[-1], p) == -1:
+            lower_hull.pop()  # Pop points that do not make a CCW turn
+        lower_hull.append(p)  # Push the current point onto the lower hull
+
+    # Every point on both chains: they are all collinear, the hull is the segment of the extremes
+    if len(upper_hull) == len(lower_hull) == len(points):
+        return points[[0, -1]]
+
+    # Merge the upper and lower hulls to obtain the final convex hull
+    convex_hull = upper_hull[:-1] + lower_hull[:-1]
+    return np.array(convex_hull)
+
+
+#   Function to run the reference Graham's Scan once and record its push/pop events on the upper (stack 0) and
+#   lower (stack 1) chains, for the step-by-step animations. The trace's points are the sorted, distinct points
+def graham_scan_trace(points):
+    """
+    Args:
+        points: lexicographically sorted points
+    Returns:
+        Trace whose final polygon (upper chain then lower chain) is the hull of graham_scan as a closed ring
+        (the chains share their end points)
+    """
+    points = unique_sorted(points)
+    recorder = TraceRecorder(points, stack_names=("upper", "lower"))
+    coordinates = [tuple(point) for point in points.tolist()]
+
+    for stack, order in ((0, range(len(points))), (1, range(len(points) - 1, -1, -1))):
+        hull = []
+        for i in order:
+            while len(hull) >= 2 and orientation(coordinates[hull[-2]], coordinates[hull[-1]], coordinates[i]) == -1:
+                recorder.pop(hull.pop(), stack)  # Pop points that do not make a CCW turn
+            hull.append(i)
+            recorder.push(i, stack)  # Push the current point onto the chain
+    return recorder.finish()
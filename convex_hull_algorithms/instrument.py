@@ -0,0 +1,242 @@
+# Optional instrumentation of the algorithms: predicate counters, pops, recursion depths, Jarvis wrap steps
+# and per-phase timers. Nothing in the hot paths checks for it: entering 'instrument()' swaps the predicates
+# and the recursive functions of the package's modules for counting wrappers and leaving it puts the
+# originals back, so a run outside of an 'instrument()' block executes exactly the uninstrumented code
+
+import cProfile                                 # for the optional profile of the instrumented block
+import importlib                                # for the modules of the package
+import pstats                                   # for the statistics of that profile
+import sys                                      # for the loaded modules of the package
+import time                                     # for the phase timers
+from contextlib import contextmanager, nullcontext  # for the phase and instrument context managers
+from dataclasses import dataclass, field        # for the structured results
+
+import numpy as np                              # for counting the bulk pops
+
+from . import predicates
+
+# Instrumentation of the running 'instrument()' block (None when there is none)
+_active = None
+# Shared context of the phases when nothing is instrumented
+_NO_PHASE = nullcontext()
+
+
+@dataclass
+class Instrumentation:
+    """
+    Results of an 'instrument()' block.
+
+    orientation_tests: scalar orientation/determinant evaluations (orient2d, orient2d_det and everything
+                       built on them: orientation, determinant, Determinant, turn)
+    vectorized_orientation_tests: orientations evaluated by orient2d_array (or orient2d_array_int64), counted per element
+    pops: points popped from the Graham's Scan chains: the stack pops of the reference scan (and of the NumPy
+          engine's final scan) plus the points the NumPy engine's bulk passes remove. The column points that
+          'chain_candidates' skips before the scans are never pushed, so they are not pops
+    wrap_steps: next-vertex searches of the Jarvis march, both engines (one per hull vertex, the last one
+                finding the start point again)
+    max_recursion_depth: deepest recursion of each recursive function ("construct_hull", "QuickHull")
+    phases: seconds spent in each phase of convex_hull ("sort", "prefilter", "hull", "post-processing")
+    profile: pstats.Stats of the block, with instrument(profile=True)
+    """
+    orientation_tests: int = 0
+    vectorized_orientation_tests: int = 0
+    pops: int = 0
+    wrap_steps: int = 0
+    max_recursion_depth: dict = field(default_factory=dict)
+    phases: dict = field(default_factory=dict)
+    profile: pstats.Stats = None
+
+    # Function to get the results as a plain dict (e.g. for JSON)
+    def as_dict(self):
+        return {
+            "orientation_tests": self.orientation_tests,
+            "vectorized_orientation_tests": self.vectorized_orientation_tests,
+            "pops": self.pops,
+            "wrap_steps": self.wrap_steps,
+            "max_recursion_depth": dict(self.max_recursion_depth),
+            "phases": dict(self.phases),
+        }
+
+
+# Function to time a phase of a computation. Outside of an 'instrument()' block it returns a shared no-op context
+def phase(name):
+    if _active is None:
+        return _NO_PHASE
+    return _timed_phase(_active, name)
+
+
+@contextmanager
+def _timed_phase(results, name):
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        results.phases[name] = results.phases.get(name, 0.0) + time.perf_counter() - start_time
+
+
+# Wrappers installed by 'instrument()'. Their names match the wrapped functions, so a cProfile of the block
+# shows them next to the functions they count
+def _counting_orient2d(results):
+    orient2d = predicates.orient2d
+
+    def counted_orient2d(a, b, c):
+        results.orientation_tests += 1
+        return orient2d(a, b, c)
+    return counted_orient2d
+
+
+def _counting_orient2d_det(results):
+    orient2d_det = predicates.orient2d_det
+
+    def counted_orient2d_det(a, b, c):
+        results.orientation_tests += 1
+        return orient2d_det(a, b, c)
+    return counted_orient2d_det
+
+
+def _counting_orient2d_array(results):
+    orient2d_array = predicates.orient2d_array
+
+    def counted_orient2d_array(ax, ay, bx, by, cx, cy):
+        signs = orient2d_array(ax, ay, bx, by, cx, cy)
+        results.vectorized_orientation_tests += signs.size
+        return signs
+    return counted_orient2d_array
+
+
+def _counting_orient2d_array_int64(results):
+    orient2d_array_int64 = predicates.orient2d_array_int64
+
+    def counted_orient2d_array_int64(ax, ay, bx, by, cx, cy):
+        signs = orient2d_array_int64(ax, ay, bx, by, cx, cy)
+        results.vectorized_orientation_tests += signs.size
+        return signs
+    return counted_orient2d_array_int64
+
+
+# recursion goes through the module attribute, so the wrapper sees every level
+def _depth_tracking(results, function):
+    depth = 0
+
+    def tracked(*args, **kwargs):
+        nonlocal depth
+        depth += 1
+        deepest = results.max_recursion_depth.get(function.__name__, 0)
+        results.max_recursion_depth[function.__name__] = max(deepest, depth)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            depth -= 1
+    tracked.__name__ = function.__name__
+    return tracked
+
+
+# In the incremental module an orientation of -1 (orient2d_array > 0 in the bulk passes) always pops or removes
+# the middle point, so the pops are counted on the module's own predicates, on top of the orientation tests
+def _counting_pops(results, orientation):
+
+    def counted_orientation(p, q, r):
+        turn = orientation(p, q, r)
+        results.pops += turn == -1
+        return turn
+    counted_orientation.__name__ = orientation.__name__
+    return counted_orientation
+
+
+def _counting_array_pops(results, orient2d_array):
+
+    def counted_orient2d_array(ax, ay, bx, by, cx, cy):
+        signs = orient2d_array(ax, ay, bx, by, cx, cy)
+        results.pops += int(np.count_nonzero(signs > 0))
+        return signs
+    counted_orient2d_array.__name__ = orient2d_array.__name__
+    return counted_orient2d_array
+
+
+# each call of the step functions is one wrap step
+def _counting_wrap_steps(results, function):
+
+    def counted(*args, **kwargs):
+        results.wrap_steps += 1
+        return function(*args, **kwargs)
+    counted.__name__ = function.__name__
+    return counted
+
+
+# Function to list the (module, attribute, wrapper) replacements of an instrumented block
+def _replacements(results):
+    package = __name__.rpartition(".")[0]
+    modules = [module for name, module in list(sys.modules.items())
+               if module is not None and (name == package or name.startswith(package + ".")) and name != __name__]
+    wrappers = {
+        predicates.orient2d: _counting_orient2d(results),
+        predicates.orient2d_det: _counting_orient2d_det(results),
+        predicates.orient2d_array: _counting_orient2d_array(results),
+        predicates.orient2d_array_int64: _counting_orient2d_array_int64(results),
+    }
+    # the package exports functions named like some of its modules, so the modules are looked up by name
+    divide_and_conquer, geometry, incremental, quickhull, wrapping = (
+        importlib.import_module(package + "." + name)
+        for name in ("divide_and_conquer", "geometry", "incremental", "quickhull", "wrapping"))
+    wrappers[divide_and_conquer.construct_hull] = _depth_tracking(results, divide_and_conquer.construct_hull)
+    wrappers[quickhull.QuickHull] = _depth_tracking(results, quickhull.QuickHull)
+    wrappers[wrapping.next_hull_point] = _counting_wrap_steps(results, wrapping.next_hull_point)
+    wrappers[wrapping.wrap_step] = _counting_wrap_steps(results, wrapping.wrap_step)
+
+    # the incremental module's predicates count the pops too (wrapping the counted array predicates)
+    module_wrappers = {incremental: {
+        geometry.orientation: _counting_pops(results, geometry.orientation),
+        predicates.orient2d_array: _counting_array_pops(results, wrappers[predicates.orient2d_array]),
+        predicates.orient2d_array_int64: _counting_array_pops(results, wrappers[predicates.orient2d_array_int64]),
+    }}
+
+    replacements = []
+    for module in modules:
+        if module is predicates:
+            continue            # the predicates call each other, only the calls from the algorithms count
+        for name, value in list(vars(module).items()):
+            if callable(value) and value in module_wrappers.get(module, {}):
+                replacements.append((module, name, value, module_wrappers[module][value]))
+            elif callable(value) and value in wrappers:
+                replacements.append((module, name, value, wrappers[value]))
+    return replacements
+
+
+# Context manager that instruments the package's algorithms inside its block
+@contextmanager
+def instrument(profile=False):
+    """
+    Args:
+        profile: also run the block under cProfile (results.profile is then a pstats.Stats)
+    Returns:
+        context manager yielding an Instrumentation, filled when the block exits
+
+    Example:
+        with instrument() as results:
+            convex_hull(points, method="quickhull")
+        results.orientation_tests, results.max_recursion_depth, results.phases
+
+    The counters only see the calling process (not the workers of the parallel engines), and blocks cannot
+    be nested or run from several threads at once.
+    """
+    global _active
+    if _active is not None:
+        raise RuntimeError("instrument() blocks cannot be nested")
+
+    results = Instrumentation()
+    replacements = _replacements(results)
+    for module, name, original, wrapper in replacements:
+        setattr(module, name, wrapper)
+    _active = results
+    profiler = cProfile.Profile() if profile else None
+    try:
+        if profiler is not None:
+            profiler.enable()
+        yield results
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            results.profile = pstats.Stats(profiler)
+        _active = None
+        for module, name, original, wrapper in replacements:
+            setattr(module, name, original)
@@ -0,0 +1,48 @@
+# Terminal interaction of the scripts: banners, prompts and the random data they ask for.
+# Only the scripts import this module, the compute functions of the package never do.
+
+import time                                     # for the time-based seeds
+
+import numpy as np                              # for printing the points
+
+from .datasets import make_points
+
+
+# Function to print the banner of a script
+def print_banner(title):
+    print("\n------------------------------------------------------------------------------------")
+    print(title.center(84).rstrip())
+    print("------------------------------------------------------------------------------------\n")
+
+
+# Function to print a labelled block of points
+def print_points(label, points):
+    print("\n-------------------------" + label + "-------------------------\n")
+    print(np.array(points))
+
+
+# Function to ask the user for the number of points to examine
+def ask_num_of_points():
+    return int(input("How many points do you want to examine as per their Convex Hull? -> "))
+
+
+# Function to get the seed of a script's data: the given one, or a time-based one so that every run differs
+def script_seed(seed=None):
+    return int(time.time()) if seed is None else seed
+
+
+# Generate X random points in the unit square
+def random_points(num_of_points, dimensions=2, seed=None):
+    return make_points("uniform_square", num_of_points, script_seed(seed), dimensions)
+
+
+# Generate X random 3D points in the [-10, 10] cube
+def random_points_3d(num_of_points, seed=None):
+    return make_points("uniform_square", num_of_points, script_seed(seed), 3, bounds=(-10, 10))
+
+
+# Generate X random points with integer coordinates in [-100, 100] (wider when more than 201 points need unique
+# x-coordinates), as a list of (x, y) tuples. unique="x" gives every point its own x-coordinate
+def random_integer_points(num_of_points, unique="x", seed=None):
+    points = make_points("uniform_square", num_of_points, script_seed(seed), coordinates="int", unique=unique)
+    return [tuple(point) for point in points.tolist()]
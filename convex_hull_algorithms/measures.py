@@ -0,0 +1,281 @@
+# Measures of convex hulls: area, perimeter, centroid, and the rotating calipers measures (diameter, minimum width,
+# minimum-area and minimum-perimeter enclosing rectangles), for one hull or for many hulls in one vectorized call
+#
+# The calipers are computed for all the edges at once: the edge directions of a counterclockwise polygon have
+# increasing angles, so the vertices that the calipers of every edge touch (the farthest vertex from the edge,
+# the extreme vertices along it) are found by merging the sorted edge angles with the rotated ones in linear time
+# (see '_merge_ranks'), the vectorized form of advancing the caliper pointers one edge at a time
+
+import numpy as np                              # for math calculations on arrays
+
+from .batch import segment_starts
+from .predicates import orient2d_array
+
+# Results of 'batch_measures' (and keys of the dict of 'hull_measures')
+MEASURES = ("area", "perimeter", "centroid", "diameter", "diameter_pair", "width", "min_area", "min_area_rectangle",
+            "min_perimeter", "min_perimeter_rectangle")
+
+
+# Function to find the index of the next vertex of every vertex in its polygon (the last one goes back to the first)
+def _next_vertex(offsets):
+    following = np.arange(1, offsets[-1] + 1)
+    starts, ends = offsets[:-1], offsets[1:]
+    used = ends > starts
+    following[ends[used] - 1] = starts[used]
+    return following
+
+
+# Function to keep the vertices 'keep' of polygons. Returns their x, y, offsets and group of each vertex
+def _keep_vertices(x, y, group, keep, num_of_groups):
+    x, y, group = x[keep], y[keep], group[keep]
+    offsets = np.zeros(num_of_groups + 1, dtype=np.intp)
+    np.cumsum(np.bincount(group, minlength=num_of_groups), out=offsets[1:])
+    return x, y, offsets, group
+
+
+# Function to prepare the polygons for the measures: drop the repeated and the collinear vertices (so that the edge
+# angles strictly increase) and turn the clockwise polygons (e.g. the order graham_scan returns) counterclockwise.
+# Returns their x, y, offsets and group of each vertex
+def _polygons(x, y, offsets):
+    num_of_groups = len(offsets) - 1
+    group = np.repeat(np.arange(num_of_groups), np.diff(offsets))
+    following = _next_vertex(offsets)
+    keep = (x != x[following]) | (y != y[following])
+    keep[offsets[:-1][np.diff(offsets) > 0]] = True     # a polygon of one repeated point keeps one vertex
+    x, y, offsets, group = _keep_vertices(x, y, group, keep, num_of_groups)
+
+    following = _next_vertex(offsets)
+    previous = np.empty_like(following)
+    previous[following] = np.arange(len(x))
+    keep = orient2d_array(x[previous], y[previous], x, y, x[following], y[following]) != 0
+    keep |= (offsets[1:] - offsets[:-1])[group] < 3
+    # polygons of collinear points keep their two extreme points, the segment they span
+    flat = np.bincount(group, keep, minlength=num_of_groups)[group] == 0
+    if flat.any():
+        order = np.lexsort((y, x, group))
+        starts = segment_starts(group[order])
+        ends = np.append(starts[1:], len(order)) - 1
+        extremes = np.concatenate((order[starts], order[ends]))
+        keep[extremes[flat[extremes]]] = True
+    x, y, offsets, group = _keep_vertices(x, y, group, keep, num_of_groups)
+
+    # signed area (twice) of each polygon, relative to its first vertex
+    following = _next_vertex(offsets)
+    first = offsets[:-1][group]
+    dx, dy = x - x[first], y - y[first]
+    twice_area = np.bincount(group, dx * dy[following] - dy * dx[following], minlength=num_of_groups)
+    clockwise = (twice_area < 0)[group]
+    position = np.arange(len(x))
+    order = np.where(clockwise, offsets[:-1][group] + offsets[1:][group] - 1 - position, position)
+    return x[order], y[order], offsets, group
+
+
+# Function to compute the area, the perimeter and the centroid of counterclockwise polygons
+def _shoelace(x, y, offsets, group):
+    num_of_groups = len(offsets) - 1
+    following = _next_vertex(offsets)
+    first = offsets[:-1][group]
+    dx, dy = x - x[first], y - y[first]
+    dx_next, dy_next = dx[following], dy[following]
+    cross = dx * dy_next - dy * dx_next
+    twice_area = np.bincount(group, cross, minlength=num_of_groups)
+    perimeter = np.bincount(group, np.hypot(dx_next - dx, dy_next - dy), minlength=num_of_groups)
+
+    counts = np.bincount(group, minlength=num_of_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        centroid = np.stack((np.bincount(group, (dx + dx_next) * cross, minlength=num_of_groups),
+                             np.bincount(group, (dy + dy_next) * cross, minlength=num_of_groups)), axis=1)
+        centroid /= 3 * twice_area[:, None]
+        # polygons without area (a point or a segment): the mean of their vertices
+        flat = twice_area == 0
+        centroid[flat] = np.stack((np.bincount(group, dx, minlength=num_of_groups),
+                                   np.bincount(group, dy, minlength=num_of_groups)), axis=1)[flat] / counts[flat, None]
+    used = counts > 0
+    centroid[used] += np.stack((x[offsets[:-1][used]], y[offsets[:-1][used]]), axis=1)
+    return twice_area / 2, perimeter, centroid
+
+
+# Function to count, for every value of the sorted array 'queries', the values of the sorted array 'values' below it
+# (np.searchsorted(values, queries), without its log factor). The stable sort (timsort) of the two arrays one after
+# the other finds the two sorted runs and merges them in one linear sweep, the queries first among equal values
+def _merge_ranks(values, queries):
+    merged = np.argsort(np.concatenate((queries, values)), kind="stable")
+    return np.flatnonzero(merged < len(queries)) - np.arange(len(queries))
+
+
+# Function to find, for every edge of counterclockwise polygons, its unit direction and the vertices touched by the
+# calipers rotated by 'turns' (in quarter turns): the extreme vertex in the direction of the edge rotated by
+# turns * 90 degrees. Returns the unit directions (ux, uy) and one index array of vertices per turn
+def _calipers(x, y, offsets, group, turns=(0, 1, 2)):
+    following = _next_vertex(offsets)
+    dx, dy = x[following] - x, y[following] - y
+    length = np.hypot(dx, dy)
+    single = length == 0                                # the edge of a one-vertex polygon
+    ux = np.where(single, 1.0, dx / np.where(single, 1.0, length))
+    uy = np.where(single, 0.0, dy / np.where(single, 1.0, length))
+
+    # edge angles relative to the first edge of their polygon, in [0, 2 pi), non-decreasing, and each polygon
+    # shifted by 4 pi so that all the polygons are in one sorted array (and so are the rotated angles)
+    angle = np.arctan2(uy, ux)
+    starts = offsets[:-1][group]
+    relative = np.mod(angle - angle[starts], 2 * np.pi)
+    key = np.maximum.accumulate(relative + 4 * np.pi * group)
+
+    # every polygon twice (its angles, then its angles + 2 pi), so the rotated calipers never wrap around
+    position = np.arange(len(x))
+    doubled = np.empty(2 * len(x))
+    doubled[starts + position] = key
+    doubled[starts + position + offsets[1:][group] - starts] = key + 2 * np.pi
+    sizes = (offsets[1:] - offsets[:-1])[group]
+
+    touched = []
+    for turn in turns:
+        # the extreme vertex in the direction of angle a is the start of the first edge whose angle reaches a + pi/2
+        found = _merge_ranks(doubled, key + (turn + 1) * np.pi / 2) - 2 * starts
+        touched.append(starts + np.mod(found, sizes))
+    return ux, uy, touched
+
+
+# Function to compute the diameter (farthest pair of vertices) of counterclockwise polygons from their antipodal
+# pairs: vertex k is antipodal to the vertices from the farthest vertex of edge k - 1 to the farthest vertex of edge k
+def _diameters(x, y, offsets, group, farthest):
+    num_of_groups = len(offsets) - 1
+    starts, sizes = offsets[:-1][group], (offsets[1:] - offsets[:-1])[group]
+    previous = np.arange(-1, len(x) - 1)
+    previous[offsets[:-1][offsets[1:] > offsets[:-1]]] = offsets[1:][offsets[1:] > offsets[:-1]] - 1
+    first, last = farthest[previous] - starts, farthest - starts
+    counts = np.mod(last - first, sizes) + 1
+
+    vertex = np.repeat(np.arange(len(x)), counts)
+    step = np.arange(len(vertex)) - np.repeat(np.cumsum(counts) - counts, counts)
+    other = np.repeat(starts, counts) + np.mod(np.repeat(first, counts) + step, np.repeat(sizes, counts))
+    distance = np.hypot(x[other] - x[vertex], y[other] - y[vertex])
+
+    pair_group = group[vertex]
+    diameter = np.full(num_of_groups, -np.inf)
+    np.maximum.at(diameter, pair_group, distance)
+    best = _first_per_group(pair_group, distance == diameter[pair_group], num_of_groups)
+    return diameter, vertex[best], other[best]
+
+
+# Function to find the first index of each group where 'selected' is True (groups in increasing order)
+def _first_per_group(group, selected, num_of_groups):
+    candidates = np.flatnonzero(selected)
+    groups, first = np.unique(group[candidates], return_index=True)
+    result = np.zeros(num_of_groups, dtype=np.intp)
+    result[groups] = candidates[first]
+    return result
+
+
+# Function to compute the measures of many hulls in one vectorized call
+def batch_measures(points, hull_indices=None, hull_offsets=None):
+    """
+    Args:
+        points: (N, 2) array of points
+        hull_indices, hull_offsets: the hulls as returned by batch_hulls, hull g being
+            points[hull_indices[hull_offsets[g]:hull_offsets[g + 1]]] (default: points is a single hull)
+    Returns:
+        dict of arrays with one entry per hull (see MEASURES): "area", "perimeter", "centroid" (g, 2),
+        "diameter" and its two vertices "diameter_pair" (g, 2, 2), "width" (smallest distance between two parallel
+        supporting lines), "min_area" and "min_perimeter" with their rectangles "min_area_rectangle" and
+        "min_perimeter_rectangle" (g, 4, 2), counterclockwise corners. The hulls may be clockwise or counterclockwise,
+        empty hulls give NaN
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if hull_indices is None:
+        hull_indices = np.arange(len(points))
+        hull_offsets = np.array([0, len(points)])
+    hull_indices = np.asarray(hull_indices, dtype=np.intp)
+    hull_offsets = np.asarray(hull_offsets, dtype=np.intp)
+    num_of_groups = len(hull_offsets) - 1
+    if hull_offsets[-1] == 0:
+        shapes = {"centroid": (2,), "diameter_pair": (2, 2), "min_area_rectangle": (4, 2),
+                  "min_perimeter_rectangle": (4, 2)}
+        return {name: np.full((num_of_groups,) + shapes.get(name, ()), np.nan) for name in MEASURES}
+
+    x, y, offsets, group = _polygons(points[hull_indices, 0], points[hull_indices, 1], hull_offsets)
+    area, perimeter, centroid = _shoelace(x, y, offsets, group)
+    ux, uy, (along, farthest, behind) = _calipers(x, y, offsets, group)
+    diameter, pair_start, pair_end = _diameters(x, y, offsets, group, farthest)
+
+    # the rectangle of edge k: from the edge to its farthest vertex, between its extreme vertices along it
+    low = (x[behind] - x) * ux + (y[behind] - y) * uy
+    high = (x[along] - x) * ux + (y[along] - y) * uy
+    height = np.maximum((x[farthest] - x) * -uy + (y[farthest] - y) * ux, 0.0)
+    length = high - low
+    width = np.full(num_of_groups, np.inf)
+    np.minimum.at(width, group, height)
+
+    results = {"area": area, "perimeter": perimeter, "centroid": centroid, "diameter": diameter,
+               "diameter_pair": np.stack((np.stack((x[pair_start], y[pair_start]), axis=1),
+                                          np.stack((x[pair_end], y[pair_end]), axis=1)), axis=1),
+               "width": width}
+    for name, value in (("min_area", length * height), ("min_perimeter", 2 * (length + height))):
+        smallest = np.full(num_of_groups, np.inf)
+        np.minimum.at(smallest, group, value)
+        best = _first_per_group(group, value == smallest[group], num_of_groups)
+        corner = np.stack((x[best], y[best]), axis=1)
+        along_edge = np.stack((ux[best], uy[best]), axis=1)
+        normal = np.stack((-uy[best], ux[best]), axis=1)
+        start, end, rise = low[best, None] * along_edge, high[best, None] * along_edge, height[best, None] * normal
+        results[name] = smallest
+        results[name + "_rectangle"] = np.stack((corner + start, corner + end, corner + end + rise,
+                                                 corner + start + rise), axis=1)
+
+    # hulls without vertices have no measures
+    empty = offsets[1:] == offsets[:-1]
+    for name in MEASURES:
+        results[name] = results[name].astype(np.float64)
+        results[name][empty] = np.nan
+    return results
+
+
+# Function to compute all the measures of one hull ((h, 2) array of its vertices, in hull order) as a dict
+def hull_measures(hull):
+    return {name: value[0] for name, value in batch_measures(hull).items()}
+
+
+# Function to compute the area of a hull
+def hull_area(hull):
+    hull = np.asarray(hull, dtype=np.float64).reshape(-1, 2)
+    x, y, offsets, group = _polygons(hull[:, 0], hull[:, 1], np.array([0, len(hull)]))
+    return _shoelace(x, y, offsets, group)[0][0]
+
+
+# Function to compute the perimeter of a hull
+def hull_perimeter(hull):
+    hull = np.asarray(hull, dtype=np.float64).reshape(-1, 2)
+    x, y, offsets, group = _polygons(hull[:, 0], hull[:, 1], np.array([0, len(hull)]))
+    return _shoelace(x, y, offsets, group)[1][0]
+
+
+# Function to compute the centroid of the area of a hull (of its vertices for a point or a segment)
+def hull_centroid(hull):
+    return hull_measures(hull)["centroid"]
+
+
+# Function to compute the diameter of a hull: its largest distance between two points
+def diameter(hull):
+    return hull_measures(hull)["diameter"]
+
+
+# Function to compute the two vertices of a hull at the largest distance (its diameter)
+def farthest_pair(hull):
+    return hull_measures(hull)["diameter_pair"]
+
+
+# Function to compute the width of a hull: its smallest distance between two parallel supporting lines
+def width(hull):
+    return hull_measures(hull)["width"]
+
+
+# Function to compute the smallest-area rectangle enclosing a hull. Returns its (4, 2) corners and its area
+def min_area_rectangle(hull):
+    measures = hull_measures(hull)
+    return measures["min_area_rectangle"], measures["min_area"]
+
+
+# Function to compute the smallest-perimeter rectangle enclosing a hull. Returns its (4, 2) corners and its perimeter
+def min_perimeter_rectangle(hull):
+    measures = hull_measures(hull)
+    return measures["min_perimeter_rectangle"], measures["min_perimeter"]
@@ -0,0 +1,204 @@
+# Online incremental convex hulls, for points that arrive one by one or in batches (2D), or in batches (3D)
+
+from bisect import bisect_left                  # for the O(log h) search in the sorted chains
+
+import numpy as np                              # for math calculations on arrays
+
+from .geometry import lexicographic_sort
+from .incremental import graham_scan
+from .predicates import orient2d, orient2d_array
+from .quickhull_3d import QuickHull3D
+
+
+# Function to insert a point into a chain of the hull, kept as a list of (x, y) tuples in lexicographic order.
+# side=1 is the upper chain (points above it are outside), side=-1 the lower chain.
+# Returns False, without touching the chain, when the point is not outside of it
+def insert_into_chain(chain, point, side):
+
+    # O(log h) search of the chain edge below (or above) the point
+    i = bisect_left(chain, point)
+    if i < len(chain) and chain[i] == point:
+        return False
+    if 0 < i < len(chain) and side * orient2d(chain[i - 1], chain[i], point) <= 0:
+        return False
+
+    chain.insert(i, point)
+
+    # Pop the neighbours that no longer make a convex turn with the new point (amortized O(1))
+    while i >= 2 and side * orient2d(chain[i - 2], chain[i - 1], point) >= 0:
+        del chain[i - 1]
+        i = i - 1
+    while i + 2 < len(chain) and side * orient2d(point, chain[i + 1], chain[i + 2]) >= 0:
+        del chain[i + 1]
+    return True
+
+
+# Function to find, with one vectorized binary search, the points of (x, y) that are strictly between the
+# ends of a chain and not outside of it (below or on the upper chain, above or on the lower chain)
+def under_chain(chain, x, y, side):
+
+    if len(chain) < 2:
+        return np.zeros(len(x), dtype=bool)
+    chain_x = np.array([point[0] for point in chain], dtype=np.float64)
+    chain_y = np.array([point[1] for point in chain], dtype=np.float64)
+
+    inside = (x > chain_x[0]) & (x < chain_x[-1])
+    k = np.clip(np.searchsorted(chain_x, x, side="right"), 1, len(chain) - 1)
+    inside &= side * orient2d_array(chain_x[k - 1], chain_y[k - 1], chain_x[k], chain_y[k], x, y) <= 0
+    return inside
+
+
+class IncrementalHull2D:
+    """
+    Convex hull of a stream of 2D points. The hull is kept as its upper and lower chains in lexicographic
+    order, so a point is tested against the hull with a binary search in O(log h) and interior points are
+    skipped without modifying anything.
+
+    Example:
+        hull = IncrementalHull2D()
+        hull.insert((0.5, 0.5))
+        hull.insert_many(np.random.rand(1000000, 2))
+        hull.vertices       # (h, 2) array, in the order graham_scan returns the vertices
+    """
+
+    def __init__(self, points=None):
+        self.upper = []     # upper chain, from the leftmost to the rightmost point
+        self.lower = []     # lower chain, from the leftmost to the rightmost point
+        self.num_of_points = 0
+        self._vertices = None
+        if points is not None:
+            self.insert_many(points)
+
+    # Function to insert one point. Returns True if the point became a vertex of the hull
+    def insert(self, point):
+        point = (point[0], point[1])
+        if isinstance(point[0], np.generic):
+            point = (point[0].item(), point[1].item())
+        self.num_of_points += 1
+
+        # both calls must run: a point outside the hull may change one chain only
+        changed_upper = insert_into_chain(self.upper, point, 1)
+        changed_lower = insert_into_chain(self.lower, point, -1)
+        if changed_upper or changed_lower:
+            self._vertices = None
+            return True
+        return False
+
+    # Function to insert a batch of points. The points inside the current hull are dropped with one vectorized
+    # test, the rest is reduced to its own hull and only those vertices are inserted one by one.
+    # Returns the number of points of the batch that became vertices of the hull when they were inserted
+    def insert_many(self, points):
+        points = np.asarray(points)
+        if len(points) == 0:
+            return 0
+        self.num_of_points += len(points)
+
+        x = np.ascontiguousarray(points[:, 0], dtype=np.float64)
+        y = np.ascontiguousarray(points[:, 1], dtype=np.float64)
+        outside = ~(under_chain(self.upper, x, y, 1) & under_chain(self.lower, x, y, -1))
+        candidates = points[outside]
+        if len(candidates) >= 3:
+            reduced = graham_scan(lexicographic_sort(candidates), engine="numpy")
+            if len(reduced) > 0:
+                candidates = reduced
+
+        # the batch points were already counted
+        self.num_of_points -= len(candidates)
+        return sum(self.insert(point) for point in candidates.tolist())
+
+    # Function to test if a point is inside the hull or on its boundary, in O(log h)
+    def contains(self, point):
+        point = (point[0], point[1])
+        if not self.upper or point < self.upper[0] or point > self.upper[-1]:
+            return False
+        for chain, side in ((self.upper, 1), (self.lower, -1)):
+            i = bisect_left(chain, point)
+            if chain[i] != point and side * orient2d(chain[i - 1], chain[i], point) > 0:
+                return False
+        return True
+
+    # Vertices of the hull as a (h, 2) array, starting at the leftmost point, in the order graham_scan
+    # returns them. The array is cached until the hull changes
+    @property
+    def vertices(self):
+        if self._vertices is None:
+            self._vertices = np.array(self.upper + self.lower[-2:0:-1], dtype=np.float64).reshape(-1, 2)
+        return self._vertices
+
+    def __len__(self):
+        return len(self.vertices)
+
+
+class IncrementalHull3D:
+    """
+    Convex hull of a stream of 3D points that arrive in batches, on top of the native QuickHull3D.
+
+    Each batch is tested against the current facets in one vectorized pass; the points outside join the
+    outside sets (the facet-point conflict graph) of the facets they see, and only the facets visible from
+    the points that become vertices are replaced, instead of a rebuild of the whole hull. The points are
+    kept aside until they span a tetrahedron (the first batches of a sweep can be flat).
+
+    Example:
+        hull = IncrementalHull3D()
+        for batch in sweeps:
+            hull.add_points(batch)
+            vertices, triangles = hull.snapshot()
+    """
+
+    def __init__(self, points=None):
+        self.hull = None            # QuickHull3D once the points span a tetrahedron
+        self._pending = []          # points received before that
+        self.num_of_points = 0
+        self._snapshot = None
+        self._snapshot_version = None
+        if points is not None:
+            self.add_points(points)
+
+    # Function to add a batch of (k, 3) points. Returns the number of points of the batch that were outside of
+    # the hull when they were added
+    def add_points(self, points):
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        self.num_of_points += len(points)
+        if self.hull is not None:
+            return self.hull.add_points(points)
+
+        self._pending.append(points)
+        pending = np.concatenate(self._pending)
+        try:
+            self.hull = QuickHull3D(pending)
+        except ValueError:
+            # less than 4 points, or all of them on a plane
+            self._pending = [pending]
+            return len(points)
+        self._pending = []
+        return len(points)
+
+    # Function to get the current hull as (vertices, triangles): a (k, 3) array of the vertex coordinates and a
+    # (m, 3) array of triangles as indices into it, counterclockwise seen from outside. Both are read-only
+    # and cached until the hull changes, so taking a snapshot after every batch is cheap
+    def snapshot(self):
+        if self.hull is None:
+            return np.empty((0, 3)), np.empty((0, 3), dtype=np.intp)
+        if self._snapshot_version != self.hull.version:
+            simplices = self.hull.simplices
+            vertices, triangles = np.unique(simplices, return_inverse=True)
+            vertices = self.hull.points[vertices]
+            triangles = triangles.reshape(-1, 3)
+            vertices.flags.writeable = False
+            triangles.flags.writeable = False
+            self._snapshot = (vertices, triangles)
+            self._snapshot_version = self.hull.version
+        return self._snapshot
+
+    # Vertices of the hull as a (k, 3) array
+    @property
+    def vertices(self):
+        return self.snapshot()[0]
+
+    # Triangles of the hull as indices into 'vertices'
+    @property
+    def triangles(self):
+        return self.snapshot()[1]
+
+    def __len__(self):
+        return len(self.vertices)
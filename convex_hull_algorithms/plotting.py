@@ -0,0 +1,158 @@
+# Plotting of the convex hulls. matplotlib is imported inside the functions, so that importing this
+# module (or the package) does not pay for its startup time.
+#
+# Large point clouds are drawn with a level of detail: above LABEL_LIMIT points the per-point labels are
+# skipped, above DENSITY_LIMIT points the 2D points are rasterized into a density image and the 3D interior
+# points are decimated to a random sample, while the hull vertices and edges are always drawn as vectors.
+# 'render_hull_2d' and 'render_hull_3d' write PNG/SVG files without pyplot or a display (servers, batch jobs)
+
+import numpy as np                              # for math calculations on arrays
+
+# Largest number of points labelled 1..N
+LABEL_LIMIT = 1000
+# Largest number of points drawn one by one, above it the points are drawn as a density image (2D) or a sample (3D)
+DENSITY_LIMIT = 10000
+# Number of bins of the density image along each axis
+DENSITY_BINS = 512
+
+
+# Function to draw the 2D points and hull on matplotlib axes. labels and density are chosen from the number of
+# points when they are None
+def draw_hull_2d(ax, points, hull, title, labels=None, density=None, bins=DENSITY_BINS):
+    points = np.asarray(points)
+    hull = np.asarray(hull)
+    if labels is None:
+        labels = len(points) <= LABEL_LIMIT
+    if density is None:
+        density = len(points) > DENSITY_LIMIT
+
+    ax.set_title(title)
+    ax.set_xlabel("X")
+    ax.set_ylabel("Y")
+
+    # Plot the initial points
+    if density and len(points) > 0:
+        # one raster image of the point counts instead of one marker per point (log scale, so sparse areas show)
+        counts, x_edges, y_edges = np.histogram2d(points[:, 0], points[:, 1], bins=bins)
+        ax.imshow(np.log1p(counts.T), origin="lower", cmap="Blues", interpolation="nearest", aspect="auto",
+                  extent=(x_edges[0], x_edges[-1], y_edges[0], y_edges[-1]))
+    else:
+        ax.scatter(points[:, 0], points[:, 1], c="b", marker="o")
+    if labels:
+        for i in range(len(points)):
+            ax.text(points[i, 0], points[i, 1], str(i + 1), fontsize=12)
+
+    # Plot the convex hull edges, closing the polygon back to the first point
+    if len(hull) > 0:
+        ax.plot(np.append(hull[:, 0], hull[0, 0]), np.append(hull[:, 1], hull[0, 1]), "r-")
+        if density:
+            ax.scatter(hull[:, 0], hull[:, 1], c="r", marker="o", s=12, zorder=3)
+
+
+# Function to draw the 3D points and hull (any object with 'vertices' and 'simplices') on matplotlib 3D axes.
+# Above max_points, the interior points are decimated to a random sample of max_points points
+def draw_hull_3d(ax, points, hull, title, max_points=DENSITY_LIMIT, seed=0):
+    points = np.asarray(points)
+
+    # Set initial view angles for rotation interaction with mouse
+    ax.view_init(elev=30, azim=45)
+
+    ax.set_title(title)
+    ax.set_xlabel("X")
+    ax.set_ylabel("Y")
+    ax.set_zlabel("Z")
+
+    # Plot the inner points of the hull with a black border around the body
+    inner_points = np.setdiff1d(np.arange(len(points)), hull.vertices)
+    if max_points is not None and len(inner_points) > max_points:
+        rng = np.random.default_rng(seed)
+        inner_points = np.sort(rng.choice(inner_points, max_points, replace=False))
+        ax.scatter(points[inner_points, 0], points[inner_points, 1], points[inner_points, 2], c='red', marker='.',
+                   s=1, alpha=0.3)
+        drawn = hull.vertices
+    else:
+        ax.scatter(points[inner_points, 0], points[inner_points, 1], points[inner_points, 2], c='red', edgecolor='black', linewidths=3, marker='s', s=10)
+        drawn = np.arange(len(points))
+
+    # Plot the Convex Hull points with the same color but with no border
+    ax.scatter(points[drawn, 0], points[drawn, 1], points[drawn, 2], c='red', marker='X', s=10)
+
+    # the surface only needs the hull vertices, the triangles are renumbered into them
+    vertices, triangles = np.unique(hull.simplices, return_inverse=True)
+    vertices = points[vertices]
+    ax.plot_trisurf(vertices[:, 0], vertices[:, 1], vertices[:, 2], triangles=triangles.reshape(-1, 3), color='grey', alpha=0.35)
+
+
+# Function to plot a 2D set of points (labelled 1..N) and its convex hull as a closed red line
+def plot_hull_2d(points, hull, title, show=True, **options):
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots()
+    draw_hull_2d(ax, points, hull, title, **options)
+
+    if show:
+        plt.show()
+    return fig, ax
+
+
+# Function to plot a 3D set of points and its convex hull (any object with 'vertices' and 'simplices')
+def plot_hull_3d(points, hull, title, show=True, **options):
+    import matplotlib.pyplot as plt
+
+    # Plot the convex hull
+    fig = plt.figure()
+    ax = fig.add_subplot(111, projection='3d')
+    draw_hull_3d(ax, points, hull, title, **options)
+
+    # Enable mouse interaction
+    ax.mouse_init()
+
+    if show:
+        plt.show()
+    return fig, ax
+
+
+# Function to create a figure outside of pyplot: it is drawn by the Agg (PNG) or SVG backend of the file
+# it is saved to, so no GUI backend or display is needed
+def headless_figure(size=(8, 8)):
+    from matplotlib.figure import Figure
+
+    return Figure(figsize=size)
+
+
+# Function to write a 2D hull plot to a PNG or SVG file (from the extension of the path) without a display
+def render_hull_2d(points, hull, path, title="", dpi=150, size=(8, 8), **options):
+    """
+    Args:
+        points: (n, 2) array of points
+        hull: (h, 2) array of the hull vertices, in hull order
+        path: output file, .png or .svg
+        options: labels, density, bins (see draw_hull_2d)
+    Returns:
+        the matplotlib Figure
+    """
+    fig = headless_figure(size)
+    ax = fig.add_subplot(111)
+    draw_hull_2d(ax, points, hull, title, **options)
+    fig.savefig(path, dpi=dpi)
+    return fig
+
+
+# Function to write a 3D hull plot to a PNG or SVG file (from the extension of the path) without a display
+def render_hull_3d(points, hull, path, title="", dpi=150, size=(8, 8), **options):
+    """
+    Args:
+        points: (n, 3) array of points
+        hull: object with 'vertices' and 'simplices' (scipy's ConvexHull, QuickHull3D)
+        path: output file, .png or .svg
+        options: max_points, seed (see draw_hull_3d)
+    Returns:
+        the matplotlib Figure
+    """
+    from mpl_toolkits.mplot3d import Axes3D     # registers the '3d' projection
+
+    fig = headless_figure(size)
+    ax = fig.add_subplot(111, projection=Axes3D.name)
+    draw_hull_3d(ax, points, hull, title, **options)
+    fig.savefig(path, dpi=dpi)
+    return fig
@@ -0,0 +1,147 @@
+# Robust orientation predicate: a floating-point filter with an exact fallback for the uncertain triples.
+#
+# The filter is the one of Shewchuk's orient2d: the determinant is computed in float64 together with a bound
+# of its rounding error, and only when |det| is below that bound the sign is recomputed exactly with Python
+# integers (integer coordinates) or fractions (float coordinates, every float64 is an exact fraction).
+#
+# Integer inputs whose coordinates are all below INT64_SAFE_BOUND in magnitude skip the filter: their
+# determinants are computed exactly in int64 ('coordinate_columns' and 'orient2d_array_int64'). Larger integers
+# never go through int64 products (they overflow past 2**31): the filter converts them to float64, and the
+# coordinates beyond FLOAT_EXACT_BOUND (rounded by that conversion) go straight to the exact path.
+
+from fractions import Fraction                  # for exact arithmetic on float coordinates
+
+import numpy as np                              # for math calculations on arrays
+
+# relative error bound of the float64 determinant (Shewchuk's ccwerrboundA)
+EPSILON = 2.0 ** -53
+CCW_ERRBOUND_A = (3.0 + 16.0 * EPSILON) * EPSILON
+# integer coordinates below this magnitude have exact int64 determinants: the differences stay below 2**31,
+# their products below 2**62 and the difference of two products below 2**63
+INT64_SAFE_BOUND = 2 ** 30
+# integers above this magnitude are rounded by the float64 conversion, an error the filter's bound does not cover
+FLOAT_EXACT_BOUND = 2 ** 53
+
+
+# Function to convert a coordinate to an exact Python number (int or Fraction)
+def _exact(value):
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, int):
+        return value
+    return Fraction(value)
+
+
+# Function to compute the orientation determinant of points a, b, c exactly
+def orient2d_exact(ax, ay, bx, by, cx, cy):
+    ax, ay, bx, by, cx, cy = (_exact(value) for value in (ax, ay, bx, by, cx, cy))
+    return (ax - cx) * (by - cy) - (ay - cy) * (bx - cx)
+
+
+# Function to compute the orientation determinant of points a, b, c: positive if they make a counterclockwise
+# turn, negative for a clockwise turn and 0 if they are collinear. The sign of the returned value is always
+# exact, its magnitude is the float64 estimate (or the exact value when the filter could not decide)
+def orient2d_det(a, b, c):
+    # the filter runs in float64 whatever the type of the coordinates (numpy int64 products overflow silently)
+    ax, ay, bx, by, cx, cy = float(a[0]), float(a[1]), float(b[0]), float(b[1]), float(c[0]), float(c[1])
+    if max(abs(ax), abs(ay), abs(bx), abs(by), abs(cx), abs(cy)) > FLOAT_EXACT_BOUND:
+        # integers this large were rounded by the conversion, the bound does not cover that error
+        return orient2d_exact(a[0], a[1], b[0], b[1], c[0], c[1])
+    detleft = (ax - cx) * (by - cy)
+    detright = (ay - cy) * (bx - cx)
+    det = detleft - detright
+    if abs(det) > CCW_ERRBOUND_A * (abs(detleft) + abs(detright)):
+        return det
+    if detleft == 0 or detright == 0 or (detleft > 0) != (detright > 0):
+        return det      # no cancellation, the float64 sign is already right
+    return orient2d_exact(a[0], a[1], b[0], b[1], c[0], c[1])
+
+
+# Function to compute the exact orientation of points a, b, c: 1 counterclockwise, -1 clockwise, 0 collinear
+def orient2d(a, b, c):
+    det = orient2d_det(a, b, c)
+    return int(det > 0) - int(det < 0)
+
+
+# Function to find the point farthest from the line through a and b: the largest |orientation determinant|
+# (on either side of the line), the same choice the exact predicates would make. The float determinants only
+# shortlist the points within their rounding error of the maximum, which are then compared exactly; among equally
+# far points the lexicographically largest wins, an end of their edge
+def farthest_from_line(a, b, points):
+    ax, ay, bx, by = float(a[0]), float(a[1]), float(b[0]), float(b[1])
+    exact_only = max(abs(ax), abs(ay), abs(bx), abs(by)) > FLOAT_EXACT_BOUND
+    magnitudes, errors = [], []
+    for point in points:
+        cx, cy = float(point[0]), float(point[1])
+        detleft = (ax - cx) * (by - cy)
+        detright = (ay - cy) * (bx - cx)
+        magnitudes.append(abs(detleft - detright))
+        errors.append(CCW_ERRBOUND_A * (abs(detleft) + abs(detright)))
+        exact_only = exact_only or max(abs(cx), abs(cy)) > FLOAT_EXACT_BOUND
+    if exact_only:
+        shortlist = range(len(points))
+    else:
+        floor = max(magnitude - error for magnitude, error in zip(magnitudes, errors))
+        shortlist = [i for i in range(len(points)) if magnitudes[i] + errors[i] >= floor]
+    if len(shortlist) == 1:
+        return points[shortlist[0]]
+    exact = {i: abs(orient2d_exact(a[0], a[1], b[0], b[1], points[i][0], points[i][1])) for i in shortlist}
+    largest = max(exact.values())
+    return max((points[i] for i in shortlist if exact[i] == largest), key=lambda point: (point[0], point[1]))
+
+
+# Function to compute the exact orientation of many triples at once (coordinates as arrays or scalars).
+# Returns an int8 array of 1 (counterclockwise), -1 (clockwise) and 0 (collinear)
+def orient2d_array(ax, ay, bx, by, cx, cy):
+    detleft = (np.asarray(ax, dtype=np.float64) - cx) * (np.asarray(by, dtype=np.float64) - cy)
+    detright = (np.asarray(ay, dtype=np.float64) - cy) * (np.asarray(bx, dtype=np.float64) - cx)
+    det = detleft - detright
+    sign = np.sign(det).astype(np.int8)
+
+    # only the triples whose determinant is within the rounding error bound are recomputed exactly
+    uncertain = np.abs(det) <= CCW_ERRBOUND_A * (np.abs(detleft) + np.abs(detright))
+    uncertain &= (detleft > 0) & (detright > 0) | (detleft < 0) & (detright < 0)
+    # integers rounded by the float64 conversion are outside of the filter's bound, they are all recomputed
+    for value in (ax, ay, bx, by, cx, cy):
+        value = np.asarray(value)
+        if value.dtype.kind in "iu":
+            uncertain |= (value > FLOAT_EXACT_BOUND) | (value < -FLOAT_EXACT_BOUND)
+    if uncertain.any():
+        coordinates = np.broadcast_arrays(ax, ay, bx, by, cx, cy, sign)
+        for k in zip(*np.nonzero(uncertain)):
+            det = orient2d_exact(*(coordinate[k] for coordinate in coordinates[:6]))
+            sign[k] = int(det > 0) - int(det < 0)
+    return sign
+
+
+# Function to check whether the points have integer coordinates whose determinants are exact in int64
+def int64_safe(points):
+    points = np.asarray(points)
+    if points.dtype.kind not in "iu":
+        return False
+    if points.size == 0:
+        return True
+    # the bound is compared on the extremes, so that abs() of the most negative int64 cannot overflow
+    return int(points.min()) > -INT64_SAFE_BOUND and int(points.max()) < INT64_SAFE_BOUND
+
+
+# Function to get the x and y columns of (n, 2) points as contiguous arrays: int64 when the coordinates are
+# int64-safe integers (exact determinants, no float conversion), float64 otherwise
+def coordinate_columns(points):
+    points = np.asarray(points)
+    dtype = np.int64 if int64_safe(points) else np.float64
+    return np.ascontiguousarray(points[:, 0], dtype=dtype), np.ascontiguousarray(points[:, 1], dtype=dtype)
+
+
+# Function to compute the exact orientation determinants of many triples of int64-safe integer coordinates
+# (see 'int64_safe'), in int64 without any filter or float conversion
+def orient2d_det_int64(ax, ay, bx, by, cx, cy):
+    ax, ay, bx, by = (np.asarray(value, dtype=np.int64) for value in (ax, ay, bx, by))
+    return (ax - cx) * (by - cy) - (ay - cy) * (bx - cx)
+
+
+# Function to compute the exact orientation of many triples of int64-safe integer coordinates.
+# Returns an int8 array of 1 (counterclockwise), -1 (clockwise) and 0 (collinear), like 'orient2d_array'
+def orient2d_array_int64(ax, ay, bx, by, cx, cy):
+    return np.sign(orient2d_det_int64(ax, ay, bx, by, cx, cy)).astype(np.int8)
+
@@ -0,0 +1,60 @@
+# Akl-Toussaint interior point elimination, a preprocessing stage shared by all the 2D algorithms
+
+import numpy as np                              # for math calculations on arrays
+
+from .predicates import orient2d_array
+
+
+# Function to get 'directions' equally spaced unit directions, counterclockwise from the x axis, as a (k, 2) array
+def unit_directions(directions):
+    angles = 2 * np.pi * np.arange(directions) / directions
+    # exact 0 and +-1 for the axis directions
+    return np.stack((np.round(np.cos(angles), 15), np.round(np.sin(angles), 15)), axis=1)
+
+
+# Function to find the extreme points of a set of points along 'directions' equally spaced directions.
+# Returns the indices of the extreme points in CCW order, without consecutive repetitions
+def extreme_polygon(x, y, directions=8):
+
+    if directions < 3:
+        raise ValueError("The extreme polygon needs at least 3 directions, got " + str(directions))
+
+    dx, dy = unit_directions(directions).T
+
+    polygon = []
+    for j in range(directions):
+        extreme = int(np.argmax(dx[j] * x + dy[j] * y))
+        if not polygon or (x[extreme], y[extreme]) != (x[polygon[-1]], y[polygon[-1]]):
+            polygon.append(extreme)
+    while len(polygon) > 1 and (x[polygon[0]], y[polygon[0]]) == (x[polygon[-1]], y[polygon[-1]]):
+        polygon.pop()
+    return polygon
+
+
+# Function to discard the points strictly inside the polygon of the extreme points along 4, 8 or k directions.
+# Those points can never be vertices of the convex hull, so every algorithm can run on the survivors only
+def akl_toussaint(points, directions=8):
+    """
+    Args:
+        points: (n, 2) array-like of points
+        directions: number of equally spaced directions of the extreme polygon (4, 8 or any k >= 3)
+    Returns:
+        (indices of the points that survive, number of points removed)
+    """
+    points = np.asarray(points)
+    if len(points) < 4:
+        return np.arange(len(points)), 0
+
+    x = np.ascontiguousarray(points[:, 0], dtype=np.float64)
+    y = np.ascontiguousarray(points[:, 1], dtype=np.float64)
+    polygon = extreme_polygon(x, y, directions)
+    if len(polygon) < 3:
+        return np.arange(len(points)), 0
+
+    # a point is strictly inside the (CCW) polygon if it is strictly on the left of every edge
+    inside = np.ones(len(points), dtype=bool)
+    for a, b in zip(polygon, polygon[1:] + polygon[:1]):
+        inside &= orient2d_array(x[a], y[a], x[b], y[b], x, y) > 0
+
+    kept = np.flatnonzero(~inside)
+    return kept, len(points) - len(kept)
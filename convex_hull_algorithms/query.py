@@ -0,0 +1,229 @@
+# Point-in-hull queries on a computed hull: a wedge (fan) index of a 2D convex polygon with an exact binary search
+# per query, and a facet halfspace index of a 3D hull. Both classify one point or a whole batch at once
+
+import numpy as np                              # for math calculations on arrays
+
+from .geometry import order_hull
+from .predicates import int64_safe, orient2d, orient2d_array, orient2d_array_int64
+from .quickhull_3d import DISTANCE_TOLERANCE, MAX_BLOCK, cross
+
+# Classes of the queries
+INSIDE = 1
+BOUNDARY = 0
+OUTSIDE = -1
+# Largest number of query points classified in one pass of the 2D batch search
+QUERY_BLOCK = 1 << 20
+
+
+class HullIndex2D:
+    """
+    Point-in-hull index of a 2D convex hull, built from the output of any 2D method (an array or list of the
+    hull vertices, in any order, with or without collinear points or a repeated first point).
+
+    The polygon is kept counterclockwise from its lexicographically smallest vertex v0 and split into the fan of
+    wedges v0, v[k], v[k + 1]. A query binary searches its wedge with orientation tests against the rays v0 -> v[k]
+    and then tests the single edge v[k] -> v[k + 1]: O(log h) exact orientations per point. 'classify_many' runs
+    the same search on a whole batch at once, one vectorized orientation pass per level of the search.
+
+    Example:
+        index = HullIndex2D(convex_hull(points))
+        index.contains((0.5, 0.5))
+        index.classify_many(queries)     # 1 inside, 0 on the boundary, -1 outside
+    """
+
+    def __init__(self, hull):
+        hull = np.asarray(hull)
+        if hull.size == 0:
+            hull = hull.reshape(0, 2)
+
+        # graham order (clockwise from the smallest vertex), reversed into counterclockwise
+        ordered = order_hull(hull)
+        if len(ordered) >= 3:
+            hull = np.vstack((ordered[:1], ordered[:0:-1]))
+            # drop the vertices collinear with their two neighbours, the wedges must turn strictly
+            previous, following = np.roll(hull, 1, axis=0), np.roll(hull, -1, axis=0)
+            turns = orient2d_array(previous[:, 0], previous[:, 1], hull[:, 0], hull[:, 1],
+                                   following[:, 0], following[:, 1])
+            hull = hull[turns != 0]
+            if len(hull) < 3:
+                # all the points are collinear: the hull is the segment of the extremes
+                extremes = np.unique(ordered, axis=0)
+                hull = extremes[[0, -1]]
+        else:
+            hull = ordered
+        self.vertices = hull
+        self._integer = int64_safe(hull)
+
+    def __len__(self):
+        return len(self.vertices)
+
+    def __contains__(self, point):
+        return self.contains(point)
+
+    # Function to classify a point: INSIDE (1), BOUNDARY (0) or OUTSIDE (-1), with O(log h) exact orientations
+    def classify(self, point):
+        vertices = self.vertices
+        point = tuple(point)
+        if len(vertices) < 3:
+            return int(self._classify_degenerate(np.array([point]))[0])
+
+        v0 = vertices[0]
+        first = orient2d(v0, vertices[1], point)
+        last = orient2d(v0, vertices[-1], point)
+        if first < 0 or last > 0:
+            return OUTSIDE
+
+        # largest k in [1, h - 2] with the point on the left of (or on) the ray v0 -> v[k]
+        low, high = 1, len(vertices) - 1
+        while high - low > 1:
+            middle = (low + high) // 2
+            if orient2d(v0, vertices[middle], point) >= 0:
+                low = middle
+            else:
+                high = middle
+        edge = orient2d(vertices[low], vertices[low + 1], point)
+        if edge < 0:
+            return OUTSIDE
+        if edge == 0 or first == 0 or last == 0:
+            return BOUNDARY
+        return INSIDE
+
+    # Function to check whether a point is in the hull (on its boundary too, unless boundary=False)
+    def contains(self, point, boundary=True):
+        return self.classify(point) >= (BOUNDARY if boundary else INSIDE)
+
+    # Function to classify an (n, 2) array of points at once. Returns an int8 array of INSIDE, BOUNDARY, OUTSIDE
+    def classify_many(self, points):
+        points = np.asarray(points)
+        if points.size == 0:
+            return np.empty(0, dtype=np.int8)
+        if len(self.vertices) < 3:
+            return self._classify_degenerate(points)
+
+        # exact int64 orientations when both the hull and the queries are int64-safe integers
+        if self._integer and int64_safe(points):
+            vertices, points, orient = self.vertices.astype(np.int64), points.astype(np.int64), orient2d_array_int64
+        else:
+            vertices, points, orient = self.vertices.astype(np.float64), points.astype(np.float64), orient2d_array
+        classes = np.empty(len(points), dtype=np.int8)
+        for start in range(0, len(points), QUERY_BLOCK):
+            block = points[start:start + QUERY_BLOCK]
+            classes[start:start + len(block)] = self._classify_block(vertices, block, orient)
+        return classes
+
+    # Function to check which points of an (n, 2) array are in the hull (on its boundary too, unless boundary=False)
+    def contains_many(self, points, boundary=True):
+        return self.classify_many(points) >= (BOUNDARY if boundary else INSIDE)
+
+    # Function to run the wedge search on a block of query points, every level of the search as one vectorized pass
+    @staticmethod
+    def _classify_block(vertices, points, orient):
+        x, y = np.ascontiguousarray(points[:, 0]), np.ascontiguousarray(points[:, 1])
+        v0x, v0y = vertices[0]
+        first = orient(v0x, v0y, vertices[1, 0], vertices[1, 1], x, y)
+        last = orient(v0x, v0y, vertices[-1, 0], vertices[-1, 1], x, y)
+
+        low = np.ones(len(points), dtype=np.intp)
+        high = np.full(len(points), len(vertices) - 1, dtype=np.intp)
+        for _ in range(int(np.ceil(np.log2(len(vertices) - 1)))):
+            middle = (low + high) // 2
+            left = orient(v0x, v0y, vertices[middle, 0], vertices[middle, 1], x, y) >= 0
+            low = np.where(left, middle, low)
+            high = np.where(left, high, middle)
+        edge = orient(vertices[low, 0], vertices[low, 1], vertices[low + 1, 0], vertices[low + 1, 1], x, y)
+
+        classes = np.full(len(points), INSIDE, dtype=np.int8)
+        classes[(edge == 0) | (first == 0) | (last == 0)] = BOUNDARY
+        classes[(edge < 0) | (first < 0) | (last > 0)] = OUTSIDE
+        return classes
+
+    # Function to classify points against a hull of less than 3 vertices (empty, a point or a segment)
+    def _classify_degenerate(self, points):
+        classes = np.full(len(points), OUTSIDE, dtype=np.int8)
+        if len(self.vertices) == 0:
+            return classes
+        a, b = self.vertices[0], self.vertices[-1]
+        x, y = points[:, 0], points[:, 1]
+        on_line = orient2d_array(a[0], a[1], b[0], b[1], x, y) == 0
+        # the vertices are sorted, so a point of the line is on the segment when it is between them in x and y
+        between = ((x >= min(a[0], b[0])) & (x <= max(a[0], b[0])) & (y >= min(a[1], b[1])) & (y <= max(a[1], b[1])))
+        classes[on_line & between] = BOUNDARY
+        return classes
+
+
+class HullIndex3D:
+    """
+    Point-in-hull index of a 3D convex hull, built from its triangles ('simplices', as indices into 'points').
+
+    Every triangle gives the halfspace of its supporting plane, with a unit outward normal, and a point is in the
+    hull when it is in all of them: its largest signed distance to the planes decides, compared with 'tolerance'
+    (by default relative to the size of the coordinates, like QuickHull3D). A batch is classified with one matrix
+    product of the points and the normals per block of points.
+
+    Example:
+        index = HullIndex3D.from_hull(quickhull_3d(points))
+        index.classify_many(queries)     # 1 inside, 0 on the boundary, -1 outside
+    """
+
+    def __init__(self, points, simplices, tolerance=None):
+        points = np.asarray(points, dtype=np.float64)
+        simplices = np.asarray(simplices, dtype=np.intp).reshape(-1, 3)
+        a, b, c = points[simplices[:, 0]], points[simplices[:, 1]], points[simplices[:, 2]]
+        normals = cross(b - a, c - a)
+        lengths = np.linalg.norm(normals, axis=1)
+        keep = lengths > 0                                  # degenerate (zero area) triangles have no plane
+        normals = normals[keep] / lengths[keep, None]
+        a = a[keep]
+        if len(normals) == 0:
+            raise ValueError("A 3D hull index needs at least one non-degenerate triangle")
+
+        # orient the normals away from an interior point (the mean of the hull vertices)
+        interior = points[np.unique(simplices)].mean(axis=0)
+        inward = np.einsum("ij,ij->i", normals, interior - a) > 0
+        normals[inward] = -normals[inward]
+        self.normals = normals
+        self.offsets = np.einsum("ij,ij->i", normals, a)    # distance of point p to the plane: normal @ p - offset
+        if tolerance is None:
+            tolerance = DISTANCE_TOLERANCE * np.abs(points[np.unique(simplices)]).max(axis=0).sum()
+        self.tolerance = tolerance
+
+    # Function to build the index of a hull object with 'points' and 'simplices' (scipy's ConvexHull, QuickHull3D)
+    @classmethod
+    def from_hull(cls, hull, tolerance=None):
+        return cls(hull.points, hull.simplices, tolerance)
+
+    def __len__(self):
+        return len(self.normals)
+
+    def __contains__(self, point):
+        return self.contains(point)
+
+    # Function to get the largest signed distance of each point of an (n, 3) array to the planes of the facets
+    def distances(self, points):
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        largest = np.empty(len(points))
+        block = max(1, MAX_BLOCK // len(self.normals))
+        for start in range(0, len(points), block):
+            distances = points[start:start + block] @ self.normals.T - self.offsets
+            largest[start:start + block] = distances.max(axis=1)
+        return largest
+
+    # Function to classify an (n, 3) array of points at once. Returns an int8 array of INSIDE, BOUNDARY, OUTSIDE
+    def classify_many(self, points):
+        distances = self.distances(points)
+        classes = np.full(len(distances), BOUNDARY, dtype=np.int8)
+        classes[distances < -self.tolerance] = INSIDE
+        classes[distances > self.tolerance] = OUTSIDE
+        return classes
+
+    # Function to classify a point: INSIDE (1), BOUNDARY (0) or OUTSIDE (-1)
+    def classify(self, point):
+        return int(self.classify_many(point)[0])
+
+    # Function to check whether a point is in the hull (on its boundary too, unless boundary=False)
+    def contains(self, point, boundary=True):
+        return self.classify(point) >= (BOUNDARY if boundary else INSIDE)
+
+    # Function to check which points of an (n, 3) array are in the hull (on its boundary too, unless boundary=False)
+    def contains_many(self, points, boundary=True):
+        return self.classify_many(points) >= (BOUNDARY if boundary else INSIDE)
@@ -0,0 +1,541 @@
+# Quick Hull algorithm in 2D
+
+import multiprocessing              # for the work-stealing worker processes
+import os                           # for the number of cores
+import queue                        # for the timeouts of the result queue
+import traceback                    # for the errors of the worker processes
+from multiprocessing import shared_memory   # for sharing the coordinates with the workers
+
+import numpy as np                  # for math calculations on arrays
+
+from .predicates import (CCW_ERRBOUND_A, coordinate_columns, farthest_from_line, orient2d_array, orient2d_array_int64,
+                         orient2d_det, orient2d_exact)
+
+# Function to calculate distance between 2 points
+def Point_Distance(point1, point2):
+    difference = ((point1[0]-point2[0])**2) + ((point1[1]-point2[1])**2)
+    distance = difference**(1/2)
+    return distance
+
+
+# Function to find the line equation if we know 2 points of it
+def Line(point1, point2):
+    equal = []
+    x = point1[1] - point2[1]
+    equal.append(x)
+    y = point2[0] - point1[0]
+    equal.append(y)
+    c = (point2[1]*point1[0]) - (point1[1]*point2[0])
+    equal.append(c)
+    return equal
+
+
+# Function to calculate distance of a point to a line
+def Distance_Point_to_Line (point, line):
+    counter = abs((line[0]*point[0]) + (line[1]*point[1]) + (line[2]))
+    denominator = (line[0]**2 + line[1]**2)**(1/2)
+    distance = counter/denominator
+    return distance
+
+
+# Function to find the farthest point from a reference point
+# (the distances to the line share their denominator, so only the numerators are compared: shortlisted in floats,
+# decided exactly, see 'farthest_from_line', so the choice agrees with the exact splits of 'Delete_Point')
+def Farthest_Point(point1, point2, points):
+    max_point = farthest_from_line(point1, point2, points)
+    return max_point
+
+
+# Function to find whether the point is above or below the reference line
+# (its sign comes from the robust predicate, so points on the line give exactly 0)
+def Determinant(point1, point2, point3):
+    det = orient2d_det(point1, point2, point3)
+    return det
+
+
+# function to delete any points from the list of 'points' that are inside the left_point, right_point and PointFar
+# because if a point is inside the triangle of 3 other points, then it does not belong to the convex hull
+def Delete_Point(left_point, right_point, PointFar, points):
+
+    # Create two empty lists to store the points to the left and right of PointFar, respectively
+    list_left = []
+    list_right = []
+
+    # Iterate over each point in the input 'points' list
+    for point in points:
+
+        # Determine if the point is to the left of the line formed by left_point and PointFar
+        if (Determinant(left_point, PointFar, point) > 0):
+            list_left.append(point)
+
+    # Iterate over each point in the input 'points' list (again)
+    for point in points:
+
+        # Determine if the point is to the right of the line formed by PointFar and right_point
+        if (Determinant(PointFar, right_point, point) > 0):
+            list_right.append(point)
+
+    i = 0   # counter
+
+    while (len(points) != 0 and (i < len(points))):
+        if (len(list_left) != 0 and len(list_right)!=0):
+
+            # If both 'list_left' and 'list_right' are non-empty, remove points that are not in either list
+            if (not (points[i] in list_right)  and not (points[i] in list_left)):
+
+                points.pop(i)   # If the point is not in either list, remove it from 'points'
+            else:
+                i = i+1 # If the point is in either list, move on to the next point
+
+        elif (len(list_left) == 0 and len(list_right) != 0):
+
+            # If 'list_left' is empty but 'list_right' is not, remove points that are not in 'list_right'
+            if (not (points[i] in list_right)) :
+                points.pop(i)   # If the point is not in 'list_right', remove it from 'points'
+            else:
+                i = i+1 # If the point is in 'list_right', move on to the next point
+
+        elif (len(list_right) == 0 and len(list_left) != 0):
+
+            # If 'list_right' is empty but 'list_left' is not, remove points that are not in 'list_left'
+            if (not points[i] in list_left):
+                points.pop(i)   # If the point is not in 'list_left', remove it from 'points'
+            else:
+                i = i + 1   # If the point is in 'list_left', move on to the next point
+        else:
+            points.pop(i)   # If both 'list_left' and 'list_right' are empty, remove all points in 'points'
+
+
+# Quick Hull function
+def QuickHull(left_point, max_point, right_point, points):
+
+    hull = []
+    points.sort()
+    if (len(points) == 0):
+        hull.append(max_point)
+        return hull
+    elif (len(points) == 1):
+        hull.append(max_point)
+        hull.append(points[0])
+        points.pop(0)
+        return hull
+    elif (len(points) > 1):
+        hull.append(max_point)
+        # Separate the points into two lists, one for the outer points and one for the inner points
+        inner_point = []
+        outer_point = []
+        for point in (points) :
+            det = Determinant(left_point, max_point, point)
+            if (det > 0):
+                outer_point.append(point)
+            elif (det < 0):
+                inner_point.append(point)
+
+        LeftHull = []
+        RightHull = []
+
+        # If there are outer points, find the farthest point from the left edge and recursively find the left hull
+        if (len(outer_point) > 0 ):
+            Far_Left_Point = Farthest_Point(left_point, max_point, outer_point)
+            Delete_Point(left_point, max_point, Far_Left_Point, outer_point)
+            LeftHull = QuickHull(left_point, Far_Left_Point,max_point, outer_point)
+
+        # If there are inner points, find the farthest point from the right edge and recursively find the right hull
+        if (len(inner_point) > 0 ):
+            Far_Right_Point = Farthest_Point(max_point, right_point, inner_point)
+            Delete_Point(max_point, right_point, Far_Right_Point, inner_point)
+            RightHull = QuickHull(max_point, Far_Right_Point, right_point, inner_point)
+
+        # Add the left and right hulls to the main hull list
+        hull = hull + LeftHull + RightHull
+        return hull
+
+
+def SortHull(list_hull):
+
+    hull = []
+    # Assigning first two points as left and right points
+    left_point = list_hull[0]
+    right_point = list_hull[1]
+    list_hull.remove(left_point)
+    # Appending right point to hull and setting up for lower hull
+    hull.append(right_point)
+    lower_hull = []
+
+    # Iterating over remaining points in list_hull
+    for point in list_hull:
+        det = Determinant(left_point, right_point, point)
+        # If point is to the right of the line formed by left and right point, append to hull
+        if (det > 0):
+            hull = [point] + hull
+        # If point is to the left of the line formed by left and right point, append to lower_hull
+        elif (det < 0):
+            lower_hull.append(point)
+
+    # Sorting both hull and lower_hull based on x-coordinate
+    lower_hull.sort()
+    hull.sort()
+
+    # Reversing the order of points in lower_hull
+    lower_hull = list(reversed(lower_hull))
+
+    # Combining all points to form a complete hull and returning it
+    hull = [left_point] + hull + lower_hull + [left_point]
+
+    return (hull)
+
+
+# Function to split the candidates of the directed segment a -> b (indices of the points strictly on its left)
+# at their farthest point 'far'. Returns far and the candidates strictly on the left of a -> far and of
+# far -> b, in their original order: the points inside the triangle a, far, b are dropped
+def quickhull_split(x, y, a, b, candidates):
+
+    orient = orient2d_array_int64 if x.dtype == np.int64 else orient2d_array
+    far = farthest_candidate(x, y, a, b, candidates)
+
+    # split the rest of the candidates with boolean masks. With the exact farthest point no candidate is on the
+    # left of both a -> far and far -> b (it would be farther), the second mask excludes the first anyway
+    fx, fy = x[far], y[far]
+    cx, cy = x[candidates], y[candidates]
+    left_of_a_far = orient(x[a], y[a], fx, fy, cx, cy) > 0
+    left_of_far_b = (orient(fx, fy, x[b], y[b], cx, cy) > 0) & ~left_of_a_far
+    return far, candidates[left_of_a_far], candidates[left_of_far_b]
+
+
+# Function to find the candidate farthest from the line a -> b, consistently with the exact orientations.
+# The unnormalized cross product is proportional to the distance from the line (no square root, computed once
+# per point). In int64 it is exact; in float64 the candidates within its rounding error of the maximum are
+# compared exactly. Among equally far candidates (on a parallel to a -> b) the lexicographically largest wins,
+# an end of that edge, so the other ones are not taken for vertices
+def farthest_candidate(x, y, a, b, candidates):
+
+    ax, ay, bx, by = x[a], y[a], x[b], y[b]
+    cx, cy = x[candidates], y[candidates]
+    detleft = (bx - ax) * (cy - ay)
+    detright = (by - ay) * (cx - ax)
+    cross = detleft - detright
+    if x.dtype == np.int64:
+        best = np.flatnonzero(cross == cross.max())
+    else:
+        error = CCW_ERRBOUND_A * (np.abs(detleft) + np.abs(detright))
+        best = np.flatnonzero(cross + error >= (cross - error).max())
+        if len(best) > 1:
+            exact = [orient2d_exact(ax, ay, bx, by, x[i], y[i]) for i in candidates[best].tolist()]
+            largest = max(exact)
+            best = best[[value == largest for value in exact]]
+    if len(best) > 1:
+        best = best[np.lexsort((cy[best], cx[best]))[-1:]]
+    return candidates[best[0]]
+
+
+# Function to find the hull vertices strictly on the left of the directed segment a -> b, in hull order.
+# 'candidates' are the indices of the points strictly on the left of a -> b. Instead of recursing, the
+# subproblems are kept on an explicit work stack, so hulls with every point on them (e.g. points on a
+# circle) cannot hit Python's recursion limit. Each entry is either a segment to split or a vertex to emit,
+# pushed in reverse so that the vertices come out in order (left part, farthest point, right part).
+# With int64 columns (see 'coordinate_columns') every cross product and orientation is exact integer arithmetic.
+def quickhull_chain(x, y, a, b, candidates):
+
+    chain = []
+    stack = [(a, b, candidates)]
+    while stack:
+        a, b, candidates = stack.pop()
+        if b is None:
+            chain.append(a)         # vertex entry
+            continue
+        if len(candidates) <= 1:
+            chain.extend(candidates.tolist())   # a single point strictly outside a -> b is a hull vertex
+            continue
+
+        far, left, right = quickhull_split(x, y, a, b, candidates)
+        stack.append((far, b, right))
+        stack.append((far, None, None))
+        stack.append((a, far, left))
+    return chain
+
+
+# Function to compute the indices of the convex hull vertices with boolean masks over index arrays.
+# The vertices are in the order 'graham_scan' returns them: leftmost point, upper chain, rightmost point, lower chain.
+# Integer points within the int64-safe range are processed in int64 end to end (bit-exact, no float conversion)
+def quickhull_indices(points):
+
+    points = np.asarray(points)
+    x, y = coordinate_columns(points)
+    orient = orient2d_array_int64 if x.dtype == np.int64 else orient2d_array
+    if len(points) == 0:
+        return np.empty(0, dtype=np.intp)
+
+    # leftmost point (minimum x, then minimum y) and rightmost point (maximum x, then maximum y)
+    order = np.flatnonzero(x == x.min())
+    left_point = order[np.argmin(y[order])]
+    order = np.flatnonzero(x == x.max())
+    right_point = order[np.argmax(y[order])]
+    if x[left_point] == x[right_point] and y[left_point] == y[right_point]:
+        return np.array([left_point])
+
+    # Divide points into 2 areas, namely the upper area and the lower area of the line left_point -> right_point
+    indices = np.arange(len(points))
+    side = orient(x[left_point], y[left_point], x[right_point], y[right_point], x, y)
+    upper = quickhull_chain(x, y, left_point, right_point, indices[side > 0])
+    lower = quickhull_chain(x, y, right_point, left_point, indices[side < 0])
+
+    return np.array([left_point] + upper + [right_point] + lower, dtype=np.intp)
+
+
+# Function to solve the subproblem a -> b whose candidates are index[start:end], like 'quickhull_chain' but on a
+# shared index buffer: each split writes the candidates of its two parts back into its own range (left part first),
+# so the subproblems are disjoint ranges of the buffer and are described by 4 integers. A part larger than
+# 'cutoff' points is handed to 'publish' (which returns its task id, or None to keep it local); the returned
+# items are hull vertices (ints) and the ids of the published tasks (tuples), in hull order
+def quickhull_range(x, y, index, a, b, start, end, cutoff=None, publish=None):
+
+    items = []
+    stack = [(a, b, start, end)]
+    first = True
+    while stack:
+        a, b, start, end = stack.pop()
+        if b is None:
+            items.append(a)         # vertex entry
+            continue
+        if end - start <= 1:
+            items.extend(index[start:end].tolist())
+            continue
+        if not first and publish is not None and end - start > cutoff:
+            task = publish(a, b, start, end)
+            if task is not None:
+                items.append(task)
+                continue
+        first = False
+
+        far, left, right = quickhull_split(x, y, a, b, index[start:end])
+        middle = start + len(left)
+        index[start:middle] = left
+        index[middle:middle + len(right)] = right
+        stack.append((far, b, middle, middle + len(right)))
+        stack.append((far, None, None, None))
+        stack.append((a, far, start, middle))
+    return items
+
+
+# Function to view the shared memory block of the parallel quickhull as its x, y and index columns
+def _shared_columns(block, num_of_points, dtype):
+    columns = np.ndarray((2, num_of_points), dtype=dtype, buffer=block.buf)
+    index = np.ndarray(num_of_points, dtype=np.int64, buffer=block.buf, offset=2 * num_of_points * 8)
+    return columns[0], columns[1], index
+
+
+# Function that each worker process of 'parallel_quickhull_indices' runs. The tasks come from one shared queue;
+# 'idle' counts the workers waiting on it that no task has been promised to yet. While solving a task, a worker
+# keeps the parts of at most 'cutoff' points local and gives a larger part away (puts it on the queue) only when
+# some worker is idle, claiming that worker: the idle workers steal the large subproblems of the busy ones
+def _quickhull_worker(worker, name, num_of_points, dtype, cutoff, tasks, results, idle):
+    block = shared_memory.SharedMemory(name=name)
+    x, y, index = _shared_columns(block, num_of_points, dtype)
+    published = []
+    count = 0
+
+    def publish(a, b, start, end):
+        nonlocal count
+        with idle.get_lock():
+            if idle.value <= 0:
+                return None
+            idle.value -= 1
+        count += 1
+        task = (worker, count)
+        published.append(task)
+        tasks.put((task, a, b, start, end, True))
+        return task
+
+    try:
+        while True:
+            with idle.get_lock():
+                idle.value += 1
+            message = tasks.get()
+            if message is None:
+                break
+            task, a, b, start, end, claimed = message
+            if not claimed:
+                with idle.get_lock():
+                    idle.value -= 1
+            published = []
+            try:
+                items = quickhull_range(x, y, index, a, b, start, end, cutoff, publish)
+            except Exception:
+                results.put((task, None, traceback.format_exc()))
+                break
+            results.put((task, items, published))
+    finally:
+        del x, y, index
+        block.close()
+
+
+# Function to compute the indices of the convex hull vertices (like 'quickhull_indices') on several processes.
+# The coordinates and the candidate index buffer are written once into shared memory; the subproblems are index
+# ranges of that buffer, scheduled on the worker processes with work stealing (see '_quickhull_worker')
+def parallel_quickhull_indices(points, workers=None, cutoff=1 << 16, min_parallel_size=200000):
+    """
+    Args:
+        points: (n, 2) array-like of points
+        workers: number of worker processes (default: number of cores). The hull is computed in this process
+                 when workers=1 or when there are less than min_parallel_size points
+        cutoff: subproblems of at most this many candidate points are always solved by the worker that has them
+    Returns:
+        index array of the hull vertices, equal to quickhull_indices(points)
+    """
+    points = np.asarray(points)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers == 1 or len(points) < min_parallel_size:
+        return quickhull_indices(points)
+
+    x, y = coordinate_columns(points)
+    orient = orient2d_array_int64 if x.dtype == np.int64 else orient2d_array
+    num_of_points = len(points)
+
+    # leftmost point (minimum x, then minimum y) and rightmost point (maximum x, then maximum y)
+    order = np.flatnonzero(x == x.min())
+    left_point = order[np.argmin(y[order])]
+    order = np.flatnonzero(x == x.max())
+    right_point = order[np.argmax(y[order])]
+    if x[left_point] == x[right_point] and y[left_point] == y[right_point]:
+        return np.array([left_point])
+    side = orient(x[left_point], y[left_point], x[right_point], y[right_point], x, y)
+    upper = np.flatnonzero(side > 0)
+    lower = np.flatnonzero(side < 0)
+    del side
+
+    block = shared_memory.SharedMemory(create=True, size=3 * num_of_points * 8)
+    processes = []
+    try:
+        shared_x, shared_y, index = _shared_columns(block, num_of_points, x.dtype)
+        shared_x[:] = x
+        shared_y[:] = y
+        index[:len(upper)] = upper
+        index[len(upper):len(upper) + len(lower)] = lower
+        del x, y
+
+        tasks = multiprocessing.Queue()
+        results = multiprocessing.Queue()
+        idle = multiprocessing.Value("i", 0)
+        for worker in range(workers):
+            process = multiprocessing.Process(target=_quickhull_worker, daemon=True, args=(
+                worker, block.name, num_of_points, shared_x.dtype, cutoff, tasks, results, idle))
+            process.start()
+            processes.append(process)
+
+        # the two halves are the first tasks, the workers publish the others
+        roots = [("upper",), ("lower",)]
+        tasks.put((roots[0], left_point, right_point, 0, len(upper), False))
+        tasks.put((roots[1], right_point, left_point, len(upper), len(upper) + len(lower), False))
+
+        # a task is pending until its items are back; published tasks can finish before their publisher
+        items = {}
+        pending = set(roots)
+        while pending:
+            try:
+                task, task_items, published = results.get(timeout=1.0)
+            except queue.Empty:
+                if not all(process.is_alive() for process in processes):
+                    raise RuntimeError("A parallel quickhull worker exited unexpectedly")
+                continue
+            if task_items is None:
+                raise RuntimeError("A parallel quickhull worker failed:\n" + published)
+            items[task] = task_items
+            pending.discard(task)
+            pending.update(child for child in published if child not in items)
+
+        # Replace the ids of the published tasks by their items, in order
+        chains = []
+        for root in roots:
+            chain = []
+            stack = list(reversed(items[root]))
+            while stack:
+                item = stack.pop()
+                if isinstance(item, tuple):
+                    stack.extend(reversed(items[item]))
+                else:
+                    chain.append(item)
+            chains.append(chain)
+
+        for process in processes:
+            tasks.put(None)
+        for process in processes:
+            process.join()
+        del shared_x, shared_y, index
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        block.close()
+        block.unlink()
+
+    return np.array([left_point] + chains[0] + [right_point] + chains[1], dtype=np.intp)
+
+
+# Quick Hull driver: splits the points by the line joining the leftmost and rightmost points and runs
+# 'QuickHull' on both sides. Returns the hull as a closed list of points (first point repeated at the end).
+# engine="numpy" runs the index-array implementation ('quickhull_indices') instead of the list-based one,
+# engine="parallel" its multi-process version ('parallel_quickhull_indices', which takes the options)
+def quickhull(points, engine="python", **options):
+
+    if engine in ("numpy", "parallel"):
+        indices = quickhull_indices(points) if engine == "numpy" else parallel_quickhull_indices(points, **options)
+        hull = [tuple(point) for point in np.asarray(points)[indices].tolist()]
+        return hull + hull[:1]
+    elif engine != "python":
+        raise ValueError("Unknown quickhull engine: " + str(engine))
+
+    # work on a sorted copy, the algorithm pops points out of the lists it receives
+    points = sorted(points)
+    if (len(points) < 2):
+        return points + points[:1]
+
+    left_point = points[0]
+    # popping out 1st and last (n-th) points because they must be included in the convex hull from scratch
+    points.pop(0)
+    right_point = points[len(points)-1]
+    points.pop(len(points)-1)
+
+    hull = []
+    if (len(points) == 0):
+        # If there are no points, add the left and right points to the hull
+        hull.append(left_point)
+        hull.append(right_point)
+    elif (len(points) == 1):
+        # If there is only one point, add the left, right and the point to the hull
+        hull.append(left_point)
+        hull.append(right_point)
+        hull.append(points[0])
+    elif (len(points) > 1):
+        # If there are more than one points, add the left and right points to the hull
+        hull.append(left_point)
+        hull.append(right_point)
+
+        # Divide points into 2 areas, namely the upper area (left_point) and the lower area (right_point)
+        lefts = []
+        rights = []
+        for point in points:
+            det = Determinant(left_point, right_point, point)
+            if (det > 0):
+                lefts.append(point)
+            elif (det < 0):
+                rights.append(point)
+
+        LeftHull = []
+        RightHull = []
+
+        # Search for the upper Convex Hull
+        if (len(lefts) > 0):
+            Far_Left_Point = Farthest_Point(left_point, right_point, lefts)
+            Delete_Point(left_point, right_point, Far_Left_Point, lefts)
+            LeftHull = QuickHull(left_point, Far_Left_Point, right_point, lefts)
+
+        # Search for the lower Convex Hull
+        if (len(rights) > 0):
+            Far_Right_Point = Farthest_Point(left_point, right_point, rights)
+            Delete_Point(right_point, left_point, Far_Right_Point, rights)
+            RightHull = QuickHull(right_point, Far_Right_Point, left_point, rights)
+
+        hull = hull + LeftHull + RightHull
+
+    return SortHull(hull)
@@ -0,0 +1,340 @@
+# Quick Hull algorithm in 3D: scipy's Qhull wrapper, and a native implementation with NumPy on a half-edge mesh
+
+import numpy as np                  # for math calculations on arrays
+
+from .batch import segment_starts
+
+# Points closer than this to the plane of a facet (relative to the sum of the largest absolute coordinates)
+# are on the facet, not outside of it
+DISTANCE_TOLERANCE = 16 * np.finfo(np.float64).eps
+# Largest number of point-facet distances computed in one array
+MAX_BLOCK = 1 << 22
+# Half-edges of a facet, relative to 3 * facet
+EDGES = np.arange(3)
+
+
+# Function to compute the cross products of two (m, 3) arrays (np.cross has a large overhead on small arrays)
+def cross(u, v):
+    result = np.empty_like(u)
+    result[:, 0] = u[:, 1] * v[:, 2] - u[:, 2] * v[:, 1]
+    result[:, 1] = u[:, 2] * v[:, 0] - u[:, 0] * v[:, 2]
+    result[:, 2] = u[:, 0] * v[:, 1] - u[:, 1] * v[:, 0]
+    return result
+
+
+class QuickHull3D:
+    """
+    3D convex hull with the Quick Hull algorithm, computed natively with NumPy (no scipy).
+
+    The hull is a triangle mesh kept as half-edges: facet f owns the half-edges 3f, 3f + 1 and 3f + 2, the
+    half-edge 3f + k goes from vertex facets[f, k] to vertex facets[f, (k + 1) % 3] (counterclockwise seen from
+    outside) and twin[e] is the opposite half-edge, in the neighbouring facet. Every facet keeps its outside
+    set: the points strictly outside of it that no other facet took (its conflict list). Each step takes the
+    farthest point of an outside set, finds the facets it sees with a breadth-first walk over the half-edges,
+    replaces them with a cone of new facets from their horizon to the point and redistributes their outside
+    sets to the new facets. The point-facet distances are computed with one matrix product per step.
+    More points can be added later with 'add_points'; the outside sets are the facet-point conflict graph, so
+    a batch only touches the facets its outside points see.
+
+    The result has the attributes of scipy's ConvexHull that the scripts use: 'points', 'vertices' (sorted
+    indices of the hull vertices), 'simplices' (triangles as indices, counterclockwise seen from outside),
+    'equations' ([normal, offset] rows, normal . x + offset <= 0 inside), 'neighbors', 'area' and 'volume'.
+    Like Qhull's triangulated output, degenerate inputs (e.g. integer grids) can keep a few points in the middle
+    of a flat face or edge as vertices.
+
+    Example:
+        hull = QuickHull3D(np.random.rand(100000, 3))
+        hull.vertices       # indices of the hull vertices
+        hull.simplices      # (m, 3) array of triangles
+    """
+
+    def __init__(self, points, tolerance=None):
+        self.points = np.ascontiguousarray(points, dtype=np.float64)
+        if self.points.ndim != 2 or self.points.shape[1] != 3:
+            raise ValueError("Expected an (n, 3) array of points, got shape " + str(self.points.shape))
+        if len(self.points) < 4:
+            raise ValueError("A 3D hull needs at least 4 points, got " + str(len(self.points)))
+        self._storage = self.points                         # the points are a view of it (see add_points)
+        self._scale = np.abs(self.points).max(axis=0)
+        self._auto_tolerance = tolerance is None
+        if tolerance is None:
+            tolerance = DISTANCE_TOLERANCE * self._scale.sum()
+        self.tolerance = tolerance
+        self.version = 0            # incremented whenever the hull changes, for the caches of the users
+
+        self.facets = np.empty((0, 3), dtype=np.intp)       # vertices of each facet
+        self.normals = np.empty((0, 3))                     # unit outward normal of each facet
+        self.offsets = np.empty(0)                          # normal . x of the points of each facet plane
+        self.alive = np.empty(0, dtype=bool)                # False once a facet is replaced
+        self.twin = np.empty(0, dtype=np.intp)              # opposite half-edge of each half-edge
+        self._visited = np.empty(0, dtype=np.intp)          # walk stamps of the facets
+        self._visible = np.empty(0, dtype=np.intp)          # stamps of the facets found visible
+        self._walk = 0
+        self.num_of_facets = 0
+        self.outside = {}           # facet -> indices of the points of its outside set
+        self.farthest = {}          # facet -> index of the farthest point of its outside set
+        self.pending = []           # facets whose outside set may be non-empty
+
+        simplex = self._initial_simplex()
+        facets = self._add_simplex(*simplex)
+        rest = np.setdiff1d(np.arange(len(self.points)), simplex)
+        self._assign(rest, facets)
+        self._expand()
+
+    # Function to make room for 'count' more facets and return their indices
+    def _new_facets(self, count):
+        first = self.num_of_facets
+        if first + count > len(self.facets):
+            capacity = max(2 * len(self.facets), first + count, 16)
+            self.facets = np.resize(self.facets, (capacity, 3))
+            self.normals = np.resize(self.normals, (capacity, 3))
+            self.offsets = np.resize(self.offsets, capacity)
+            self.alive = np.resize(self.alive, capacity)
+            self.twin = np.resize(self.twin, 3 * capacity)
+            self._visited = np.resize(self._visited, capacity)
+            self._visible = np.resize(self._visible, capacity)
+            self._visited[first:] = 0
+            self._visible[first:] = 0
+        self.num_of_facets = first + count
+        return np.arange(first, first + count)
+
+    # Function to set the vertices of new facets and compute their planes
+    def _set_facets(self, ids, a, b, c):
+        pa, pb, pc = self.points[a], self.points[b], self.points[c]
+        normals = cross(pb - pa, pc - pa)
+        lengths = np.sqrt(np.einsum("ij,ij->i", normals, normals))
+        normals /= np.maximum(lengths, np.finfo(np.float64).tiny)[:, None]
+        self.facets[ids, 0] = a
+        self.facets[ids, 1] = b
+        self.facets[ids, 2] = c
+        self.normals[ids] = normals
+        self.offsets[ids] = np.einsum("ij,ij->i", normals, pa)
+        self.alive[ids] = True
+        self._visited[ids] = 0
+        self._visible[ids] = 0
+
+    # Function to find 4 affinely independent points far apart: the two farthest of the extreme points along
+    # the axes, the farthest point from their line and the farthest point from the plane of the three
+    def _initial_simplex(self):
+        points = self.points
+        extremes = np.unique(np.concatenate((points.argmin(axis=0), points.argmax(axis=0))))
+        differences = points[extremes][:, None, :] - points[extremes][None, :, :]
+        i, j = np.unravel_index(np.argmax(np.einsum("ijk,ijk->ij", differences, differences)), (len(extremes),) * 2)
+        a, b = extremes[i], extremes[j]
+        direction = points[b] - points[a]
+        if not np.any(direction):
+            raise ValueError("The points are all the same, the hull is a single point")
+
+        across = np.cross(points - points[a], direction)
+        c = np.argmax(np.einsum("ij,ij->i", across, across))
+        normal = np.cross(direction, points[c] - points[a])
+        length = np.linalg.norm(normal)
+        if length <= self.tolerance * np.linalg.norm(direction):
+            raise ValueError("The points are collinear, the hull is a segment")
+        normal /= length
+
+        distances = (points - points[a]) @ normal
+        d = np.argmax(np.abs(distances))
+        if abs(distances[d]) <= self.tolerance:
+            raise ValueError("The points are coplanar, the hull is flat")
+        if distances[d] > 0:
+            b, c = c, b             # the fourth point must be below the plane of the first three
+        return a, b, c, d
+
+    # Function to build the tetrahedron of the initial simplex (v3 below the plane of v0, v1, v2)
+    def _add_simplex(self, v0, v1, v2, v3):
+        ids = self._new_facets(4)
+        self._set_facets(ids, np.array([v0, v0, v1, v2]), np.array([v1, v3, v3, v3]), np.array([v2, v1, v2, v0]))
+
+        # every half-edge u -> v is the twin of the half-edge v -> u
+        edges = (3 * ids[:, None] + EDGES).ravel()
+        start = self.facets[ids].ravel()
+        end = self.facets[ids][:, [1, 2, 0]].ravel()
+        n = len(self.points)
+        keys = start * n + end
+        order = np.argsort(keys)
+        self.twin[edges] = edges[order[np.searchsorted(keys[order], end * n + start)]]
+        return ids
+
+    # Function to find, for each point of a (k, 3) array, the facet it is farthest outside of and that distance
+    def _owners(self, coordinates, facets):
+        normals, offsets = self.normals[facets], self.offsets[facets]
+        block = max(1, MAX_BLOCK // len(facets))
+        owner = np.empty(len(coordinates), dtype=np.intp)
+        distance = np.empty(len(coordinates))
+        for start in range(0, len(coordinates), block):
+            distances = coordinates[start:start + block] @ normals.T - offsets
+            best = np.argmax(distances, axis=1)
+            owner[start:start + block] = facets[best]
+            distance[start:start + block] = distances[np.arange(len(best)), best]
+        return owner, distance
+
+    # Function to give each point to the facet it is farthest outside of (points outside of no facet are dropped)
+    def _assign(self, candidates, facets):
+        if len(candidates) == 0 or len(facets) == 0:
+            return
+        owner, distance = self._owners(self.points[candidates], facets)
+        outside = distance > self.tolerance
+        self._add_outside(candidates[outside], owner[outside], distance[outside])
+
+    # Function to add points to the outside sets of their facets (the facets have no outside set yet)
+    def _add_outside(self, points, owner, distance):
+        if len(points) == 0:
+            return
+
+        # group the points by facet, the farthest one first
+        order = np.lexsort((-distance, owner))
+        points, owner = points[order], owner[order]
+        starts = segment_starts(owner)
+        ends = np.append(starts[1:], len(owner))
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            facet = owner[start].item()
+            self.outside[facet] = points[start:end]
+            self.farthest[facet] = points[start].item()
+            self.pending.append(facet)
+
+    # Function to find the facets the point sees, starting from a facet it sees, with a breadth-first walk
+    # over the half-edges (one vectorized visibility test per layer of neighbours)
+    def _visible_facets(self, eye, facet):
+        self._walk += 1
+        walk = self._walk
+        self._visited[facet] = walk
+        self._visible[facet] = walk
+        layers = [np.array([facet])]
+        frontier = layers[0]
+        while len(frontier):
+            neighbours = self.twin[(3 * frontier[:, None] + EDGES).ravel()] // 3
+            neighbours = np.unique(neighbours[self._visited[neighbours] != walk])
+            self._visited[neighbours] = walk
+            seen = self.normals[neighbours] @ self.points[eye] - self.offsets[neighbours] > self.tolerance
+            frontier = neighbours[seen]
+            self._visible[frontier] = walk
+            layers.append(frontier)
+        return np.concatenate(layers)
+
+    # Function to add the point to the hull: the facets it sees are replaced by a cone from their horizon
+    def _add_point(self, eye, facet):
+        visible = self._visible_facets(eye, facet)
+
+        # horizon: the half-edges of the visible facets whose twin is in a facet that is not visible
+        edges = (3 * visible[:, None] + EDGES).ravel()
+        twins = self.twin[edges]
+        horizon = edges[self._visible[twins // 3] != self._walk]
+        twins = self.twin[horizon]
+        a = self.facets[horizon // 3, horizon % 3]
+        b = self.facets[horizon // 3, (horizon + 1) % 3]
+        order = np.argsort(a)
+        if np.any(a[order[1:]] == a[order[:-1]]):
+            raise RuntimeError("The horizon of point " + str(eye) + " is not a simple loop (degenerate input)")
+
+        ids = self._new_facets(len(horizon))
+        self._set_facets(ids, a, b, np.full(len(ids), eye))
+        # half-edge a -> b takes the place of the horizon edge, b -> eye is the twin of eye -> b of the next facet
+        self.twin[3 * ids] = twins
+        self.twin[twins] = 3 * ids
+        following = ids[order[np.searchsorted(a[order], b)]]
+        self.twin[3 * ids + 1] = 3 * following + 2
+        self.twin[3 * following + 2] = 3 * ids + 1
+
+        # the outside sets of the visible facets go to the new facets
+        self.alive[visible] = False
+        orphans = [self.outside.pop(f) for f in visible.tolist() if f in self.outside]
+        for f in visible.tolist():
+            self.farthest.pop(f, None)
+        if orphans:
+            orphans = np.concatenate(orphans)
+            self._assign(orphans[orphans != eye], ids)
+
+    # Function to add the farthest outside point of every facet until no outside set is left
+    def _expand(self):
+        while self.pending:
+            facet = self.pending.pop()
+            if self.alive[facet] and facet in self.farthest:
+                self._add_point(self.farthest[facet], facet)
+                self.version += 1
+
+    # Function to add a batch of points to the hull. The batch is tested against the current facets in one
+    # vectorized pass: the points inside are dropped (not stored), the others start the outside sets of the
+    # facets they see, and only the facets visible from the points that become vertices are replaced.
+    # Returns the number of points of the batch that were outside of the hull
+    def add_points(self, points):
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        if len(points) == 0:
+            return 0
+        if self._auto_tolerance:
+            scale = np.abs(points).max(axis=0)
+            self._scale = np.maximum(self._scale, scale)
+            self.tolerance = max(self.tolerance, DISTANCE_TOLERANCE * self._scale.sum())
+
+        owner, distance = self._owners(points, self._alive_facets)
+        outside = distance > self.tolerance
+        new = points[outside]
+
+        # store the outside points after the current ones, the storage grows by doubling
+        first = len(self.points)
+        if first + len(new) > len(self._storage):
+            storage = np.empty((max(2 * len(self._storage), first + len(new)), 3))
+            storage[:first] = self.points
+            self._storage = storage
+        self._storage[first:first + len(new)] = new
+        self.points = self._storage[:first + len(new)]
+
+        self._add_outside(np.arange(first, first + len(new)), owner[outside], distance[outside])
+        self._expand()
+        return len(new)
+
+    # Indices of the current facets
+    @property
+    def _alive_facets(self):
+        return np.flatnonzero(self.alive[:self.num_of_facets])
+
+    # Triangles of the hull as (m, 3) point indices, counterclockwise seen from outside
+    @property
+    def simplices(self):
+        return self.facets[self._alive_facets]
+
+    # Sorted indices of the hull vertices
+    @property
+    def vertices(self):
+        return np.unique(self.simplices)
+
+    # Plane equations of the triangles, [normal, offset] with normal . x + offset <= 0 inside the hull
+    @property
+    def equations(self):
+        ids = self._alive_facets
+        return np.column_stack((self.normals[ids], -self.offsets[ids]))
+
+    # Neighbour triangles: neighbors[i, j] is the triangle across the edge opposite to vertex simplices[i, j]
+    @property
+    def neighbors(self):
+        ids = self._alive_facets
+        index = np.full(self.num_of_facets, -1, dtype=np.intp)
+        index[ids] = np.arange(len(ids))
+        # the edge opposite to vertex j is the half-edge (j + 1) % 3
+        return index[self.twin[3 * ids[:, None] + np.array([1, 2, 0])] // 3]
+
+    # Surface area of the hull
+    @property
+    def area(self):
+        triangles = self.points[self.simplices]
+        normals = cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+        return np.sqrt(np.einsum("ij,ij->i", normals, normals)).sum() / 2
+
+    # Volume of the hull (sum of the signed tetrahedra from the first vertex to every triangle)
+    @property
+    def volume(self):
+        triangles = self.points[self.simplices] - self.points[self.simplices[0, 0]]
+        return np.einsum("ij,ij->i", triangles[:, 0], cross(triangles[:, 1], triangles[:, 2])).sum() / 6
+
+
+# Function to compute the 3D convex hull. engine="scipy" goes through scipy's Qhull wrapper (scipy is imported
+# here and not at module level, so importing the package does not pay for it), engine="numpy" runs the
+# native QuickHull3D. Both results have 'vertices' and 'simplices'
+def quickhull_3d(points, engine="scipy"):
+    if engine == "numpy":
+        return QuickHull3D(points)
+    elif engine != "scipy":
+        raise ValueError("Unknown quickhull_3d engine: " + str(engine))
+    from scipy.spatial import ConvexHull
+
+    return ConvexHull(np.asarray(points, dtype=np.float64))
@@ -0,0 +1,111 @@
+# Out-of-core convex hull in 2D: point files larger than memory are read in fixed-size chunks and every chunk
+# is folded into a running hull, so the memory stays bounded by the chunk size plus the hull size
+
+import os                                       # for the type of the file paths
+import warnings                                 # for the parse warnings of numpy
+from itertools import islice                    # for reading a fixed number of CSV lines
+
+import numpy as np                              # for math calculations on arrays
+
+from .online import IncrementalHull2D
+
+
+# Function to guess the format of a point file from its extension
+def file_format(path):
+    name = str(path).lower()
+    if name.endswith(".npy"):
+        return "npy"
+    if name.endswith((".csv", ".txt")):
+        return "csv"
+    return "raw"
+
+
+# Function to read the chunks of a memory-mapped (n, columns) array
+def _mapped_chunks(points, chunk_size):
+    for start in range(0, len(points), chunk_size):
+        # copy the chunk out of the map, the pages already read are not kept by the process
+        yield np.array(points[start:start + chunk_size], dtype=np.float64)
+
+
+# Function to parse a CSV file in chunks of lines. The lines are joined and parsed by numpy in one call,
+# much faster than a csv.reader or np.loadtxt loop
+def _csv_chunks(path, chunk_size, columns, delimiter, skip_header):
+    with open(path) as file:
+        for _ in range(skip_header):
+            next(file, None)
+        while True:
+            lines = list(islice(file, chunk_size))
+            if not lines:
+                return
+            text = "".join(lines)
+            if delimiter is not None and not delimiter.isspace():
+                text = text.replace(delimiter, " ")
+            with warnings.catch_warnings():
+                # numpy warns and stops at the first value it cannot parse, the count below reports it
+                warnings.simplefilter("ignore", DeprecationWarning)
+                values = np.fromstring(text, dtype=np.float64, sep=" ")
+            num_of_rows = sum(1 for line in lines if line.strip())
+            if len(values) != num_of_rows * columns:
+                raise ValueError("Malformed CSV rows in " + str(path) + ", expected " + str(columns) + " numbers per line")
+            yield values.reshape(-1, columns)
+
+
+# Function to read a point file in chunks of at most chunk_size points, as (m, columns) float64 arrays
+def read_chunks(path, chunk_size=1 << 20, format=None, dtype=np.float64, columns=2, delimiter=",", skip_header=0):
+    """
+    Args:
+        path: .npy file (memory-mapped), raw binary file of dtype values (memory-mapped, e.g. float64 or int32)
+              or CSV/text file with one point per line
+        chunk_size: number of points per chunk
+        format: "npy", "raw" or "csv" (guessed from the extension by default)
+        dtype: type of the values of a raw file
+        columns: number of values per point of a raw or CSV file
+        delimiter: separator of the CSV values (None for whitespace)
+        skip_header: number of CSV lines to skip at the start of the file
+    Returns:
+        generator of (m, columns) float64 arrays
+    """
+    format = file_format(path) if format is None else format
+    if format == "npy":
+        points = np.load(path, mmap_mode="r")
+        if points.ndim != 2:
+            raise ValueError("Expected an (n, d) array in " + str(path) + ", got shape " + str(points.shape))
+        return _mapped_chunks(points, chunk_size)
+    elif format == "raw":
+        points = np.memmap(path, dtype=dtype, mode="r")
+        if len(points) % columns != 0:
+            raise ValueError("The size of " + str(path) + " is not a multiple of " + str(columns) + " values")
+        return _mapped_chunks(points.reshape(-1, columns), chunk_size)
+    elif format == "csv":
+        return _csv_chunks(path, chunk_size, columns, delimiter, skip_header)
+    raise ValueError("Unknown point file format: " + str(format))
+
+
+# Function to compute the convex hull of a point file, or of any iterable of point chunks, one chunk at a time
+def chunked_hull(source, chunk_size=1 << 20, stats=None, **options):
+    """
+    Args:
+        source: path of a point file (see read_chunks) or iterable of (m, 2) arrays
+        chunk_size: number of points per chunk of a file
+        stats: optional dict, filled with the number of "points" and "chunks" read
+        options: keyword arguments of read_chunks (format, dtype, columns, delimiter, skip_header)
+    Returns:
+        (h, 2) array of the hull vertices (of the first two coordinates), starting at the leftmost point,
+        in the order graham_scan returns them
+    """
+    if isinstance(source, (str, bytes, os.PathLike)):
+        chunks = read_chunks(source, chunk_size, **options)
+    else:
+        chunks = source
+
+    # every chunk is tested against the running hull in one vectorized pass, only its points outside of the
+    # hull are reduced to their own hull and merged, so a chunk never stays in memory after its turn
+    hull = IncrementalHull2D()
+    num_of_chunks = 0
+    for chunk in chunks:
+        hull.insert_many(np.asarray(chunk)[:, :2])
+        num_of_chunks += 1
+    if stats is not None:
+        stats["points"] = hull.num_of_points
+        stats["chunks"] = num_of_chunks
+    return hull.vertices
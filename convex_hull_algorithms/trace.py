@@ -0,0 +1,128 @@
+# Event traces of the step-by-step algorithms: the algorithm runs once and records its push/pop events in
+# compact arrays, the visualizations replay them as many times as they want, forwards, at any speed
+
+from array import array                         # for the compact growing event buffers
+
+import numpy as np                              # for math calculations on arrays
+
+# Kinds of events
+PUSH = 0
+POP = 1
+
+
+class TraceRecorder:
+    """
+    Records the push/pop events of an algorithm that keeps its current result on one or more stacks (e.g. the
+    upper and lower chains of Graham's Scan). Each event is 1 + 1 + 8 bytes: its kind, its stack and the index
+    of the point pushed or popped.
+
+    Example:
+        recorder = TraceRecorder(points)
+        recorder.push(0)
+        recorder.pop(0)
+        trace = recorder.finish()
+    """
+
+    def __init__(self, points, stack_names=("main",)):
+        self.points = points
+        self.stack_names = tuple(stack_names)
+        self.kinds = array("b")
+        self.stacks = array("b")
+        self.items = array("q")
+
+    # Function to record a push of point 'item' on a stack
+    def push(self, item, stack=0):
+        self.kinds.append(PUSH)
+        self.stacks.append(stack)
+        self.items.append(item)
+
+    # Function to record a pop of point 'item' from a stack
+    def pop(self, item, stack=0):
+        self.kinds.append(POP)
+        self.stacks.append(stack)
+        self.items.append(item)
+
+    # Function to freeze the recorded events into a Trace
+    def finish(self):
+        return Trace(self.points, np.array(self.kinds, dtype=np.int8), np.array(self.stacks, dtype=np.int8),
+                     np.array(self.items, dtype=np.int64), self.stack_names)
+
+
+class Trace:
+    """
+    Push/pop events of one run of an algorithm, as three parallel arrays ('kinds', 'stacks', 'items') over the
+    indices of 'points'. The state after any number of events is the content of the stacks, and the polygon
+    drawn for it is the concatenation of the stacks in order.
+
+    Example:
+        trace = graham_scan_trace(points)
+        replay = trace.replayer()
+        for step in trace.frame_steps(max_frames=200):
+            polygon = trace.points[replay.advance(step)]
+    """
+
+    def __init__(self, points, kinds, stacks, items, stack_names=("main",)):
+        self.points = points
+        self.kinds = kinds
+        self.stacks = stacks
+        self.items = items
+        self.stack_names = tuple(stack_names)
+
+    def __len__(self):
+        return len(self.kinds)
+
+    # Function to save the trace (points and events) to a .npz file
+    def save(self, path):
+        np.savez_compressed(path, points=self.points, kinds=self.kinds, stacks=self.stacks, items=self.items,
+                            stack_names=np.array(self.stack_names))
+
+    # Function to load a trace written by 'save'
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(data["points"], data["kinds"], data["stacks"], data["items"], data["stack_names"].tolist())
+
+    # Function to choose the event counts shown by the frames of an animation: every event if there are at most
+    # max_frames of them, otherwise max_frames evenly spaced counts (the events in between are skipped). The
+    # last count is always the whole trace, so the animation ends on the result
+    def frame_steps(self, max_frames=None):
+        if max_frames is None or len(self) <= max_frames:
+            return np.arange(1, len(self) + 1)
+        return np.unique(np.linspace(1, len(self), max_frames).round().astype(np.int64))
+
+    # Function to create a replayer of the trace, starting before its first event
+    def replayer(self):
+        return TraceReplayer(self)
+
+
+class TraceReplayer:
+    """
+    Replays a Trace forwards: advancing from step i to step j applies only the events i..j-1, so a whole replay
+    costs O(len(trace)) no matter how many frames show it. Going back restarts from the first event.
+    """
+
+    def __init__(self, trace):
+        self.trace = trace
+        self.step = 0
+        self.stacks = [[] for _ in trace.stack_names]
+
+    # Function to apply the events up to 'step' (excluded) and return the indices of the current polygon
+    def advance(self, step):
+        step = min(step, len(self.trace))
+        if step < self.step:
+            self.step = 0
+            self.stacks = [[] for _ in self.trace.stack_names]
+        kinds = self.trace.kinds[self.step:step].tolist()
+        stacks = self.trace.stacks[self.step:step].tolist()
+        items = self.trace.items[self.step:step].tolist()
+        for kind, stack, item in zip(kinds, stacks, items):
+            if kind == PUSH:
+                self.stacks[stack].append(item)
+            else:
+                self.stacks[stack].pop()
+        self.step = step
+        return self.polygon()
+
+    # Function to get the indices of the current polygon: the stacks concatenated in order
+    def polygon(self):
+        return [item for stack in self.stacks for item in stack]
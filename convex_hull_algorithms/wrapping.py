@@ -0,0 +1,131 @@
+# Wrapping (Jarvis march) algorithm in 2D
+
+import numpy as np                              # for math calculations on arrays
+
+from .predicates import orient2d, orient2d_array
+
+
+#   Function to compute the convex hull of a set of points using Wrapping algorithm
+def jarvis_march(points, engine="python", **options):
+    """
+    Args:
+        points: lexicographically sorted points
+        engine: "python" for the reference per-point loop, "numpy" for the vectorized wrap steps
+        options: shrink=True/False for the "numpy" engine (see jarvis_march_numpy)
+    Returns:
+        array of the hull vertices, starting at the leftmost point, in the order graham_scan returns them
+    """
+    if engine == "numpy":
+        return jarvis_march_numpy(points, **options)
+    elif engine != "python":
+        raise ValueError("Unknown jarvis_march engine: " + str(engine))
+
+    # Find the leftmost point
+    leftmost_point = min(points, key=lambda point: point[0])
+
+    # Start at the leftmost point and go counterclockwise
+    current_point = leftmost_point
+    convex_hull = []
+    while True:
+        convex_hull.append(current_point)
+
+        # Find the next point in the hull
+        next_point = next_hull_point(points, current_point)
+        # We have returned to the start point
+        if (next_point == leftmost_point).all():
+            break
+        current_point = next_point
+
+    return np.array(convex_hull)
+
+
+#   Function to find the point that follows current_point on the hull: one wrap step of the reference loop
+def next_hull_point(points, current_point):
+    next_point = None
+    for point in points:
+        if (point == current_point).all():
+            continue
+        if next_point is None:
+            next_point = point
+        else:
+            cross_product = orient2d(current_point, point, next_point)
+            if cross_product < 0:
+                next_point = point
+            elif cross_product == 0:
+                # If the points are collinear, choose the one farthest from current point
+                dist_next = (next_point[0] - current_point[0])**2 + (next_point[1] - current_point[1])**2
+                dist_point = (point[0] - current_point[0])**2 + (point[1] - current_point[1])**2
+                if dist_point > dist_next:
+                    next_point = point
+    return next_point
+
+
+#   Function to compute the convex hull with the Wrapping algorithm, one vectorized pass per wrap step.
+#   From the current vertex, with the direction of the last edge, every candidate gets the clockwise angle it
+#   turns the edge by, and the argmin of these angles is the next vertex. The float angles only propose it:
+#   the exact predicate then checks that no candidate is strictly on the left of the new edge (else the
+#   leftmost-turning of those is taken instead, until none is), and among the candidates on the edge's ray the
+#   farthest one is chosen by comparing raw coordinates. With shrink=True, the candidates strictly inside the
+#   part of the hull wrapped so far (left of the chord from the first vertex to the current one) are dropped
+#   after every step, so the passes get shorter as the vertices are found
+def jarvis_march_numpy(points, shrink=True):
+    points = np.asarray(points)
+    if len(points) == 0:
+        return points[:0]
+    x = np.ascontiguousarray(points[:, 0], dtype=np.float64)
+    y = np.ascontiguousarray(points[:, 1], dtype=np.float64)
+
+    # Start at the leftmost point (the lowest one if several) and go clockwise, first up the left side
+    leftmost = np.flatnonzero(x == x.min())
+    start = leftmost[np.argmin(y[leftmost])]
+    direction_x, direction_y = 0.0, 1.0
+    current = start
+    candidates = np.arange(len(points))
+    convex_hull = [start]
+    while len(convex_hull) <= len(points):
+        next_point = wrap_step(x, y, candidates, current, direction_x, direction_y)
+        # We have returned to the start point (or there is a single distinct point)
+        if next_point is None or next_point == start:
+            break
+        convex_hull.append(next_point)
+        direction_x, direction_y = x[next_point] - x[current], y[next_point] - y[current]
+        current = next_point
+        if shrink:
+            swept = orient2d_array(x[start], y[start], x[current], y[current], x[candidates], y[candidates]) > 0
+            candidates = candidates[~swept]
+
+    return points[convex_hull]
+
+
+#   Function to find the vertex that follows 'current' among the candidates, the last edge having the direction
+#   (direction_x, direction_y): one wrap step of 'jarvis_march_numpy'. Returns None if every candidate is a
+#   copy of the current point
+def wrap_step(x, y, candidates, current, direction_x, direction_y):
+    cx, cy = x[candidates], y[candidates]
+    dx, dy = cx - x[current], cy - y[current]
+    # clockwise turn from the last edge direction, in [0, pi] for every point on the right of that edge
+    turn = -np.arctan2(direction_x * dy - direction_y * dx, direction_x * dx + direction_y * dy)
+    turn[(dx == 0) & (dy == 0)] = np.inf   # copies of the current point
+    best = np.argmin(turn)
+    if turn[best] == np.inf:
+        return None
+    next_point = candidates[best]
+
+    # Exact check: no candidate may be strictly on the left of current -> next_point
+    while True:
+        sides = orient2d_array(x[current], y[current], x[next_point], y[next_point], cx, cy)
+        left = np.flatnonzero(sides > 0)
+        if len(left) == 0:
+            break
+        next_point = candidates[left[np.argmin(turn[left])]]
+
+    # If the points are collinear, choose the one farthest from current point (the extreme one along the ray)
+    step_x, step_y = x[next_point] - x[current], y[next_point] - y[current]
+    if step_x != 0:
+        on_ray = (sides == 0) & (np.sign(dx) == np.sign(step_x))
+        distance = cx * np.sign(step_x)
+    else:
+        on_ray = (sides == 0) & (np.sign(dy) == np.sign(step_y))
+        distance = cy * np.sign(step_y)
+    on_ray = np.flatnonzero(on_ray)
+    return candidates[on_ray[np.argmax(distance[on_ray])]]
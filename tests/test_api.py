@@ -0,0 +1,40 @@
+# Tests of the package entry point
+
+import subprocess                               # for a clean interpreter to import the package in
+import sys                                      # for the path of the interpreter
+from pathlib import Path                        # for the root of the repository
+
+import numpy as np                              # for math calculations on arrays
+import pytest                                   # for the method parameters
+from scipy.spatial import ConvexHull            # for the reference hulls
+
+from convex_hull_algorithms import convex_hull, order_hull
+
+
+# Importing the package loads neither matplotlib nor scipy
+def test_import_has_no_side_effects():
+    code = "import sys, convex_hull_algorithms; print(sorted({'matplotlib', 'scipy'} & set(sys.modules)))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            cwd=Path(__file__).resolve().parents[1]).stdout
+    assert output.strip() == "[]"
+
+
+# Every 2D method (and its alias) returns the hull scipy finds, in the order graham_scan returns the vertices
+@pytest.mark.parametrize("method, options", [
+    ("wrapping", {}), ("jarvis", {"engine": "numpy"}), ("incremental", {}), ("graham", {"engine": "numpy"}),
+    ("divide_and_conquer", {}), ("divide_and_conquer", {"engine": "merge"}), ("quickhull", {}),
+    ("quickhull", {"engine": "numpy"}), ("chan", {}),
+])
+def test_methods_agree_with_scipy(method, options):
+    points = np.random.default_rng(6).normal(size=(300, 2))
+    expected = order_hull(points[ConvexHull(points).vertices]).tolist()
+    assert convex_hull(points, method=method, **options).tolist() == expected
+    assert convex_hull(points[:2], method=method, **options).tolist() == order_hull(points[:2]).tolist()
+
+
+# Unknown methods and engines are rejected
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        convex_hull(np.zeros((5, 2)), method="gift")
+    with pytest.raises(ValueError):
+        convex_hull(np.random.default_rng(0).random((5, 2)), method="divide_and_conquer", engine="gpu")
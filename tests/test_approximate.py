@@ -0,0 +1,50 @@
+# Tests of the epsilon-kernel approximate hull
+
+import numpy as np                              # for math calculations on arrays
+import pytest                                   # for the direction parameters and the errors
+
+from convex_hull_algorithms import KernelHull, approximate_hull, quickhull_indices
+from convex_hull_algorithms.approximate import directions_for
+
+
+# Function to compute the distance of every point to a closed polygon (the nearest of its edges)
+def distance_to_polygon(points, polygon):
+    a, b = polygon, np.roll(polygon, -1, axis=0)
+    edge = b - a
+    t = np.einsum("pij,ij->pi", points[:, None, :] - a, edge) / np.maximum(np.einsum("ij,ij->i", edge, edge), 1e-300)
+    nearest = a + np.clip(t, 0, 1)[:, :, None] * edge
+    return np.linalg.norm(points[:, None, :] - nearest, axis=2).min(axis=1)
+
+
+# The kernel's vertices are input points and every exact hull vertex is within the error bound of them, which is
+# at most the guarantee (D / 2) * tan(pi / k) of the module; refine=True gives the exact hull
+@pytest.mark.parametrize("directions", [8, 64, 256])
+def test_error_bound(directions):
+    rng = np.random.default_rng(29)
+    points = rng.normal(size=(20000, 2)) * [3, 1]
+    hull = KernelHull(directions)
+    for chunk in np.array_split(points, 6):
+        hull.update(chunk)
+    exact = points[quickhull_indices(points)]
+    assert set(map(tuple, hull.vertices.tolist())) <= set(map(tuple, points.tolist()))
+    error = distance_to_polygon(exact, hull.vertices).max()
+    assert error <= hull.error_bound() * (1 + 1e-12)
+    spread = np.linalg.norm(exact[:, None] - exact[None], axis=2).max()
+    assert error <= spread / 2 * np.tan(np.pi / directions) * (1 + 1e-12)
+
+    stats = {}
+    refined = approximate_hull(np.array_split(points, 6), directions=directions, refine=True, stats=stats)
+    assert refined.tolist() == exact.tolist()
+    assert stats == {"points": 20000, "chunks": 6, "error_bound": 0.0}
+
+
+# The number of directions of a relative error, and the rejected arguments
+def test_directions_for():
+    for epsilon in (0.2, 0.01, 0.001):
+        k = directions_for(epsilon)
+        assert np.tan(np.pi / k) / 2 <= epsilon < np.tan(np.pi / (k - 1)) / 2
+    with pytest.raises(ValueError):
+        directions_for(0.5)
+    with pytest.raises(ValueError):
+        KernelHull(directions=2)
+    assert len(KernelHull().update(np.empty((0, 2))).vertices) == 0
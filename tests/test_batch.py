@@ -0,0 +1,40 @@
+# Tests of the batched hulls of many small point sets
+
+import numpy as np                              # for math calculations on arrays
+import pytest                                   # for the worker parameters
+
+from convex_hull_algorithms import batch_hulls, convex_hull
+
+
+# Function to get the hull of every group of a batch_hulls result as lists of points
+def group_hulls(points, hull, hull_offsets):
+    return [points[hull[start:end]].tolist() for start, end in zip(hull_offsets[:-1], hull_offsets[1:])]
+
+
+# Every group has the hull graham_scan gives on its own points, whether the groups are given by offsets, by
+# shuffled group ids or split across workers; a collinear group used to repeat its interior points
+@pytest.mark.parametrize("workers", [None, 3])
+def test_matches_graham_scan(workers):
+    rng = np.random.default_rng(4)
+    sizes = rng.integers(1, 80, 60)
+    offsets = np.concatenate(([0], np.cumsum(sizes)))
+    points = rng.random((offsets[-1], 2))
+    points[: offsets[30]] = rng.integers(0, 8, (offsets[30], 2))
+    points[offsets[1]:offsets[2]] = np.column_stack((np.arange(sizes[1]), 3 * np.arange(sizes[1]) + 1))
+    expected = [convex_hull(points[start:end], method="incremental", engine="numpy").tolist()
+                for start, end in zip(offsets[:-1], offsets[1:])]
+    assert expected[1] == [[0, 1], [sizes[1] - 1, 3 * sizes[1] - 2]]
+    assert group_hulls(points, *batch_hulls(points, offsets, workers=workers)) == expected
+
+    group_ids = np.repeat(np.arange(len(sizes)) * 7, sizes)
+    shuffle = rng.permutation(len(points))
+    hull, hull_offsets = batch_hulls(points[shuffle], group_ids=group_ids[shuffle], workers=workers)
+    assert group_hulls(points[shuffle], hull, hull_offsets) == expected
+
+
+# Exactly one of offsets and group_ids
+def test_arguments():
+    with pytest.raises(ValueError):
+        batch_hulls(np.zeros((3, 2)))
+    with pytest.raises(ValueError):
+        batch_hulls(np.zeros((3, 2)), offsets=[0, 3], group_ids=[0, 0, 0])
@@ -0,0 +1,34 @@
+# Tests of the benchmark suite
+
+import pytest                                   # for the temporary directories and the errors
+
+from convex_hull_algorithms import benchmark
+
+
+# A small run measures every selected case on every dataset, and its JSON and CSV files can be read back
+def test_run_save_and_compare(tmp_path):
+    report = benchmark.run(cases=["quickhull_numpy", "chan"], distributions=["circle", "integer_grid"],
+                           sizes=[100, 20000], repeats=2, warmup=0, memory=False)
+    results = {(r["case"], r["distribution"], r["n"]): r for r in report["results"]}
+    # chan stops at 10**4 points on the circle, where every point is a vertex
+    assert set(results) == {("quickhull_numpy", "circle", 100), ("quickhull_numpy", "circle", 20000),
+                            ("chan", "circle", 100), ("quickhull_numpy", "integer_grid", 100),
+                            ("quickhull_numpy", "integer_grid", 20000), ("chan", "integer_grid", 100),
+                            ("chan", "integer_grid", 20000)}
+    assert results[("chan", "circle", 100)]["hull_size"] == 100
+    assert all(len(r["times"]) == 2 and r["best"] <= r["median"] and r["peak_bytes"] is None
+               for r in report["results"])
+
+    benchmark.save(report, tmp_path / "run.json")
+    benchmark.save(report, str(tmp_path / "run.csv"))
+    assert benchmark.load(tmp_path / "run.json") == report
+    assert (tmp_path / "run.csv").read_text().splitlines()[0].startswith("case,distribution,n,seed,best")
+
+    rows = benchmark.compare(report, report)
+    assert len(rows) == 7 and all(row[-1] == "same" and row[-2] == 1.0 for row in rows)
+
+
+# Unknown cases are rejected
+def test_unknown_case():
+    with pytest.raises(ValueError):
+        benchmark.run(cases=["gift_wrapping"], sizes=[10])
@@ -0,0 +1,64 @@
+# Tests of the content-addressed hull cache
+
+import os                                       # for the modification times of the cache files
+
+import numpy as np                              # for math calculations on arrays
+
+from convex_hull_algorithms import HullCache, convex_hull
+
+
+# Equal points (not the same array) with the same method and options hit the cache and get the same read-only
+# result; other options, methods or points miss it
+def test_memory_tier():
+    points = np.random.default_rng(30).random((1000, 2))
+    cache = HullCache()
+    hull = cache.hull(points, method="quickhull", engine="numpy")
+    assert hull.tolist() == convex_hull(points, method="quickhull", engine="numpy").tolist()
+    assert not hull.flags.writeable
+    assert convex_hull(points.copy(), method="quickhull", engine="numpy", cache=cache) is hull
+    cache.hull(points, method="quickhull")
+    cache.hull(points, method="graham")
+    cache.hull(points, method="incremental", prefilter=True)
+    cache.hull(points.astype(np.float32), method="incremental")
+    cache.hull(points[:-1], method="incremental")
+    assert cache.hull(points, method="incremental") is cache.hull(points, method="graham")
+    assert cache.stats.as_dict() == {"hits": 3, "disk_hits": 0, "misses": 6, "evictions": 0, "disk_evictions": 0,
+                                     "hit_rate": 3 / 9}
+    assert len(cache) == 6
+
+
+# Above max_bytes the least recently used results are evicted
+def test_lru_eviction():
+    rng = np.random.default_rng(31)
+    sets = [rng.random((100, 2)) for _ in range(4)]
+    size = convex_hull(sets[0]).nbytes
+    cache = HullCache(max_bytes=3 * size)
+    for points in sets[:3]:
+        cache.hull(points)
+    cache.hull(sets[0])                         # sets[0] becomes the most recently used
+    cache.hull(sets[3])
+    assert cache.bytes <= cache.max_bytes and cache.stats.evictions >= 1
+    hits = cache.stats.hits
+    cache.hull(sets[0])
+    assert cache.stats.hits == hits + 1
+    cache.hull(sets[1])                         # the least recently used, evicted
+    assert cache.stats.hits == hits + 1
+
+
+# The disk tier serves another cache (e.g. another process) and deletes the least recently used files
+def test_disk_tier(tmp_path):
+    rng = np.random.default_rng(32)
+    points = rng.random((2000, 2))
+    first = HullCache(directory=tmp_path)
+    hull = first.hull(points, method="quickhull", engine="numpy")
+    second = HullCache(directory=tmp_path)
+    cached = second.hull(points, method="quickhull", engine="numpy")
+    assert second.stats.disk_hits == 1 and cached.tolist() == hull.tolist() and not cached.flags.writeable
+
+    size = os.path.getsize(next(tmp_path.glob("*.npy")))
+    small = HullCache(directory=tmp_path / "small", max_disk_bytes=2 * size)
+    for offset in range(4):
+        small.hull(points + offset, method="quickhull", engine="numpy")
+    assert len(list((tmp_path / "small").glob("*.npy"))) <= 2 and small.stats.disk_evictions >= 2
+    small.clear(disk=True)
+    assert len(small) == 0 and not list((tmp_path / "small").glob("*.npy"))
@@ -0,0 +1,39 @@
+# Regression tests of Chan's algorithm
+
+import numpy as np                              # for math calculations on arrays
+
+from convex_hull_algorithms import chan, convex_hull, quickhull_indices
+
+
+# Collinear points used to make the wrap loop forever: the hull is the two extreme points
+def test_collinear_points():
+    assert chan([[0, 0], [0, 1], [0, 2]]).tolist() == [[0, 0], [0, 2]]
+    assert chan([[i, 0] for i in (3, 1, 4, 0, 2)]).tolist() == [[0, 0], [4, 0]]
+    assert chan(np.array([[2.5, 5.0], [0.5, 1.0], [1.0, 2.0], [0.5, 1.0]])).tolist() == [[0.5, 1.0], [2.5, 5.0]]
+
+
+# A vertical hull edge with several points on it: a group tangent stopped at a nearer point of the edge and the
+# wrap skipped its far end, a strict hull vertex
+def test_collinear_hull_edge():
+    rng = np.random.default_rng(9)
+    rng.random((2000, 2))
+    points = rng.integers(-50, 50, (2000, 2))
+    assert [-50, 41] in chan(points).tolist()
+
+
+# Integer grids: the own group's next vertex used to keep an arbitrary subset of the collinear boundary points
+def test_grids():
+    square = np.array([[i, j] for i in range(3) for j in range(3)])
+    assert chan(square).tolist() == [[0, 0], [0, 2], [2, 2], [2, 0]]
+    points = np.random.default_rng(0).integers(0, 12, (500, 2))
+    expected = points[quickhull_indices(points)].tolist()
+    assert chan(points).tolist() == expected
+    assert convex_hull(points, method="chan", prefilter=True).tolist() == expected
+
+
+# Several rounds of group sizes and many groups: the same strict hull, in the same order, as the exact quickhull
+def test_matches_quickhull():
+    rng = np.random.default_rng(1)
+    angles = np.linspace(0, 2 * np.pi, 1000, endpoint=False)
+    for points in (rng.random((20000, 2)), rng.integers(-30, 30, (20000, 2)), np.c_[np.cos(angles), np.sin(angles)]):
+        assert chan(points).tolist() == points[quickhull_indices(points)].tolist()
@@ -0,0 +1,42 @@
+# Tests of the seeded dataset generator
+
+import numpy as np                              # for math calculations on arrays
+import pytest                                   # for the parameters, temporary directories and errors
+
+from convex_hull_algorithms.datasets import DISTRIBUTIONS, make_points
+
+
+# The same parameters give the same points, another seed other points, in the requested shape and type
+@pytest.mark.parametrize("distribution", sorted(DISTRIBUTIONS))
+@pytest.mark.parametrize("dimensions", [2, 3])
+def test_seeded(distribution, dimensions):
+    points = make_points(distribution, 1000, seed=3, dimensions=dimensions)
+    assert points.shape == (1000, dimensions)
+    assert np.array_equal(points, make_points(distribution, 1000, seed=3, dimensions=dimensions))
+    assert not np.array_equal(points, make_points(distribution, 1000, seed=4, dimensions=dimensions))
+    integers = make_points(distribution, 1000, seed=3, dimensions=dimensions, coordinates="int", bounds=(-50, 50))
+    assert integers.dtype == np.int64 and integers.min() >= -50 and integers.max() <= 50
+    if distribution == "circle":
+        assert np.allclose(np.linalg.norm(points, axis=1), 1)
+
+
+# Unique x-coordinates or unique points, and the ranges that cannot hold them
+def test_unique():
+    points = make_points("uniform_square", 5000, coordinates="int", unique="x")
+    assert len(np.unique(points[:, 0])) == 5000
+    gaussian = make_points("gaussian", 3000, coordinates="int", bounds=(0, 1000), unique="points")
+    assert len(np.unique(gaussian, axis=0)) == 3000
+    with pytest.raises(ValueError):
+        make_points("uniform_disk", 500, coordinates="int", bounds=(0, 100), unique="x")
+    with pytest.raises(ValueError):
+        make_points("spiral", 10)
+
+
+# The cache is keyed by all the parameters, and a cached dataset is read back unchanged
+def test_cache(tmp_path):
+    points = make_points("gaussian", 2000, seed=1, cache=tmp_path)
+    assert len(list(tmp_path.glob("*.npy"))) == 1
+    assert np.array_equal(make_points("gaussian", 2000, seed=1, cache=tmp_path), points)
+    make_points("gaussian", 2000, seed=1, coordinates="int", cache=tmp_path)
+    make_points("gaussian", 2000, seed=2, cache=tmp_path)
+    assert len(list(tmp_path.glob("*.npy"))) == 3
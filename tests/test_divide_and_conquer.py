@@ -0,0 +1,36 @@
+# Regression tests of the Divide and Conquer engines
+
+import numpy as np                              # for math calculations on arrays
+from scipy.spatial import ConvexHull            # for the reference hulls
+
+from convex_hull_algorithms import convex_hull, merge_divide_and_conquer, order_hull
+
+
+# The reference engine chose its extreme point by float magnitude while splitting exactly
+def test_near_collinear_floats():
+    x = np.linspace(0, 1, 50)
+    points = np.column_stack((x, x / 3))
+    expected = sorted(map(tuple, points[[0, 37, 38, 49, 44]].tolist()))
+    assert sorted(map(tuple, convex_hull(points, method="divide_and_conquer").tolist())) == expected
+    for seed in range(50):
+        t = np.random.default_rng(seed).random(30)
+        cloud = np.column_stack((t, 0.7 * t + 0.1))
+        hull = sorted(map(tuple, convex_hull(cloud, method="divide_and_conquer").tolist()))
+        assert hull == sorted(map(tuple, convex_hull(cloud, method="quickhull", engine="numpy").tolist()))
+
+
+# All-collinear points used to come back with every interior point twice (once per chain)
+def test_merge_collinear_points():
+    line = np.column_stack((np.arange(20), 2 * np.arange(20) + 1))[::-1]
+    assert merge_divide_and_conquer(line, slabs=3).tolist() == [[0, 1], [19, 39]]
+    vertical = np.column_stack((np.zeros(10), np.arange(10.0)))
+    assert merge_divide_and_conquer(vertical).tolist() == [[0.0, 0.0], [0.0, 9.0]]
+    assert convex_hull(line, method="divide_and_conquer", engine="merge").tolist() == [[0, 1], [19, 39]]
+
+
+# The slab hulls merged in this process or by a pool of workers give the hull scipy finds
+def test_merge_matches_scipy():
+    points = np.random.default_rng(10).normal(size=(20000, 2))
+    expected = order_hull(points[ConvexHull(points).vertices]).tolist()
+    assert merge_divide_and_conquer(points, slabs=7, workers=1).tolist() == expected
+    assert merge_divide_and_conquer(points, workers=2, min_parallel_size=0).tolist() == expected
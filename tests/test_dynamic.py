@@ -0,0 +1,53 @@
+# Tests of the fully dynamic hull and the sliding window hull
+
+import numpy as np                              # for math calculations on arrays
+import pytest                                   # for the errors
+
+from convex_hull_algorithms import DynamicHull2D, SlidingWindowHull, quickhull_indices
+
+
+# Function to compute the strict hull of a list of points, in the order graham_scan returns the vertices
+def reference_hull(points):
+    points = np.array(points, dtype=np.float64).reshape(-1, 2)
+    return points[quickhull_indices(points)].tolist()
+
+
+# Random insertions and deletions of integer points (repeated and collinear ones included), with buckets small
+# enough to be split and emptied: after every update the hull is the one of the current points
+def test_insertions_and_deletions():
+    rng = np.random.default_rng(13)
+    points = [tuple(point) for point in rng.integers(0, 30, (300, 2)).tolist()]
+    hull = DynamicHull2D(points[:100], bucket_size=8)
+    current = list(points[:100])
+    for step, point in enumerate(points[100:]):
+        hull.insert(point)
+        current.append(point)
+        if step % 3 == 0:
+            for _ in range(2):
+                removed = current.pop(int(rng.integers(len(current))))
+                hull.delete(removed)
+        assert hull.vertices.tolist() == reference_hull(current)
+    assert len(hull) == len(current)
+    while len(current) > 1:
+        hull.delete(current.pop())
+    assert hull.vertices.tolist() == [list(map(float, current[0]))]
+    with pytest.raises(ValueError):
+        hull.delete((-1, -1))
+
+
+# The window keeps the last 'size' points, or the points of the last 'duration' time units
+def test_sliding_window():
+    rng = np.random.default_rng(14)
+    points = rng.normal(size=(400, 2))
+    by_count = SlidingWindowHull(size=50, bucket_size=16)
+    by_time = SlidingWindowHull(duration=10.0, bucket_size=16)
+    for k, point in enumerate(points):
+        by_count.push(point, timestamp=k)
+        by_time.push(point, timestamp=k / 2)
+        if k >= 50 and k % 40 == 0:
+            assert len(by_count) == 50 and by_count.vertices.tolist() == reference_hull(points[k - 49:k + 1])
+            assert len(by_time) == 20 and by_time.vertices.tolist() == reference_hull(points[k - 19:k + 1])
+    by_time.evict(now=1000.0)
+    assert len(by_time) == 0
+    with pytest.raises(ValueError):
+        SlidingWindowHull()
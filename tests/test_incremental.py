@@ -0,0 +1,15 @@
+# Regression tests of Graham's Scan
+
+import numpy as np                              # for math calculations on arrays
+import pytest                                   # for the engine parameters
+
+from convex_hull_algorithms import graham_scan, lexicographic_sort
+
+
+# All-collinear points used to come back with every interior point twice (once per chain)
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+def test_collinear_points(engine):
+    line = lexicographic_sort(np.column_stack((np.arange(20), 2 * np.arange(20) + 1)))
+    assert graham_scan(line, engine=engine).tolist() == [[0, 1], [19, 39]]
+    vertical = np.column_stack((np.zeros(10), np.arange(10.0)))
+    assert graham_scan(vertical, engine=engine).tolist() == [[0.0, 0.0], [0.0, 9.0]]
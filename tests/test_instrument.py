@@ -0,0 +1,47 @@
+# Tests of the instrumentation hooks
+
+import importlib                                # for the modules shadowed by the package's functions
+
+import numpy as np                              # for math calculations on arrays
+import pytest                                   # for the errors
+
+from convex_hull_algorithms import convex_hull, instrument
+
+
+# The counters follow the algorithms: one wrap step per hull vertex, every point pushed on both chains and
+# popped unless it stays on the hull (both engines of Graham's Scan), recursion depths and phases
+def test_counters():
+    points = np.random.default_rng(23).random((300, 2))
+    for engine in ("python", "numpy"):
+        with instrument() as results:
+            hull = convex_hull(points, method="wrapping", engine=engine)
+        assert results.wrap_steps == len(hull) and set(results.phases) == {"sort", "hull"}
+        with instrument() as results:
+            hull = convex_hull(points, method="incremental", engine=engine)
+        # the chains share their two end points
+        assert results.pops == 2 * len(points) - (len(hull) + 2)
+    # the NumPy engine evaluates most of its orientations in bulk
+    assert results.vectorized_orientation_tests > results.orientation_tests > 0
+
+    with instrument(profile=True) as results:
+        convex_hull(points, method="quickhull")
+        convex_hull(points, method="divide_and_conquer")
+    assert set(results.max_recursion_depth) == {"QuickHull", "construct_hull"}
+    assert results.as_dict()["orientation_tests"] == results.orientation_tests > 0
+    assert results.profile.total_calls > 0
+
+
+# Leaving the block puts the original functions back, and blocks cannot be nested
+def test_restores_the_originals():
+    wrapping = importlib.import_module("convex_hull_algorithms.wrapping")
+    incremental = importlib.import_module("convex_hull_algorithms.incremental")
+    originals = (wrapping.next_hull_point, incremental.orientation, incremental.orient2d_array)
+    with instrument():
+        assert wrapping.next_hull_point is not originals[0]
+        with pytest.raises(RuntimeError):
+            with instrument():
+                pass
+    assert (wrapping.next_hull_point, incremental.orientation, incremental.orient2d_array) == originals
+    with instrument() as results:
+        pass
+    assert results.as_dict()["orientation_tests"] == 0
@@ -0,0 +1,55 @@
+# Tests of the hull measures against brute force and scipy
+
+import numpy as np                              # for math calculations on arrays
+from scipy.spatial import ConvexHull            # for the reference areas and perimeters
+
+from convex_hull_algorithms import batch_hulls, batch_measures, hull_measures
+
+
+# Function to compute the measures of one hull (counterclockwise vertices) by brute force: every pair of vertices
+# for the diameter, every edge for the width and the enclosing rectangles
+def brute_force_measures(hull):
+    pairs = np.hypot(*(hull[:, None, :] - hull[None, :, :]).transpose(2, 0, 1))
+    heights, areas, perimeters = [], [], []
+    for k in range(len(hull)):
+        edge = hull[(k + 1) % len(hull)] - hull[k]
+        along = (hull - hull[k]) @ edge / np.hypot(*edge)
+        across = (hull - hull[k]) @ np.array([-edge[1], edge[0]]) / np.hypot(*edge)
+        length, height = along.max() - along.min(), across.max() - across.min()
+        heights.append(height)
+        areas.append(length * height)
+        perimeters.append(2 * (length + height))
+    return pairs.max(), min(heights), min(areas), min(perimeters)
+
+
+# Many random hulls measured at once agree with scipy and with brute force
+def test_batch_measures():
+    rng = np.random.default_rng(5)
+    sizes = rng.integers(3, 60, 200)
+    offsets = np.concatenate(([0], np.cumsum(sizes)))
+    points = rng.normal(size=(offsets[-1], 2))
+    measures = batch_measures(points, *batch_hulls(points, offsets))
+    for g, (start, end) in enumerate(zip(offsets[:-1], offsets[1:])):
+        reference = ConvexHull(points[start:end])
+        hull = reference.points[reference.vertices]
+        assert np.isclose(measures["area"][g], reference.volume)
+        assert np.isclose(measures["perimeter"][g], reference.area)
+        diameter, width, min_area, min_perimeter = brute_force_measures(hull)
+        assert np.isclose(measures["diameter"][g], diameter)
+        assert np.isclose(np.hypot(*np.subtract(*measures["diameter_pair"][g])), diameter)
+        assert np.isclose(measures["width"][g], width)
+        assert np.isclose(measures["min_area"][g], min_area)
+        assert np.isclose(measures["min_perimeter"][g], min_perimeter)
+
+
+# A square, clockwise as graham_scan returns it, with a collinear vertex on an edge; a segment; a point
+def test_degenerate_hulls():
+    square = hull_measures([[0, 0], [0, 1], [0, 2], [2, 2], [2, 0]])
+    assert square["area"] == 4 and square["perimeter"] == 8 and square["width"] == 2
+    assert np.isclose(square["diameter"], np.sqrt(8)) and np.allclose(square["centroid"], [1, 1])
+    assert np.isclose(square["min_area"], 4)
+    segment = hull_measures([[0, 0], [3, 4]])
+    assert segment["area"] == 0 and segment["diameter"] == 5 and segment["width"] == 0
+    assert np.allclose(segment["centroid"], [1.5, 2])
+    point = hull_measures([[1, 1]])
+    assert point["diameter"] == 0 and np.allclose(point["centroid"], [1, 1])
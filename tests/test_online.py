@@ -0,0 +1,53 @@
+# Tests of the online hulls against scipy
+
+import numpy as np                              # for math calculations on arrays
+from scipy.spatial import ConvexHull, Delaunay  # for the reference hulls
+
+from convex_hull_algorithms import IncrementalHull2D, IncrementalHull3D, order_hull
+
+
+# Points inserted one by one or in batches give the hull of all of them, in the order graham_scan returns it
+def test_incremental_hull_2d():
+    rng = np.random.default_rng(11)
+    points = rng.normal(size=(3000, 2))
+    one_by_one = IncrementalHull2D()
+    new_vertices = [one_by_one.insert(point) for point in points[:500]]
+    assert new_vertices[:3] == [True, True, True]
+    batches = IncrementalHull2D(points[:500])
+    for batch in np.array_split(points[500:], 7):
+        batches.insert_many(batch)
+        one_by_one.insert_many(batch)
+    expected = order_hull(points[ConvexHull(points).vertices]).tolist()
+    assert batches.vertices.tolist() == one_by_one.vertices.tolist() == expected
+    assert len(batches) == len(expected) and batches.num_of_points == one_by_one.num_of_points == 3000
+    assert not batches.insert((0.0, 0.0))
+
+
+# Containment of the hull's interior and boundary in O(log h), checked against a triangulation
+def test_contains():
+    rng = np.random.default_rng(12)
+    hull = IncrementalHull2D(rng.random((200, 2)))
+    queries = rng.random((500, 2)) * 1.2 - 0.1
+    inside = Delaunay(hull.vertices).find_simplex(queries) >= 0
+    assert [hull.contains(query) for query in queries] == inside.tolist()
+    assert all(hull.contains(vertex) for vertex in hull.vertices)
+    assert not IncrementalHull2D().contains((0, 0))
+
+
+# Sweeps of 3D points, the first ones flat: the hull waits for a tetrahedron, then its snapshots follow Qhull's hull
+def test_incremental_hull_3d():
+    rng = np.random.default_rng(19)
+    flat = np.column_stack((rng.random((50, 2)), np.zeros(50)))
+    points = np.concatenate((flat, rng.normal(size=(4000, 3))))
+    hull = IncrementalHull3D()
+    assert hull.add_points(flat[:2]) == 2 and len(hull) == 0
+    hull.add_points(flat[2:])
+    assert hull.hull is None and hull.snapshot()[1].shape == (0, 3)
+    for end in (250, 1000, 2500, len(points)):
+        hull.add_points(points[hull.num_of_points:end])
+        vertices, triangles = hull.snapshot()
+        seen = points[:end]
+        assert sorted(vertices.tolist()) == sorted(seen[ConvexHull(seen).vertices].tolist())
+        assert triangles.max() == len(vertices) - 1 and hull.snapshot()[0] is vertices
+        assert not vertices.flags.writeable
+    assert hull.num_of_points == len(points)
@@ -0,0 +1,31 @@
+# Tests of the level-of-detail headless rendering
+
+import numpy as np                              # for math calculations on arrays
+import pytest                                   # for the temporary directories
+
+from convex_hull_algorithms import QuickHull3D, convex_hull
+from convex_hull_algorithms.plotting import render_hull_2d, render_hull_3d
+
+pytest.importorskip("matplotlib")
+
+
+# Small clouds are drawn point by point with labels, large ones as a density image with the hull on top
+def test_render_2d(tmp_path):
+    rng = np.random.default_rng(20)
+    small, large = rng.random((50, 2)), rng.normal(size=(50000, 2))
+    figure = render_hull_2d(small, convex_hull(small), tmp_path / "small.png")
+    assert len(figure.axes[0].texts) == 50 and not figure.axes[0].images
+    figure = render_hull_2d(large, convex_hull(large, method="quickhull", engine="numpy"), tmp_path / "large.svg")
+    assert not figure.axes[0].texts and len(figure.axes[0].images) == 1
+    assert (tmp_path / "small.png").read_bytes().startswith(b"\x89PNG")
+    assert "<svg" in (tmp_path / "large.svg").read_text()
+
+
+# The interior points of a large 3D cloud are decimated to a sample
+def test_render_3d(tmp_path):
+    points = np.random.default_rng(21).normal(size=(20000, 3))
+    hull = QuickHull3D(points)
+    figure = render_hull_3d(points, hull, tmp_path / "hull.png", max_points=500)
+    interior = figure.axes[0].collections[0]
+    assert len(interior.get_offsets()) == 500
+    assert (tmp_path / "hull.png").stat().st_size > 0
@@ -0,0 +1,57 @@
+# Regression tests of the robust orientation predicates
+
+import numpy as np                              # for math calculations on arrays
+
+from convex_hull_algorithms import (graham_scan, jarvis_march, lexicographic_sort, merge_divide_and_conquer,
+                                    quickhull_indices)
+from convex_hull_algorithms.predicates import (INT64_SAFE_BOUND, coordinate_columns, int64_safe, orient2d,
+                                               orient2d_array, orient2d_array_int64)
+
+
+# int64 rows beyond 2**31 used to overflow in the filter's products
+def test_orient2d_large_int64():
+    a, b, c = np.array([2**40, 0]), np.array([0, 2**40]), np.array([-2**40, -2**40 + 1])
+    assert orient2d(a, b, c) == 1
+    assert orient2d(a.tolist(), b.tolist(), c.tolist()) == 1
+
+
+# integers beyond 2**53 are rounded by the float64 conversion, the determinant here is exactly -2
+def test_orient2d_beyond_float_precision():
+    big = 2**60
+    assert orient2d((0, 0), (big, big + 1), (big + 2, big + 3)) == -1
+    column = np.array([big + 2], dtype=np.int64), np.array([big + 3], dtype=np.int64)
+    assert orient2d_array(0, 0, np.int64(big), np.int64(big + 1), *column).tolist() == [-1]
+
+
+# the reference engines on int64 data in +-2**40 (graham_scan dropped vertices, jarvis_march did not terminate)
+def test_reference_engines_large_int64():
+    points = lexicographic_sort(np.random.default_rng(0).integers(-2**40, 2**40, (300, 2)))
+    graham = sorted(map(tuple, np.asarray(graham_scan(points, engine="python")).tolist()))
+    jarvis = sorted(map(tuple, np.asarray(jarvis_march(points, engine="python")).tolist()))
+    numpy_graham = sorted(map(tuple, np.asarray(graham_scan(points, engine="numpy")).tolist()))
+    assert graham == jarvis == numpy_graham
+
+
+# Integer points within the int64-safe range stay int64, their orientations are exact without any float filter,
+# and the engines on that path give the hull the robust float path gives on the same values
+def test_int64_path():
+    assert int64_safe(np.array([[INT64_SAFE_BOUND - 1, 1 - INT64_SAFE_BOUND]]))
+    assert not int64_safe(np.array([[INT64_SAFE_BOUND, 0]]))
+    assert not int64_safe(np.array([[0.5, 1.0]])) and int64_safe(np.empty((0, 2), dtype=np.int64))
+    rng = np.random.default_rng(25)
+    # nearly collinear triples whose determinants are far beyond the float64 precision
+    base = rng.integers(-2**20, 2**20, (2000, 2))
+    points = base * (INT64_SAFE_BOUND // 2**20 - 1) + rng.integers(-1, 2, (2000, 2))
+    x, y = coordinate_columns(points)
+    assert x.dtype == np.int64 and coordinate_columns(points.astype(np.float64))[0].dtype == np.float64
+    a, b, c = rng.integers(0, len(points), (3, 5000))
+    exact = orient2d_array_int64(x[a], y[a], x[b], y[b], x[c], y[c])
+    floats = (value.astype(np.float64) for value in (x[a], y[a], x[b], y[b], x[c], y[c]))
+    assert exact.tolist() == orient2d_array(*floats).tolist()
+
+    expected = quickhull_indices(points.astype(np.float64))
+    assert quickhull_indices(points).tolist() == expected.tolist()
+    hull = sorted(map(tuple, points[expected].tolist()))
+    assert sorted(map(tuple, merge_divide_and_conquer(points).tolist())) == hull
+    graham = graham_scan(lexicographic_sort(points), engine="numpy").tolist()
+    assert set(hull) <= set(map(tuple, graham))
@@ -0,0 +1,30 @@
+# Tests of the Akl-Toussaint prefilter
+
+import numpy as np                              # for math calculations on arrays
+import pytest                                   # for the direction parameters
+
+from convex_hull_algorithms import akl_toussaint, convex_hull
+
+
+# The survivors keep every hull vertex and the points on the hull's boundary; the removed ones are counted
+@pytest.mark.parametrize("directions", [4, 8, 16])
+def test_keeps_the_hull(directions):
+    rng = np.random.default_rng(8)
+    points = rng.integers(-100, 100, (20000, 2))
+    kept, removed = akl_toussaint(points, directions)
+    assert removed == len(points) - len(kept) > len(points) // 4
+    hull = convex_hull(points, method="quickhull", engine="numpy")
+    assert convex_hull(points[kept], method="quickhull", engine="numpy").tolist() == hull.tolist()
+    stats = {}
+    assert convex_hull(points, method="incremental", prefilter=directions, stats=stats).tolist() == \
+        convex_hull(points, method="incremental").tolist()
+    assert stats["prefilter_removed"] == removed
+
+
+# Small and flat inputs are kept whole, and fewer than 3 directions are rejected
+def test_degenerate_inputs():
+    assert akl_toussaint(np.zeros((3, 2)))[1] == 0
+    line = np.column_stack((np.arange(10), np.arange(10)))
+    assert akl_toussaint(line)[0].tolist() == list(range(10))
+    with pytest.raises(ValueError):
+        akl_toussaint(np.random.default_rng(0).random((10, 2)), directions=2)
@@ -0,0 +1,47 @@
+# Tests of the point-in-hull indexes
+
+import numpy as np                              # for math calculations on arrays
+from scipy.spatial import Delaunay              # for the reference 3D containment
+
+from convex_hull_algorithms import HullIndex2D, HullIndex3D, QuickHull3D, convex_hull
+from convex_hull_algorithms.predicates import orient2d_array_int64
+
+
+# Integer queries around an integer hull (many of them on its edges and vertices) are classified like the
+# brute force test against every edge of the counterclockwise polygon, one by one and in a batch
+def test_index_2d():
+    rng = np.random.default_rng(27)
+    points = rng.integers(0, 40, (300, 2))
+    index = HullIndex2D(convex_hull(points))
+    vertices = index.vertices
+    following = np.roll(vertices, -1, axis=0)
+    queries = rng.integers(-2, 42, (5000, 2))
+    sides = orient2d_array_int64(vertices[:, None, 0], vertices[:, None, 1], following[:, None, 0],
+                                 following[:, None, 1], queries[:, 0], queries[:, 1])
+    expected = np.where(sides.min(axis=0) < 0, -1, np.where(sides.min(axis=0) == 0, 0, 1))
+    assert (expected == 0).sum() > 50
+    assert index.classify_many(queries).tolist() == expected.tolist()
+    assert [index.classify(query) for query in queries[:500]] == expected[:500].tolist()
+    assert index.contains_many(queries, boundary=False).tolist() == (expected == 1).tolist()
+    assert all(tuple(vertex) in index for vertex in vertices)
+
+
+# Hulls of fewer than 3 vertices: a segment contains the points between its ends, nothing contains an empty hull
+def test_index_2d_degenerate():
+    segment = HullIndex2D([[0, 0], [2, 2], [4, 4], [1, 1]])
+    assert len(segment) == 2
+    assert segment.classify_many(np.array([[3, 3], [5, 5], [1, 2]])).tolist() == [0, -1, -1]
+    assert HullIndex2D(np.empty((0, 2))).classify((0, 0)) == -1
+
+
+# Random queries against a 3D hull agree with the simplices of a triangulation of its vertices
+def test_index_3d():
+    rng = np.random.default_rng(28)
+    points = rng.normal(size=(2000, 3))
+    hull = QuickHull3D(points)
+    index = HullIndex3D.from_hull(hull)
+    queries = rng.normal(size=(5000, 3)) * 1.5
+    expected = Delaunay(points[hull.vertices]).find_simplex(queries) >= 0
+    assert index.contains_many(queries).tolist() == expected.tolist()
+    assert all(index.classify(vertex) == 0 for vertex in points[hull.vertices[:50]])
+    assert index.contains(np.zeros(3), boundary=False)
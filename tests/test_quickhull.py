@@ -0,0 +1,55 @@
+# Regression tests of the NumPy Quickhull engines
+
+import numpy as np                              # for math calculations on arrays
+from scipy.spatial import ConvexHull            # for the reference hulls
+
+from convex_hull_algorithms import convex_hull, order_hull, parallel_quickhull_indices, quickhull_indices
+
+
+# Near-collinear floats: the float argmax picked a farthest point that the exact orientations disagreed with,
+# a candidate went to both sides of it and came back as a duplicate vertex
+def test_near_collinear_floats():
+    x = np.linspace(0, 1, 50)
+    points = np.column_stack((x, x / 3))
+    indices = quickhull_indices(points)
+    assert len(np.unique(indices)) == len(indices)
+    assert indices.tolist() == [0, 37, 38, 49, 44]
+    assert parallel_quickhull_indices(points, workers=2, cutoff=4, min_parallel_size=0).tolist() == indices.tolist()
+    assert convex_hull(points, method="quickhull", engine="numpy").tolist() == points[indices].tolist()
+
+
+# The reference engine chose its farthest point by float magnitude while splitting exactly, and kept interior points
+def test_near_collinear_floats_python_engine():
+    x = np.linspace(0, 1, 50)
+    points = np.column_stack((x, x / 3))
+    expected = sorted(map(tuple, points[[0, 37, 38, 49, 44]].tolist()))
+    assert sorted(map(tuple, convex_hull(points, method="quickhull").tolist())) == expected
+    for seed in range(10):
+        t = np.random.default_rng(seed).random(30)
+        cloud = np.column_stack((t, 0.7 * t + 0.1))
+        python = sorted(map(tuple, convex_hull(cloud, method="quickhull").tolist()))
+        assert python == sorted(map(tuple, convex_hull(cloud, method="quickhull", engine="numpy").tolist()))
+
+
+# The index-array engine returns indices into the input (repeated points included) of the hull scipy finds
+def test_indices_match_scipy():
+    rng = np.random.default_rng(7)
+    points = rng.normal(size=(5000, 2))
+    points = np.concatenate((points, points[:1000]))
+    indices = quickhull_indices(points)
+    assert len(np.unique(indices)) == len(indices)
+    assert points[indices].tolist() == order_hull(points[ConvexHull(points).vertices]).tolist()
+    assert quickhull_indices(points[:1]).tolist() == [0]
+    assert quickhull_indices(np.empty((0, 2))).tolist() == []
+
+
+# The work-stealing engine, with tasks small enough to be split across the workers, returns exactly the
+# indices of quickhull_indices, on floats, on a circle (every point a vertex) and on integers
+def test_parallel_matches_quickhull_indices():
+    rng = np.random.default_rng(26)
+    angles = rng.random(5000) * 2 * np.pi
+    for points in (rng.normal(size=(20000, 2)), np.column_stack((np.cos(angles), np.sin(angles))),
+                   rng.integers(-1000, 1000, (20000, 2))):
+        expected = quickhull_indices(points).tolist()
+        assert parallel_quickhull_indices(points, workers=3, cutoff=256, min_parallel_size=0).tolist() == expected
+    assert parallel_quickhull_indices(points[:100], workers=3).tolist() == quickhull_indices(points[:100]).tolist()
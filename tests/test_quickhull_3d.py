@@ -0,0 +1,57 @@
+# Tests of the native 3D Quick Hull against scipy
+
+import numpy as np                              # for math calculations on arrays
+import pytest                                   # for the errors
+from scipy.spatial import ConvexHull            # for the reference hulls
+
+from convex_hull_algorithms import QuickHull3D, quickhull_3d
+
+
+# Function to check that a hull's triangles are a closed surface around all the points, facing outwards
+def check_surface(hull):
+    simplices, equations, neighbors = hull.simplices, hull.equations, hull.neighbors
+    assert np.all(hull.points @ equations[:, :3].T + equations[:, 3] <= 1e-12)
+    triangles = hull.points[simplices]
+    normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    assert np.all(np.einsum("ij,ij->i", normals, equations[:, :3]) > 0)
+    # every edge is shared by exactly two triangles, which are each other's neighbours
+    assert np.all(neighbors >= 0)
+    assert all(k in neighbors[neighbors[k]] for k in range(len(simplices)))
+
+
+# Random points: the same vertices, area and volume as Qhull, whether the points come at once or in batches
+def test_matches_scipy():
+    points = np.random.default_rng(16).normal(size=(5000, 3))
+    reference = ConvexHull(points)
+    hull = quickhull_3d(points, engine="numpy")
+    assert hull.vertices.tolist() == sorted(reference.vertices.tolist())
+    assert np.isclose(hull.area, reference.area) and np.isclose(hull.volume, reference.volume)
+    check_surface(hull)
+
+    grown = QuickHull3D(points[:1000])
+    for batch in np.array_split(points[1000:], 4):
+        grown.add_points(batch)
+    # the points of a batch inside the hull are not stored, the vertices are compared by their coordinates
+    assert sorted(grown.points[grown.vertices].tolist()) == sorted(points[reference.vertices].tolist())
+    check_surface(grown)
+
+
+# Points on a sphere are all vertices; a cube with points on its faces keeps its volume
+def test_degenerate_inputs():
+    sphere = np.random.default_rng(17).normal(size=(500, 3))
+    sphere /= np.linalg.norm(sphere, axis=1)[:, None]
+    assert len(QuickHull3D(sphere).vertices) == 500
+    grid = np.random.default_rng(18).integers(0, 5, (2000, 3))
+    cube = QuickHull3D(grid)
+    assert cube.volume == pytest.approx(64) and cube.area == pytest.approx(96)
+    check_surface(cube)
+
+
+# Too few points, 2D points and unknown engines are rejected
+def test_errors():
+    with pytest.raises(ValueError):
+        QuickHull3D(np.zeros((3, 3)))
+    with pytest.raises(ValueError):
+        QuickHull3D(np.zeros((10, 2)))
+    with pytest.raises(ValueError):
+        quickhull_3d(np.zeros((10, 3)), engine="gpu")
@@ -0,0 +1,44 @@
+# Tests of the out-of-core hull of point files
+
+import numpy as np                              # for math calculations on arrays
+import pytest                                   # for the temporary directories and the errors
+from scipy.spatial import ConvexHull            # for the reference hulls
+
+from convex_hull_algorithms import chunked_hull, order_hull, read_chunks
+
+
+# The .npy, raw binary and CSV files of the same points, read in chunks, all give the hull scipy finds
+def test_file_formats(tmp_path):
+    points = np.random.default_rng(15).normal(size=(10000, 2))
+    expected = order_hull(points[ConvexHull(points).vertices]).tolist()
+    np.save(tmp_path / "points.npy", points)
+    points.tofile(tmp_path / "points.bin")
+    points.astype(np.float32).tofile(tmp_path / "points32.bin")
+    np.savetxt(tmp_path / "points.csv", points, delimiter=",", header="x,y", comments="", fmt="%.17g")
+    np.savetxt(tmp_path / "points.txt", np.column_stack((points, np.arange(len(points)))), fmt="%.17g")
+
+    stats = {}
+    assert chunked_hull(tmp_path / "points.npy", chunk_size=999, stats=stats).tolist() == expected
+    assert stats == {"points": 10000, "chunks": 11}
+    assert chunked_hull(str(tmp_path / "points.bin"), chunk_size=4096).tolist() == expected
+    assert chunked_hull(tmp_path / "points.csv", chunk_size=3000, skip_header=1).tolist() == expected
+    assert chunked_hull(tmp_path / "points.txt", chunk_size=3000, delimiter=None, columns=3).tolist() == expected
+    single = points.astype(np.float32).astype(np.float64)
+    assert chunked_hull(tmp_path / "points32.bin", dtype=np.float32).tolist() == \
+        order_hull(single[ConvexHull(single).vertices]).tolist()
+    assert chunked_hull(np.array_split(points, 5)).tolist() == expected
+
+    chunks = list(read_chunks(tmp_path / "points.npy", chunk_size=4000))
+    assert [len(chunk) for chunk in chunks] == [4000, 4000, 2000] and chunks[0].dtype == np.float64
+
+
+# Malformed files are reported
+def test_malformed_files(tmp_path):
+    (tmp_path / "bad.csv").write_text("1,2\n3,x\n")
+    with pytest.raises(ValueError):
+        chunked_hull(tmp_path / "bad.csv")
+    np.arange(5.0).tofile(tmp_path / "odd.bin")
+    with pytest.raises(ValueError):
+        chunked_hull(tmp_path / "odd.bin")
+    with pytest.raises(ValueError):
+        chunked_hull(tmp_path / "odd.bin", format="parquet")
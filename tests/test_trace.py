@@ -0,0 +1,30 @@
+# Tests of the recorded Graham's Scan traces
+
+import numpy as np                              # for math calculations on arrays
+
+from convex_hull_algorithms import Trace, graham_scan, graham_scan_trace, lexicographic_sort
+
+
+# The replayed chains end on the hull of graham_scan, frame by frame or in one go, and after a save and a load
+def test_replay(tmp_path):
+    points = lexicographic_sort(np.random.default_rng(22).random((500, 2)))
+    trace = graham_scan_trace(points)
+    hull = graham_scan(points, engine="numpy").tolist()
+    assert np.count_nonzero(trace.kinds == 0) - np.count_nonzero(trace.kinds == 1) == len(hull) + 2
+
+    replay = trace.replayer()
+    steps = trace.frame_steps(max_frames=50)
+    assert len(steps) == 50 and steps[-1] == len(trace)
+    for step in steps:
+        polygon = replay.advance(step)
+    upper, lower = replay.stacks
+    assert polygon == upper + lower
+    assert trace.points[upper[:-1] + lower[:-1]].tolist() == hull
+    # going back restarts the replay
+    assert replay.advance(3) == list(range(3))
+    assert trace.frame_steps().tolist() == list(range(1, len(trace) + 1))
+
+    trace.save(tmp_path / "trace.npz")
+    loaded = Trace.load(tmp_path / "trace.npz")
+    assert loaded.stack_names == ("upper", "lower") and len(loaded) == len(trace)
+    assert loaded.replayer().advance(len(loaded)) == polygon
@@ -0,0 +1,20 @@
+# Tests of the Jarvis march engines
+
+import numpy as np                              # for math calculations on arrays
+import pytest                                   # for the errors
+
+from convex_hull_algorithms import jarvis_march, lexicographic_sort, quickhull_indices
+
+
+# Both engines, with or without shrinking the candidates, give the strict hull (the farthest of collinear
+# candidates), like the exact quickhull, on floats and on integer grids full of collinear points
+def test_engines_agree():
+    rng = np.random.default_rng(24)
+    for points in (rng.normal(size=(2000, 2)), rng.integers(0, 20, (2000, 2)), rng.integers(0, 3, (50, 2))):
+        points = lexicographic_sort(points)
+        expected = points[quickhull_indices(points)].tolist()
+        assert np.asarray(jarvis_march(points)).tolist() == expected
+        assert jarvis_march(points, engine="numpy").tolist() == expected
+        assert jarvis_march(points, engine="numpy", shrink=False).tolist() == expected
+    with pytest.raises(ValueError):
+        jarvis_march(points, engine="gpu")